@@ -8,10 +8,8 @@ from nfl_core.stats import (
     get_player_season_stats, 
     calculate_defense_rankings, 
     get_player_position,
-    get_red_zone_stats,
-    get_opening_drive_stats,
+    get_situational_stats,
     calculate_kelly_criterion,
-    get_team_red_zone_splits,
     identify_funnel_defenses
 )
 from odds import get_odds_api_event_ids_for_season, fetch_odds_data
@@ -125,9 +123,10 @@ def view_weekly_schedule(season: int, schedule_df: pl.DataFrame, first_td_map: d
         
         # Calculate RZ and OD Stats
         print("Calculating Red Zone & Opening Drive Stats...")
-        rz_stats = get_red_zone_stats(pbp_df, roster_df)
-        od_stats = get_opening_drive_stats(pbp_df, roster_df)
-        team_rz_splits = get_team_red_zone_splits(pbp_df)
+        situational_stats = get_situational_stats(pbp_df, roster_df)
+        rz_stats = situational_stats['rz_stats']
+        od_stats = situational_stats['od_stats']
+        team_rz_splits = situational_stats['team_rz_splits']
         
         for game_row in upcoming_games_df.to_dicts():
             nfl_game_id = game_row['game_id']
@@ -576,9 +575,10 @@ def view_current_week_odds(schedule_df: pl.DataFrame, first_td_map: dict, roster
         
         # Calculate RZ and OD Stats
         print("Calculating Red Zone & Opening Drive Stats...")
-        rz_stats = get_red_zone_stats(pbp_df, roster_df)
-        od_stats = get_opening_drive_stats(pbp_df, roster_df)
-        team_rz_splits = get_team_red_zone_splits(pbp_df)
+        situational_stats = get_situational_stats(pbp_df, roster_df)
+        rz_stats = situational_stats['rz_stats']
+        od_stats = situational_stats['od_stats']
+        team_rz_splits = situational_stats['team_rz_splits']
         
         display_odds(data, interactive=True, 
                      player_stats=player_stats,
@@ -621,9 +621,10 @@ def view_best_bets_scanner(schedule_df: pl.DataFrame, first_td_map: dict, roster
     player_stats = get_player_season_stats(schedule_df, first_td_map, last_n_games=5) # Default to last 5 for scanner
     
     print("Calculating Red Zone & Opening Drive Stats...")
-    rz_stats = get_red_zone_stats(pbp_df, roster_df)
-    od_stats = get_opening_drive_stats(pbp_df, roster_df)
-    team_rz_splits = get_team_red_zone_splits(pbp_df)
+    situational_stats = get_situational_stats(pbp_df, roster_df)
+    rz_stats = situational_stats['rz_stats']
+    od_stats = situational_stats['od_stats']
+    team_rz_splits = situational_stats['team_rz_splits']
     
     print("Calculating Defense Rankings...")
     defense_rankings = calculate_defense_rankings(schedule_df, first_td_map, roster_df)
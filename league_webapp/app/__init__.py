@@ -54,6 +54,10 @@ def create_app(config_name=None):
     from . import auth
     app.register_blueprint(auth.auth_bp)
     
+    # Background jobs (grading runs off the request thread)
+    from .services.job_runner import job_runner
+    job_runner.init_app(app)
+    
     # Set up performance monitoring
     setup_monitoring(app)
     
@@ -13,6 +13,7 @@ from . import picks
 from . import games
 from . import analysis
 from . import admin
+from . import jobs
 
 # Export the blueprint
 __all__ = ['api_bp']
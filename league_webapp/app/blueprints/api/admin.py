@@ -2,19 +2,24 @@
 Admin API endpoints - Dashboard stats, grading, admin operations
 """
 from flask import request, jsonify
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from marshmallow import ValidationError
+import codecs
 import csv
-import io
 from . import api_bp
 from ...models import User, Game, Pick as PickModel
 from ... import db
 from ...validators import GradeWeekSchema
+from ...services import AliasService
+from .jobs import job_accepted_response, wants_async
 
 
 @api_bp.route('/grade-week', methods=['POST'])
 def grade_week():
     data = request.get_json()
+    run_async = wants_async()
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k != 'async'}
     
     # Validate input
     schema = GradeWeekSchema()
@@ -27,10 +32,16 @@ def grade_week():
     season = validated_data['season']
     
     try:
-        from ...services.grading_service import GradingService
+        from ...services.grading_service import GradingService, grading_lock, submit_grading_job
+        
+        if run_async:
+            job, created = submit_grading_job(
+                'grade_week', week, season, description=f'Grade week {week} ({season})'
+            )
+            return job_accepted_response(job, created)
         
-        grading_service = GradingService()
-        result = grading_service.grade_week(week, season)
+        with grading_lock(season):
+            result = GradingService().grade_week(week, season)
         
         if not result['success']:
             return jsonify({'error': result['error']}), 400
@@ -72,10 +83,16 @@ def grade_by_type():
         return jsonify({'error': 'pick_type must be "FTD" or "ATTS"'}), 400
     
     try:
-        from ...services.grading_service import GradingService
+        from ...services.grading_service import GradingService, grading_lock, submit_grading_job
+        
+        if wants_async():
+            job, created = submit_grading_job(
+                'grade_by_pick_type', pick_type, season, description=f'Grade {pick_type} picks ({season})'
+            )
+            return job_accepted_response(job, created)
         
-        grading_service = GradingService()
-        result = grading_service.grade_by_pick_type(pick_type, season)
+        with grading_lock(season):
+            result = GradingService().grade_by_pick_type(pick_type, season)
         
         if not result['success']:
             return jsonify({'error': result.get('error', 'Failed to grade picks')}), 400
@@ -193,9 +210,122 @@ def get_dashboard_stats():
         return jsonify({'error': str(e)}), 500
 
 
+def _parse_import_rows(csv_reader, errors):
+    """
+    Validate CSV rows into pick fields, appending (row_num, 'Row N: ...') to errors.
+    Returns a list of (row_num, fields) for the rows that passed.
+    """
+    parsed = []
+    for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
+        try:
+            # Extract and validate data
+            user_id = int(row.get('user_id', 0))
+            game_id = int(row.get('game_id', 0))
+            pick_type = row.get('pick_type', '').strip().upper()
+            player_name = row.get('player_name', '').strip()
+            odds_str = row.get('odds', '').strip()
+            stake_str = row.get('stake', '1.00').strip()
+            
+            # Validate required fields
+            if not user_id or not game_id or not pick_type or not player_name:
+                errors.append((row_num, f"Row {row_num}: Missing required fields"))
+                continue
+            
+            # Validate pick type
+            if pick_type not in ['FTD', 'ATTS']:
+                errors.append((row_num, f"Row {row_num}: Invalid pick_type '{pick_type}', must be FTD or ATTS"))
+                continue
+            
+            # Parse odds (remove + sign if present)
+            odds_str = odds_str.replace('+', '')
+            try:
+                odds = int(odds_str)
+            except ValueError:
+                errors.append((row_num, f"Row {row_num}: Invalid odds '{odds_str}'"))
+                continue
+            
+            # Parse stake
+            try:
+                stake = float(stake_str)
+            except ValueError:
+                errors.append((row_num, f"Row {row_num}: Invalid stake '{stake_str}'"))
+                continue
+            
+            parsed.append((row_num, {
+                'user_id': user_id,
+                'game_id': game_id,
+                'pick_type': pick_type,
+                'player_name': player_name,
+                'player_position': 'UNK',
+                'player_gsis_id': None,
+                'odds': odds,
+                'stake': stake,
+                'result': 'Pending',
+                'payout': 0.0
+            }))
+        except Exception as e:
+            errors.append((row_num, f"Row {row_num}: {str(e)}"))
+    return parsed
+
+
+def _resolve_import_players(picks_by_game):
+    """
+    Fill player_position and player_gsis_id for imported pick rows by batch matching
+    each game's pick names against the two teams' rostered players (from the
+    season's cached roster candidates), applying reviewed player aliases first.
+    Picks keep 'UNK' (and no gsis_id) when no auto-accepted match is found.
+    """
+    from ...roster_candidates import get_roster_candidates
+    
+    aliases = AliasService()
+    rosters = {}
+    
+    for game, picks in picks_by_game.values():
+        if game.season not in rosters:
+            try:
+                rosters[game.season] = get_roster_candidates(game.season)
+            except Exception:
+                rosters[game.season] = None  # don't retry an unavailable season per game
+        if rosters[game.season] is None:
+            continue
+        
+        try:
+            candidates = rosters[game.season].for_game(game.home_team, game.away_team)
+            if candidates is None:
+                continue
+            
+            if not candidates.full_name_index.names:
+                continue
+            
+            matches = aliases.batch_match(
+                [pick['player_name'] for pick in picks], candidates.full_name_index, min_score=0.70,
+                scorer_ids=candidates.id_names
+            )
+        except Exception:
+            continue
+        
+        for pick in picks:
+            match_result = matches.get(pick['player_name'])
+            if not match_result or not match_result['auto_accept']:
+                continue
+            player = candidates.player(match_result['matched_name'])
+            pick['player_gsis_id'] = match_result.get('gsis_id') or player['gsis_id'] or None
+            position = player['position']
+            if position in ['QB', 'RB', 'WR', 'TE']:
+                pick['player_position'] = position
+            elif position in ['FB', 'HB']:
+                pick['player_position'] = 'RB'
+
+
 @api_bp.route('/import-picks', methods=['POST'])
 def import_picks():
-    """Import picks from CSV file"""
+    """
+    Import picks from CSV file
+    
+    Rows are parsed and validated first; users, games and existing picks are then
+    loaded with one query each, player positions are matched in one batch per game,
+    and the new picks are written with a single bulk INSERT.
+    """
     try:
         if 'file' not in request.files:
             return jsonify({'error': 'No file provided'}), 400
@@ -208,137 +338,70 @@ def import_picks():
         if not file.filename.endswith('.csv'):
             return jsonify({'error': 'File must be a CSV'}), 400
         
-        # Read CSV file
-        stream = io.StringIO(file.stream.read().decode("UTF8"), newline=None)
-        csv_reader = csv.DictReader(stream)
+        # Read CSV file line by line (decoding as it goes, without loading it whole)
+        csv_reader = csv.DictReader(codecs.iterdecode(file.stream, 'utf-8'))
         
         imported_count = 0
         skipped_count = 0
-        errors = []
-        
-        for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 to account for header
-            try:
-                # Extract and validate data
-                user_id = int(row.get('user_id', 0))
-                game_id = int(row.get('game_id', 0))
-                pick_type = row.get('pick_type', '').strip().upper()
-                player_name = row.get('player_name', '').strip()
-                odds_str = row.get('odds', '').strip()
-                stake_str = row.get('stake', '1.00').strip()
-                
-                # Validate required fields
-                if not user_id or not game_id or not pick_type or not player_name:
-                    errors.append(f"Row {row_num}: Missing required fields")
-                    continue
-                
-                # Validate pick type
-                if pick_type not in ['FTD', 'ATTS']:
-                    errors.append(f"Row {row_num}: Invalid pick_type '{pick_type}', must be FTD or ATTS")
-                    continue
-                
-                # Parse odds (remove + sign if present)
-                odds_str = odds_str.replace('+', '')
-                try:
-                    odds = int(odds_str)
-                except ValueError:
-                    errors.append(f"Row {row_num}: Invalid odds '{odds_str}'")
-                    continue
-                
-                # Parse stake
-                try:
-                    stake = float(stake_str)
-                except ValueError:
-                    errors.append(f"Row {row_num}: Invalid stake '{stake_str}'")
-                    continue
-                
-                # Check if user exists
-                user = User.query.get(user_id)
-                if not user:
-                    errors.append(f"Row {row_num}: User ID {user_id} not found")
-                    continue
-                
-                # Check if game exists
-                game = Game.query.get(game_id)
-                if not game:
-                    errors.append(f"Row {row_num}: Game ID {game_id} not found")
-                    continue
-                
-                # Check for duplicate pick
-                existing_pick = PickModel.query.filter_by(
-                    user_id=user_id,
-                    game_id=game_id,
-                    pick_type=pick_type
-                ).first()
-                
-                if existing_pick:
-                    skipped_count += 1
-                    continue
-                
-                # Auto-detect player position
-                from ...fuzzy_matcher import NameMatcher
-                from ...data_loader import load_data_with_cache_web
-                
-                try:
-                    _, _, roster_df = load_data_with_cache_web(game.season, use_cache=True)
-                    game_rosters = roster_df.filter(
-                        (roster_df['team'] == game.home_team) | 
-                        (roster_df['team'] == game.away_team)
-                    )
-                    
-                    if len(game_rosters) > 0:
-                        players = game_rosters.select(['player_name', 'position']).to_dicts()
-                        player_names = [p['player_name'] for p in players]
-                        
-                        matcher = NameMatcher()
-                        match_result = matcher.find_best_match(player_name, player_names, min_score=0.70)
-                        
-                        if match_result and match_result['auto_accept']:
-                            matched_player = next((p for p in players if p['player_name'] == match_result['matched_name']), None)
-                            if matched_player and matched_player['position']:
-                                position = matched_player['position']
-                                if position in ['QB', 'RB', 'WR', 'TE']:
-                                    player_position = position
-                                elif position in ['FB', 'HB']:
-                                    player_position = 'RB'
-                                else:
-                                    player_position = 'UNK'
-                            else:
-                                player_position = 'UNK'
-                        else:
-                            player_position = 'UNK'
-                    else:
-                        player_position = 'UNK'
-                except Exception:
-                    player_position = 'UNK'
-                
-                # Create new pick
-                new_pick = PickModel(
-                    user_id=user_id,
-                    game_id=game_id,
-                    pick_type=pick_type,
-                    player_name=player_name,
-                    player_position=player_position,
-                    odds=odds,
-                    stake=stake,
-                    result='Pending',
-                    payout=0.0
+        errors = []  # (row_num, message), reported in row order
+        rows = _parse_import_rows(csv_reader, errors)
+        
+        # Prefetch the referenced users, games and already-submitted picks
+        user_ids = {fields['user_id'] for _, fields in rows}
+        game_ids = {fields['game_id'] for _, fields in rows}
+        known_users = set()
+        games = {}
+        existing_keys = set()
+        if rows:
+            known_users = {user_id for (user_id,) in db.session.query(User.id).filter(User.id.in_(user_ids))}
+            games = {game.id: game for game in Game.query.filter(Game.id.in_(game_ids))}
+            existing_keys = set(
+                db.session.query(PickModel.user_id, PickModel.game_id, PickModel.pick_type).filter(
+                    PickModel.user_id.in_(known_users),
+                    PickModel.game_id.in_(list(games))
                 )
-                
-                db.session.add(new_pick)
-                imported_count += 1
-                
-            except Exception as e:
-                errors.append(f"Row {row_num}: {str(e)}")
+            )
+        
+        new_picks = []
+        # New picks per game, so positions are matched in one batch per game
+        picks_by_game = {}
+        
+        for row_num, fields in rows:
+            # Check if user exists
+            if fields['user_id'] not in known_users:
+                errors.append((row_num, f"Row {row_num}: User ID {fields['user_id']} not found"))
+                continue
+            
+            # Check if game exists
+            game = games.get(fields['game_id'])
+            if not game:
+                errors.append((row_num, f"Row {row_num}: Game ID {fields['game_id']} not found"))
+                continue
+            
+            # Check for duplicate pick (already stored, or earlier in this file)
+            key = (fields['user_id'], fields['game_id'], fields['pick_type'])
+            if key in existing_keys:
+                skipped_count += 1
                 continue
+            existing_keys.add(key)
+            
+            new_picks.append(fields)
+            picks_by_game.setdefault(game.id, (game, []))[1].append(fields)
+            imported_count += 1
         
-        # Commit all picks
+        # Auto-detect player positions and roster IDs
+        _resolve_import_players(picks_by_game)
+        
+        # Insert and commit all picks
+        if new_picks:
+            db.session.execute(insert(PickModel), new_picks)
         db.session.commit()
         
         return jsonify({
             'message': f'Successfully imported {imported_count} picks',
             'imported_count': imported_count,
             'skipped_count': skipped_count,
-            'errors': errors
+            'errors': [message for _, message in sorted(errors)]
         }), 200
         
     except Exception as e:
@@ -348,14 +411,26 @@ def import_picks():
 
 @api_bp.route('/regrade-all', methods=['POST'])
 def regrade_all():
-    """Re-grade all picks for the entire season"""
+    """Re-grade all picks for the entire season (?incremental=1 grades only what changed)"""
     season = request.args.get('season', 2025, type=int)
+    incremental = request.args.get('incremental', '').lower() in ('1', 'true', 'yes')
     
     try:
-        from ...services.grading_service import GradingService
+        from ...services.grading_service import GradingService, grading_lock, submit_grading_job
         
-        grading_service = GradingService()
-        result = grading_service.grade_all_weeks(season)
+        if wants_async():
+            if incremental:
+                job, created = submit_grading_job(
+                    'grade_incremental', season, description=f'Incremental grading ({season})'
+                )
+            else:
+                job, created = submit_grading_job(
+                    'grade_all_weeks', season, description=f'Re-grade all weeks ({season})'
+                )
+            return job_accepted_response(job, created)
+        
+        with grading_lock(season):
+            result = GradingService().grade_all_weeks(season, incremental=incremental)
         
         if not result['success']:
             return jsonify({'error': result['error']}), 400
@@ -363,6 +438,7 @@ def regrade_all():
         return jsonify({
             'message': f"Successfully re-graded all picks for {season} season",
             'season': result['season'],
+            'mode': result.get('mode', 'full'),
             'weeks_graded': result['weeks_graded'],
             'games_graded': result['games_graded'],
             'total_graded': result['total_graded'],
@@ -468,6 +544,9 @@ def review_match(decision_id):
         match_decision.review_decision = decision
         # Note: reviewed_by would need user authentication to set properly
         
+        # Remember the decision so this pick name is not fuzzy matched to this player again
+        AliasService.record_review(match_decision, approved=(decision == 'accept'))
+        
         # Update pick based on decision
         if decision == 'accept':
             # Match accepted - mark as win
@@ -494,6 +573,28 @@ def review_match(decision_id):
         return jsonify({'error': str(e)}), 500
 
 
+@api_bp.route('/admin/score-memo', methods=['DELETE'])
+def clear_score_memo():
+    """Delete stored match scores (?stale_only=1 keeps the current scorer version's)"""
+    stale_only = request.args.get('stale_only', '').lower() in ('1', 'true', 'yes')
+    
+    try:
+        from ...services.grading_service import GradingService
+        
+        deleted_count = GradingService.clear_score_memo(stale_only=stale_only)
+        db.session.commit()
+        
+        return jsonify({
+            'message': f'Deleted {deleted_count} stored match scores',
+            'deleted_count': deleted_count,
+            'stale_only': stale_only
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+
 @api_bp.route('/delete-all-picks', methods=['DELETE'])
 def delete_all_picks():
     """Delete all picks for a specific season"""
@@ -5,20 +5,22 @@ from flask import request, jsonify
 from datetime import datetime
 from marshmallow import ValidationError
 from . import api_bp
+from ... import db
 from ...data_loader import load_data_with_cache_web
 from ...routes import get_nfl_stats_data
 from ...odds_fetcher import get_odds_api_event_ids_for_season, fetch_odds_data, get_best_odds_for_game
 from ...validators import ImportDataSchema
+from ...services import ScheduleService
 from nfl_core.stats import (
     get_first_td_scorers, 
     get_player_season_stats, 
     calculate_defense_rankings,
-    get_red_zone_stats,
-    get_opening_drive_stats,
+    get_situational_stats,
     identify_funnel_defenses,
     calculate_fair_odds,
     calculate_kelly_criterion
 )
+from nfl_core.players import get_player_index
 from nfl_core.config import API_KEY
 import polars as pl
 
@@ -47,19 +49,16 @@ def get_analysis():
         od_stats = stats_data['od_stats']
         team_rz_splits = stats_data['team_rz_splits']
         funnel_defenses = stats_data['funnel_defenses']
+        player_index = get_player_index(roster_df)
         
         # Build player database
         for player_name in player_stats_full.keys():
             stats_full = player_stats_full[player_name]
             stats_recent = player_stats_recent.get(player_name, {'first_tds': 0, 'team_games': 0})
             player_id = stats_full.get('player_id', '')
-            position = None
-            team = None
-            if roster_df is not None and roster_df.height > 0:
-                player_rows = roster_df.filter((roster_df['gsis_id'] == player_id) | (roster_df['full_name'].str.to_lowercase() == player_name.lower()))
-                if player_rows.height > 0:
-                    team = player_rows[0, 'team'] if 'team' in player_rows.columns else None
-                    position = player_rows[0, 'position'] if 'position' in player_rows.columns else None
+            roster_entry = player_index.lookup(player_id, player_name)
+            team = roster_entry['team'] if roster_entry else None
+            position = roster_entry['position'] if roster_entry else None
             
             # Get RZ and OD stats
             rz_info = rz_stats.get(player_name, {})
@@ -169,16 +168,7 @@ def get_analysis():
             else: continue
             
             # Get position
-            pos = 'Other'
-            if roster_df is not None and roster_df.height > 0:
-                if player_id:
-                    player_rows = roster_df.filter(roster_df['gsis_id'] == player_id)
-                    if player_rows.height > 0 and 'position' in player_rows.columns:
-                        pos = player_rows[0, 'position'] or 'Other'
-                if pos == 'Other' and player_name:
-                    player_rows = roster_df.filter(roster_df['full_name'].str.to_lowercase() == player_name.lower())
-                    if player_rows.height > 0 and 'position' in player_rows.columns:
-                        pos = player_rows[0, 'position'] or 'Other'
+            pos = player_index.position(player_id, None, default=None) or player_index.position(None, player_name, default=None) or 'Other'
             
             if pos not in ['WR', 'RB', 'TE', 'QB']: pos = 'Other'
             
@@ -208,13 +198,9 @@ def get_analysis():
         hot_players = []
         for player_name, stats_recent in player_stats_recent.items():
             if stats_recent.get('first_tds', 0) >= 2 and stats_recent.get('team_games', 0) >= 3:
-                position = None
-                team = None
-                if roster_df is not None and roster_df.height > 0:
-                    player_rows = roster_df.filter(roster_df['full_name'].str.to_lowercase() == player_name.lower())
-                    if player_rows.height > 0:
-                        team = player_rows[0, 'team'] if 'team' in player_rows.columns else None
-                        position = player_rows[0, 'position'] if 'position' in player_rows.columns else None
+                roster_entry = player_index.find_by_name(player_name)
+                team = roster_entry['team'] if roster_entry else None
+                position = roster_entry['position'] if roster_entry else None
                 
                 hot_players.append({
                     'name': player_name,
@@ -290,17 +276,8 @@ def get_analysis():
                         pass
                 
                 # Get position from roster
-                position = None
                 player_id = ftd_info.get('player_id')
-                if roster_df is not None and roster_df.height > 0:
-                    if player_id:
-                        player_rows = roster_df.filter(roster_df['gsis_id'] == player_id)
-                        if player_rows.height > 0:
-                            position = player_rows[0, 'position'] if 'position' in player_rows.columns else None
-                    if not position and player:
-                        player_rows = roster_df.filter(roster_df['full_name'].str.to_lowercase() == player.lower())
-                        if player_rows.height > 0:
-                            position = player_rows[0, 'position'] if 'position' in player_rows.columns else None
+                position = player_index.position(player_id, None, default=None) or player_index.position(None, player, default=None)
                 
                 history_results.append({
                     'season': season,
@@ -350,72 +327,7 @@ def import_data():
         schedule_df, pbp_df, roster_df = load_data_with_cache_web(season, use_cache=False)
         
         # Import games into database
-        from ...models import Game
-        from ... import db
-        from datetime import datetime
-        
-        games_added = 0
-        games_updated = 0
-        
-        for game_dict in schedule_df.to_dicts():
-            game_id = game_dict.get('game_id')
-            if not game_id:
-                continue
-            
-            # Check if game exists
-            existing_game = Game.query.filter_by(game_id=game_id).first()
-            
-            # Parse date and time
-            gameday_str = game_dict.get('gameday', '')
-            gametime_str = game_dict.get('gametime', '')
-            
-            try:
-                game_date = datetime.strptime(str(gameday_str), '%Y-%m-%d').date() if gameday_str else None
-            except:
-                game_date = None
-            
-            try:
-                game_time = datetime.strptime(str(gametime_str), '%H:%M').time() if gametime_str and ':' in str(gametime_str) else None
-            except:
-                game_time = None
-            
-            # Determine if standalone
-            is_standalone = False
-            if game_date:
-                day_of_week = game_date.weekday()  # 0=Monday, 6=Sunday
-                if day_of_week != 6:  # Not Sunday
-                    is_standalone = True
-                elif day_of_week == 6 and game_time:  # Sunday
-                    # SNF starts at 20:00 or later
-                    if game_time.hour >= 20:
-                        is_standalone = True
-            
-            if existing_game:
-                # Update existing game
-                existing_game.season = game_dict.get('season', season)
-                existing_game.week = game_dict.get('week')
-                existing_game.gameday = game_dict.get('gameday')
-                existing_game.game_date = game_date
-                existing_game.game_time = game_time
-                existing_game.home_team = game_dict.get('home_team')
-                existing_game.away_team = game_dict.get('away_team')
-                existing_game.is_standalone = is_standalone
-                games_updated += 1
-            else:
-                # Create new game
-                new_game = Game(
-                    game_id=game_id,
-                    season=game_dict.get('season', season),
-                    week=game_dict.get('week'),
-                    gameday=game_dict.get('gameday'),
-                    game_date=game_date,
-                    game_time=game_time,
-                    home_team=game_dict.get('home_team'),
-                    away_team=game_dict.get('away_team'),
-                    is_standalone=is_standalone
-                )
-                db.session.add(new_game)
-                games_added += 1
+        games_added, games_updated = ScheduleService.sync_games(schedule_df, season)
         
         db.session.commit()
         
@@ -450,12 +362,14 @@ def get_best_bets():
             current_week = 1
         
         week_games = schedule_df.filter(pl.col("week").cast(pl.Int64) == current_week)
+        player_index = get_player_index(roster_df)
         first_td_map = get_first_td_scorers(pbp_df, target_game_ids=None, roster_df=roster_df)
         player_stats = get_player_season_stats(schedule_df, first_td_map, last_n_games=5)
-        defense_rankings = calculate_defense_rankings(schedule_df, first_td_map, roster_df)
+        defense_rankings = calculate_defense_rankings(schedule_df, first_td_map, player_index)
         funnel_defenses = identify_funnel_defenses(defense_rankings) or {}
-        rz_stats = get_red_zone_stats(pbp_df, roster_df) or {}
-        od_stats = get_opening_drive_stats(pbp_df, roster_df) or {}
+        situational_stats = get_situational_stats(pbp_df, player_index)
+        rz_stats = situational_stats['rz_stats']
+        od_stats = situational_stats['od_stats']
         
         odds_event_map = get_odds_api_event_ids_for_season(schedule_df, API_KEY)
         all_bets = []
@@ -481,15 +395,9 @@ def get_best_bets():
                 if prob < 0.01:
                     continue
                 
-                position = None
-                team = None
-                if roster_df is not None:
-                    player_rows = roster_df.filter(
-                        roster_df['full_name'].str.to_lowercase() == player_name.lower()
-                    )
-                    if player_rows.height > 0:
-                        team = player_rows[0, 'team']
-                        position = player_rows[0, 'position']
+                roster_entry = player_index.find_by_name(player_name)
+                team = roster_entry['team'] if roster_entry else None
+                position = roster_entry['position'] if roster_entry else None
                 
                 if team not in [home_team, away_team]:
                     continue
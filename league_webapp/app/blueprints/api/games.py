@@ -4,9 +4,10 @@ Games API endpoints - View games, weekly games, week details
 from flask import request, jsonify
 from datetime import datetime
 from . import api_bp
-from ...data_loader import load_data_with_cache_web, get_current_nfl_week
+from ...data_loader import load_data_with_cache_web, get_current_nfl_week, get_game_touchdown_index
 from ...models import User, Game, Pick as PickModel
 from ... import db
+from ...services import WeekDetailService
 from nfl_core.stats import get_first_td_scorers
 import polars as pl
 
@@ -70,74 +71,8 @@ def get_game_touchdowns(game_id):
     """Get all touchdown scorers for a specific game in order"""
     season = request.args.get('season', 2025, type=int)
     try:
-        schedule_df, pbp_df, roster_df = load_data_with_cache_web(season, use_cache=True)
-        
-        # Filter PBP data for this specific game
-        if pbp_df.height == 0:
-            return jsonify({'touchdowns': [], 'game_id': game_id}), 200
-        
-        game_pbp = pbp_df.filter(pl.col('game_id') == game_id)
-        
-        if game_pbp.height == 0:
-            return jsonify({'touchdowns': [], 'game_id': game_id}), 200
-        
-        # Get touchdown plays sorted by play_id
-        td_plays = game_pbp.filter(
-            (pl.col('touchdown') == 1) | 
-            (pl.col('td_player_name').is_not_null())
-        )
-        
-        if td_plays.height == 0:
-            return jsonify({'touchdowns': [], 'game_id': game_id}), 200
-        
-        # Sort by play_id or time
-        if 'play_id' in td_plays.columns:
-            td_plays = td_plays.sort('play_id')
-        else:
-            td_plays = td_plays.sort(['qtr', 'time'])
-        
-        # Create a mapping from ID to Full Name
-        id_to_name = {}
-        if roster_df is not None and 'gsis_id' in roster_df.columns and 'full_name' in roster_df.columns:
-            temp_df = roster_df.select(['gsis_id', 'full_name', 'position']).unique()
-            for r in temp_df.to_dicts():
-                if r['gsis_id'] and r['full_name']:
-                    id_to_name[r['gsis_id']] = {
-                        'name': r['full_name'],
-                        'position': r.get('position')
-                    }
-        
-        touchdowns = []
-        for idx, row in enumerate(td_plays.to_dicts()):
-            scorer = None
-            player_id = row.get('td_player_id')
-            team = row.get('td_team') or row.get('posteam') or 'UNK'
-            position = None
-            
-            # Try roster lookup
-            if player_id and player_id in id_to_name:
-                scorer = id_to_name[player_id]['name']
-                position = id_to_name[player_id]['position']
-            
-            # Try PBP columns if no roster match
-            if not scorer:
-                for key in ['fantasy_player_name', 'player_name', 'td_player_name', 'desc', 'description']:
-                    if key in row and row.get(key):
-                        scorer = str(row.get(key))
-                        if key in ['desc', 'description'] and ' for ' in scorer:
-                            scorer = scorer.split(' for ')[0].strip()
-                        break
-            
-            if scorer:
-                touchdowns.append({
-                    'order': idx + 1,
-                    'player': scorer,
-                    'team': team,
-                    'position': position,
-                    'quarter': row.get('qtr'),
-                    'time': row.get('time'),
-                    'is_first_td': idx == 0
-                })
+        # Precomputed per season; one game's touchdowns are a slice of the table
+        touchdowns = get_game_touchdown_index(season).touchdowns(game_id)
         
         return jsonify({
             'touchdowns': touchdowns,
@@ -157,91 +92,8 @@ def get_week_detail():
         return jsonify({'error': 'Week parameter is required'}), 400
     
     try:
-        games = Game.query.filter_by(
-            week=week, 
-            season=season
-        ).order_by(Game.game_date, Game.game_time).all()
-        
-        if not games:
-            return jsonify({
-                'games': [],
-                'week': week,
-                'season': season,
-                'available_weeks': [],
-                'message': 'No games found for this week'
-            }), 200
-        
-        games_data = []
-        for game in games:
-            ftd_picks = PickModel.query.filter_by(
-                game_id=game.id, 
-                pick_type='FTD'
-            ).join(User).order_by(User.username).all()
-            
-            atts_picks = PickModel.query.filter_by(
-                game_id=game.id,
-                pick_type='ATTS'
-            ).join(User).order_by(User.username).all()
-            
-            ftd_picks_data = []
-            for pick in ftd_picks:
-                ftd_picks_data.append({
-                    'id': pick.id,
-                    'user_id': pick.user_id,
-                    'username': pick.user.username,
-                    'player_name': pick.player_name,
-                    'player_position': pick.player_position,
-                    'odds': pick.odds,
-                    'stake': float(pick.stake),
-                    'result': pick.result,
-                    'payout': float(pick.payout) if pick.payout else 0.0,
-                    'graded_at': pick.graded_at.isoformat() if pick.graded_at else None
-                })
-            
-            atts_picks_data = []
-            for pick in atts_picks:
-                atts_picks_data.append({
-                    'id': pick.id,
-                    'user_id': pick.user_id,
-                    'username': pick.user.username,
-                    'player_name': pick.player_name,
-                    'player_position': pick.player_position,
-                    'odds': pick.odds,
-                    'stake': float(pick.stake),
-                    'result': pick.result,
-                    'payout': float(pick.payout) if pick.payout else 0.0,
-                    'graded_at': pick.graded_at.isoformat() if pick.graded_at else None
-                })
-            
-            games_data.append({
-                'game_id': game.game_id,
-                'db_id': game.id,
-                'week': game.week,
-                'matchup': f"{game.away_team} @ {game.home_team}",
-                'home_team': game.home_team,
-                'away_team': game.away_team,
-                'game_date': game.game_date.isoformat() if game.game_date else None,
-                'game_time': game.game_time.strftime('%H:%M:%S') if game.game_time else None,
-                'is_final': game.is_final,
-                'home_score': None,
-                'away_score': None,
-                'actual_first_td_player': game.actual_first_td_player,
-                'ftd_picks': ftd_picks_data,
-                'atts_picks': atts_picks_data,
-                'total_picks': len(ftd_picks_data) + len(atts_picks_data)
-            })
-        
-        all_weeks = db.session.query(Game.week).filter_by(
-            season=season
-        ).distinct().order_by(Game.week).all()
-        available_weeks = [w[0] for w in all_weeks]
-        
-        return jsonify({
-            'games': games_data,
-            'week': week,
-            'season': season,
-            'available_weeks': available_weeks
-        }), 200
+        # Cached per (season, week); dropped when a pick or game in the week changes
+        return jsonify(WeekDetailService.get_week_detail(season, week)), 200
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -0,0 +1,43 @@
+"""
+Jobs API endpoints - Status and progress of background jobs (grading)
+"""
+from flask import request, jsonify, url_for
+from . import api_bp
+from ...services.job_runner import job_runner
+
+
+def job_accepted_response(job, created):
+    """202 response pointing at the status endpoint for a submitted job"""
+    return jsonify({
+        'message': 'Job queued' if created else 'An identical job is already in progress',
+        'job_id': job.id,
+        'status': job.status,
+        'deduplicated': not created,
+        'status_url': url_for('api.get_job', job_id=job.id)
+    }), 202
+
+
+def wants_async():
+    """True when the caller asked for a background job (?async=1 or {"async": true})"""
+    if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+        return True
+    data = request.get_json(silent=True)
+    return isinstance(data, dict) and data.get('async') is True
+
+
+@api_bp.route('/jobs', methods=['GET'])
+def list_jobs():
+    """List recent background jobs, newest first"""
+    status = request.args.get('status')
+    return jsonify({
+        'jobs': [job.to_dict() for job in job_runner.list_jobs(status=status)]
+    }), 200
+
+
+@api_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get status, progress and (once finished) the result of a background job"""
+    job = job_runner.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.to_dict()), 200
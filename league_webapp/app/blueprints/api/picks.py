@@ -7,8 +7,8 @@ from . import api_bp
 from ...models import User, Game, Pick as PickModel
 from ... import db
 from ...validators import PickCreateSchema, PickUpdateSchema
-from ...data_loader import load_data_with_cache_web
-from ...fuzzy_matcher import NameMatcher
+from ...roster_candidates import get_roster_candidates
+from ...services import AliasService
 
 
 def get_player_position(player_name: str, game: Game) -> str:
@@ -22,64 +22,50 @@ def get_player_position(player_name: str, game: Game) -> str:
     Returns:
         Position code (QB, RB, WR, TE) or 'UNK' if not found
     """
+    return resolve_player(player_name, game)[0]
+
+
+def resolve_player(player_name: str, game: Game) -> tuple:
+    """
+    Use fuzzy matching to find the player's position and roster gsis_id.
+    
+    Args:
+        player_name: Name of the player
+        game: Game object to get season and teams
+    
+    Returns:
+        (position, gsis_id) - position is QB, RB, WR, TE or 'UNK'; gsis_id is None
+        unless the name was auto-accepted as one of the game's rostered players
+    """
     try:
-        # Load roster data for the season
-        _, _, roster_df = load_data_with_cache_web(game.season, use_cache=True)
-        
-        # Filter to only players from the game's teams (don't filter by week - roster 'week' represents transactions)
-        game_rosters = roster_df.filter(
-            (roster_df['team'] == game.home_team) | 
-            (roster_df['team'] == game.away_team)
-        )
-        
-        if len(game_rosters) == 0:
-            return 'UNK'
-        
-        # Get player names and positions
-        # Roster schema uses full_name (and optionally football_name), not player_name
-        base_cols = ['full_name', 'position']
-        players_raw = game_rosters.select(base_cols).to_dicts()
-        # Build candidate names list (full_name + any football_name alias + first_last + last_name)
-        candidate_names = []
-        # Extract additional columns safely
-        first_names = game_rosters['first_name'].to_list() if 'first_name' in game_rosters.columns else []
-        last_names = game_rosters['last_name'].to_list() if 'last_name' in game_rosters.columns else []
-        football_names = game_rosters['football_name'].to_list() if 'football_name' in game_rosters.columns else []
-        full_names = [p['full_name'] for p in players_raw]
-        candidate_names.extend(full_names)
-        candidate_names.extend([fn for fn in football_names if fn])
-        candidate_names.extend([f"{fn} {ln}" for fn, ln in zip(first_names, last_names) if fn and ln])
-        candidate_names.extend([ln for ln in last_names if ln])
-        # Deduplicate while preserving order
-        seen = set()
-        ordered_candidates = []
-        for n in candidate_names:
-            nl = n.lower()
-            if nl not in seen:
-                seen.add(nl)
-                ordered_candidates.append(n)
+        # Candidates for the game's teams (don't filter by week - roster 'week' represents transactions)
+        candidates = get_roster_candidates(game.season).for_game(game.home_team, game.away_team)
+        if candidates is None:
+            return 'UNK', None
         
-        # Use fuzzy matcher to find best match
-        matcher = NameMatcher()
-        match_result = matcher.find_best_match(player_name, ordered_candidates, min_score=0.70)
+        # Use reviewed aliases, then the fuzzy matcher, to find best match
+        # (an approved alias with a gsis_id is looked up by ID among the rostered players)
+        match_result = AliasService().find_best_match(player_name, candidates.index, min_score=0.70,
+                                                      scorer_ids=candidates.id_names)
         
         if match_result and match_result['auto_accept']:
             # Find the position for the matched player via full_name fallback
-            matched_player = next((p for p in players_raw if p['full_name'] == match_result['matched_name']), None)
-            if matched_player and matched_player.get('position'):
-                position = matched_player['position']
+            matched_player = candidates.player(match_result['matched_name'])
+            if matched_player:
+                gsis_id = match_result.get('gsis_id') or matched_player.get('gsis_id') or None
+                position = matched_player.get('position')
                 # Map position to our standard codes
                 if position in ['QB', 'RB', 'WR', 'TE']:
-                    return position
+                    return position, gsis_id
                 elif position in ['FB', 'HB']:
-                    return 'RB'
+                    return 'RB', gsis_id
                 else:
-                    return 'UNK'
+                    return 'UNK', gsis_id
         
-        return 'UNK'
+        return 'UNK', None
     except Exception as e:
         print(f"Error getting player position: {e}")
-        return 'UNK'
+        return 'UNK', None
 
 
 @api_bp.route('/picks', methods=['GET'])
@@ -101,16 +87,16 @@ def get_picks():
         
         picks = query.order_by(Game.week, Game.game_date, Game.game_time).all()
         
-        # Load roster dataframe once if we need to enrich names
-        roster_df = None
+        # Load the season's roster candidates once if we need to enrich names
+        roster_candidates = None
         matcher = None
         if include_full_names:
             try:
-                _, _, roster_df = load_data_with_cache_web(season, use_cache=True)
-                matcher = NameMatcher()
+                roster_candidates = get_roster_candidates(season)
+                matcher = roster_candidates.matcher
             except Exception as e:
                 print(f"Failed loading roster data for full name enrichment: {e}")
-                roster_df = None
+                roster_candidates = None
                 matcher = None
                 include_full_names = False  # disable enrichment gracefully
         
@@ -118,60 +104,42 @@ def get_picks():
         for pick in picks:
             full_player_name = pick.player_name
             # Attempt enrichment only if requested and we have roster data
-            if include_full_names and roster_df is not None and matcher is not None:
+            if include_full_names and roster_candidates is not None and matcher is not None:
                 try:
-                    # Filter roster to game teams (don't filter by week - roster 'week' represents transactions)
-                    game_roster = roster_df.filter(
-                        (roster_df['team'] == pick.game.home_team) |
-                        (roster_df['team'] == pick.game.away_team)
-                    )
-                    if len(game_roster) > 0:
-                        # Build candidate list similar to get_player_position
-                        full_names = game_roster['full_name'].to_list() if 'full_name' in game_roster.columns else []
-                        football_names = game_roster['football_name'].to_list() if 'football_name' in game_roster.columns else []
-                        first_names = game_roster['first_name'].to_list() if 'first_name' in game_roster.columns else []
-                        last_names = game_roster['last_name'].to_list() if 'last_name' in game_roster.columns else []
-                        candidate_names = []
-                        candidate_names.extend(full_names)
-                        candidate_names.extend([fn for fn in football_names if fn])
-                        candidate_names.extend([f"{fn} {ln}" for fn, ln in zip(first_names, last_names) if fn and ln])
-                        candidate_names.extend([ln for ln in last_names if ln])
-                        # Deduplicate
-                        seen = set()
-                        ordered_candidates = []
-                        for n in candidate_names:
-                            nl = n.lower()
-                            if nl not in seen:
-                                seen.add(nl)
-                                ordered_candidates.append(n)
+                    # Candidates for the game's teams (don't filter by week - roster 'week' represents transactions)
+                    candidates = roster_candidates.for_game(pick.game.home_team, pick.game.away_team)
+                    if candidates is not None:
+                        full_names = candidates.full_names
+                        football_names = candidates.football_names
+                        first_names = candidates.first_names
+                        last_names = candidates.last_names
 
                         original = pick.player_name.strip()
                         tokens = original.replace('.', '').split()
                         lowered_original = original.lower()
 
                         # 1. Exact (case-insensitive) full-name match
-                        exact_map = {n.lower(): n for n in full_names}
-                        if lowered_original in exact_map:
-                            full_player_name = exact_map[lowered_original]
+                        if lowered_original in candidates.full_name_map:
+                            full_player_name = candidates.full_name_map[lowered_original]
                         else:
                             # 2. Single-word last name match (unique)
                             if len(tokens) == 1:
-                                matching_indices = [i for i, ln in enumerate(last_names) if ln and ln.lower() == tokens[0].lower()]
+                                matching_indices = candidates.last_name_rows.get(tokens[0].lower(), [])
                                 if len(matching_indices) == 1:
                                     full_player_name = full_names[matching_indices[0]]
                                 else:
                                     # Single-word unique first name match
-                                    first_matches = [i for i, fn in enumerate(first_names) if fn and fn.lower().replace('.', '') == tokens[0].lower()]
+                                    first_matches = candidates.first_name_rows.get(tokens[0].lower(), [])
                                     if len(first_matches) == 1:
                                         idx = first_matches[0]
                                         # If the stored full_name is just the first name, synthesize first + last
-                                        if idx < len(last_names) and full_names[idx] and len(full_names[idx].split()) == 1 and last_names[idx]:
+                                        if full_names[idx] and len(full_names[idx].split()) == 1 and last_names[idx]:
                                             full_player_name = f"{full_names[idx]} {last_names[idx]}"
                                         else:
                                             full_player_name = full_names[idx]
                                     else:
                                         # Fallback fuzzy
-                                        match_result = matcher.find_best_match(original, ordered_candidates, min_score=0.60)
+                                        match_result = matcher.find_best_match(original, candidates.index, min_score=0.60)
                                         if match_result and match_result['score'] >= 0.70:
                                             full_player_name = match_result['matched_name']
                             else:
@@ -184,7 +152,7 @@ def get_picks():
                                             continue
                                         fn_norm = fn.lower().replace('.', '')
                                         # Incorporate football_name and initials for abbreviation matching
-                                        fb_name = football_names[i] if i < len(football_names) else None
+                                        fb_name = football_names[i]
                                         fb_norm = fb_name.lower().replace('.', '') if fb_name else ''
                                         initials = ''.join([part[0] for part in fn.split() if part]).lower()
                                         ln_norm = ln.lower().replace('.', '')
@@ -199,12 +167,12 @@ def get_picks():
                                         else:
                                             full_player_name = full_names[matched_index]
                                     else:
-                                        match_result = matcher.find_best_match(original, ordered_candidates, min_score=0.60)
+                                        match_result = matcher.find_best_match(original, candidates.index, min_score=0.60)
                                         if match_result and match_result['score'] >= 0.70:
                                             full_player_name = match_result['matched_name']
                                 else:
                                     # General fallback fuzzy
-                                    match_result = matcher.find_best_match(original, ordered_candidates, min_score=0.60)
+                                    match_result = matcher.find_best_match(original, candidates.index, min_score=0.60)
                                     if match_result and match_result['score'] >= 0.70:
                                         full_player_name = match_result['matched_name']
 
@@ -299,9 +267,11 @@ def create_pick():
         if not game:
             return jsonify({'error': 'Game not found'}), 404
         
-        # If position is UNK (default), try to auto-detect from roster
+        # Resolve the roster player (gsis_id for grading) and, if position is UNK
+        # (default), auto-detect it from the roster
+        detected_position, player_gsis_id = resolve_player(player_name, game)
         if player_position == 'UNK':
-            player_position = get_player_position(player_name, game)
+            player_position = detected_position
         
         existing_pick = PickModel.query.filter_by(
             user_id=user_id,
@@ -318,6 +288,7 @@ def create_pick():
             pick_type=pick_type,
             player_name=player_name,
             player_position=player_position,
+            player_gsis_id=player_gsis_id,
             odds=int(odds),
             stake=float(stake),
             result='Pending',
@@ -352,7 +323,10 @@ def update_pick(pick_id):
         pick = PickModel.query.get_or_404(pick_id)
         
         if 'player_name' in validated_data:
-            pick.player_name = validated_data['player_name'].strip()
+            player_name = validated_data['player_name'].strip()
+            if player_name != pick.player_name:
+                pick.player_name = player_name
+                pick.player_gsis_id = resolve_player(player_name, pick.game)[1]
         if 'player_position' in validated_data:
             pick.player_position = validated_data['player_position']
         if 'pick_type' in validated_data:
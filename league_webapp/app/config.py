@@ -30,6 +30,11 @@ class Config:
     CACHE_TYPE = 'SimpleCache'
     CACHE_DEFAULT_TIMEOUT = 300
     
+    # Background jobs
+    JOB_WORKERS = 2
+    JOB_HISTORY_SIZE = 100
+    JOBS_RUN_INLINE = False
+    
     # Logging
     LOG_LEVEL = 'INFO'
 
@@ -123,6 +128,9 @@ class TestingConfig(Config):
     CACHE_TYPE = 'NullCache'
     CACHE_DEFAULT_TIMEOUT = 0
     
+    # Run background jobs in the request thread so tests see their results
+    JOBS_RUN_INLINE = True
+    
     # Logging
     LOG_LEVEL = 'DEBUG'
     SQLALCHEMY_ECHO = False
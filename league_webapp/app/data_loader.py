@@ -6,31 +6,134 @@ import polars as pl
 import os
 import requests
 import io
+import threading
+from collections import OrderedDict
+from nfl_core.config import DATA_CACHE_DIR
+from nfl_core.data import (
+    scan_pbp, pbp_partition_dir, ensure_pbp_partitions, write_pbp_partitions, download_pbp,
+    read_pbp_manifest, PBP_MANIFEST_FILE
+)
+# Re-exported for existing callers (grading service, routes)
+from nfl_core.stats import get_all_td_scorers, GameTouchdownIndex
 
-def load_data_with_cache_web(season: int, use_cache: bool = True) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+# In-process season cache: season -> (file stamp, (schedule_df, pbp_df, roster_df), artifacts).
+# Entries are dropped when any backing file changes on disk; least recently used
+# seasons are evicted once more than SEASON_CACHE_SIZE are held. artifacts holds
+# values derived from the entry's frames (see get_season_artifact) and goes with it.
+SEASON_CACHE_SIZE = 4
+_season_cache = OrderedDict()
+_season_cache_lock = threading.Lock()
+
+def _season_cache_stamp(season: int, cache_dir: str) -> tuple | None:
+    """
+    Returns (mtime_ns, size) for each backing cache file, or None if any is missing.
+    """
+    paths = [
+        os.path.join(cache_dir, f"season_{season}_schedule.parquet"),
+        os.path.join(pbp_partition_dir(season, cache_dir), PBP_MANIFEST_FILE),
+        os.path.join(cache_dir, f"season_{season}_roster.parquet"),
+    ]
+    stamp = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+def _season_cache_get(season: int, stamp: tuple | None):
+    """
+    Returns the cached (schedule_df, pbp_df, roster_df) if it was loaded from the same files.
+    """
+    with _season_cache_lock:
+        entry = _season_cache.get(season)
+        if entry is None or stamp is None or entry[0] != stamp:
+            return None
+        _season_cache.move_to_end(season)
+        return entry[1]
+
+def _season_cache_put(season: int, stamp: tuple | None, data: tuple) -> None:
+    """
+    Stores loaded season data, evicting the least recently used season if over capacity.
+    """
+    if stamp is None:
+        return
+    with _season_cache_lock:
+        _season_cache[season] = (stamp, data, {})
+        _season_cache.move_to_end(season)
+        while len(_season_cache) > SEASON_CACHE_SIZE:
+            _season_cache.popitem(last=False)
+
+def get_season_artifact(season: int, name: str, build):
+    """
+    Returns a value derived from a season's data (e.g. an index over its roster).
+    
+    build(schedule_df, pbp_df, roster_df) runs the first time name is requested for
+    the season's cached frames; the result is kept with that cache entry, so it is
+    rebuilt only after the season is reloaded (a backing file changed, or eviction).
+    """
+    data = load_data_with_cache_web(season, use_cache=True)
+    
+    with _season_cache_lock:
+        entry = _season_cache.get(season)
+        artifacts = entry[2] if entry is not None and all(a is b for a, b in zip(entry[1], data)) else None
+        if artifacts is not None and name in artifacts:
+            return artifacts[name]
+    
+    value = build(*data)
+    if artifacts is not None:
+        with _season_cache_lock:
+            value = artifacts.setdefault(name, value)
+    return value
+
+def clear_season_cache(season: int | None = None) -> None:
+    """
+    Drops in-memory season data (all seasons if season is None).
+    """
+    with _season_cache_lock:
+        if season is None:
+            _season_cache.clear()
+        else:
+            _season_cache.pop(season, None)
+
+def load_data_with_cache_web(season: int, use_cache: bool = True, refresh_weeks: list[int] | None = None) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
     """
     Loads schedule, pbp, and roster data for web app (no interactive prompts).
     
+    Loaded seasons are kept in memory and reused until a backing parquet file changes.
+    PBP is cached as one parquet partition per week (cache/pbp/season=YYYY/week=N/).
+    A refresh only rewrites the weeks whose plays changed since the last download.
+    
     Args:
         season: NFL season year
         use_cache: If True, use cached data if available. If False, always download fresh.
+        refresh_weeks: Optional weeks to update on a fresh download (None = any week that changed).
     
     Returns:
         Tuple of (schedule_df, pbp_df, roster_df)
     """
-    cache_dir = "../cache"
+    cache_dir = DATA_CACHE_DIR
     os.makedirs(cache_dir, exist_ok=True)
     
     schedule_path = os.path.join(cache_dir, f"season_{season}_schedule.parquet")
-    pbp_path = os.path.join(cache_dir, f"season_{season}_pbp.parquet")
+    pbp_dir = pbp_partition_dir(season, cache_dir)
     roster_path = os.path.join(cache_dir, f"season_{season}_roster.parquet")
     
     # Use cache if requested and files exist
-    if use_cache and os.path.exists(schedule_path) and os.path.exists(pbp_path) and os.path.exists(roster_path):
+    if use_cache:
+        cached = _season_cache_get(season, _season_cache_stamp(season, cache_dir))
+        if cached is not None:
+            return cached
+
+    if use_cache and os.path.exists(schedule_path) and os.path.exists(roster_path) and ensure_pbp_partitions(season, cache_dir):
         try:
             schedule_df = pl.read_parquet(schedule_path)
-            pbp_df = pl.read_parquet(pbp_path)
+            # Every consumer's columns: the season cache entry is shared by grading,
+            # analysis and the touchdown index, so it's read once rather than per consumer
+            pbp_df = scan_pbp(pbp_dir).collect()
             roster_df = pl.read_parquet(roster_path)
+            _season_cache_put(season, _season_cache_stamp(season, cache_dir), (schedule_df, pbp_df, roster_df))
             return schedule_df, pbp_df, roster_df
         except Exception as e:
             print(f"Error loading cache: {e}. Downloading fresh data.")
@@ -48,15 +151,7 @@ def load_data_with_cache_web(season: int, use_cache: bool = True) -> tuple[pl.Da
         schedule_df = pl.read_csv(io.BytesIO(r.content))
 
     # PBP
-    try:
-        pbp_df = nfl.load_pbp(seasons=season)
-        if not isinstance(pbp_df, pl.DataFrame):
-            pbp_df = pl.from_pandas(pbp_df)
-    except Exception as e:
-        print(f"nflreadpy pbp load failed ({e}), trying manual download...")
-        url = f"https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.parquet"
-        r = requests.get(url)
-        pbp_df = pl.read_parquet(io.BytesIO(r.content))
+    pbp_df = download_pbp(season)
     
     # Filter PBP to only touchdown plays to reduce memory/storage
     print(f"Original PBP size: {pbp_df.height:,} plays")
@@ -79,11 +174,46 @@ def load_data_with_cache_web(season: int, use_cache: bool = True) -> tuple[pl.Da
 
     # Save to cache
     schedule_df.write_parquet(schedule_path)
-    pbp_df.write_parquet(pbp_path)
     roster_df.write_parquet(roster_path)
+
+    # Migrate a legacy single-file cache first so unchanged weeks are recognized;
+    # with nothing cached yet every week has to be written regardless of refresh_weeks
+    if not ensure_pbp_partitions(season, cache_dir):
+        refresh_weeks = None
+    written = write_pbp_partitions(pbp_df, season, cache_dir, weeks=refresh_weeks)
+    print(f"Updated PBP weeks: {written or 'none (no changes)'}")
+
+    # Read back the full season so the projection matches a cache hit
+    pbp_df = scan_pbp(pbp_dir).collect()
+    _season_cache_put(season, _season_cache_stamp(season, cache_dir), (schedule_df, pbp_df, roster_df))
     
     return schedule_df, pbp_df, roster_df
 
+def get_pbp_manifest(season: int) -> dict:
+    """
+    Returns the PBP partition manifest for a season from the web app's cache ({} if none).
+    """
+    return read_pbp_manifest(season, DATA_CACHE_DIR)
+
+def get_game_touchdown_index(season: int) -> GameTouchdownIndex:
+    """
+    Returns the season's per-game touchdown index, built once per loaded season
+    (and again whenever the PBP or roster is reloaded).
+    """
+    return get_season_artifact(
+        season, 'game_touchdowns',
+        lambda schedule_df, pbp_df, roster_df: GameTouchdownIndex(pbp_df, roster_df)
+    )
+
+def load_cached_roster(season: int) -> pl.DataFrame | None:
+    """
+    Returns the cached roster for a season without loading schedule/PBP (None if not cached).
+    """
+    roster_path = os.path.join(DATA_CACHE_DIR, f"season_{season}_roster.parquet")
+    if not os.path.exists(roster_path):
+        return None
+    return pl.read_parquet(roster_path)
+
 def get_current_nfl_week(season: int = 2025) -> int:
     """
     Determine the current NFL week based on today's date.
@@ -92,7 +222,7 @@ def get_current_nfl_week(season: int = 2025) -> int:
     from datetime import datetime, timezone
     
     # Load schedule to determine current week
-    cache_dir = "../cache"
+    cache_dir = DATA_CACHE_DIR
     schedule_path = os.path.join(cache_dir, f"season_{season}_schedule.parquet")
     
     if os.path.exists(schedule_path):
@@ -120,89 +250,3 @@ def get_current_nfl_week(season: int = 2025) -> int:
     current_week = past_games.select(pl.col("week").max()).item()
     
     return int(current_week) if current_week else 13
-
-def get_all_td_scorers(pbp_df: pl.DataFrame, target_game_ids: list[str] | None = None, roster_df: pl.DataFrame | None = None) -> dict:
-    """
-    Processes play-by-play data to find ALL touchdown scorers for specified games.
-    Used for grading Anytime TD Scorer (ATTS) picks.
-    
-    Args:
-        pbp_df: Play-by-play DataFrame
-        target_game_ids: Optional list of game IDs to filter for
-        roster_df: Optional roster DataFrame for player name lookup
-        
-    Returns:
-        Dict mapping game_id to list of TD scorers:
-        {game_id: [{'player': str, 'team': str, 'player_id': str}, ...]}
-    """
-    all_td_map = {}
-    
-    if pbp_df.height == 0:
-        return all_td_map
-
-    # Filter for only the games we care about
-    if target_game_ids:
-        pbp_df = pbp_df.filter(pl.col("game_id").is_in(target_game_ids))
-        if pbp_df.height == 0:
-            return all_td_map
-
-    # Filter for touchdown plays
-    td_plays = pbp_df.filter(
-        (pl.col('touchdown') == 1) | 
-        (pl.col('td_player_name').is_not_null())
-    )
-
-    if td_plays.height == 0:
-        return all_td_map
-
-    # Create ID to name mapping from roster
-    id_to_name = {}
-    if roster_df is not None and "gsis_id" in roster_df.columns and "full_name" in roster_df.columns:
-        temp_df = roster_df.select(["gsis_id", "full_name"]).unique()
-        for r in temp_df.to_dicts():
-            if r["gsis_id"] and r["full_name"]:
-                id_to_name[r["gsis_id"]] = r["full_name"]
-
-    # Group by game_id to process each game
-    for game_id in td_plays.select(pl.col("game_id").unique()).to_series():
-        game_tds = td_plays.filter(pl.col("game_id") == game_id)
-        scorers = []
-        seen_players = set()  # Track unique players by ID or name
-        
-        for row in game_tds.to_dicts():
-            player_id = row.get('td_player_id')
-            scorer = None
-            
-            # 1. Try roster lookup
-            if player_id and player_id in id_to_name:
-                scorer = id_to_name[player_id]
-            
-            # 2. Try PBP columns if no roster match
-            if not scorer:
-                for key in ['fantasy_player_name', 'player_name', 'td_player_name', 'desc', 'description']:
-                    if key in row and row.get(key):
-                        scorer = str(row.get(key))
-                        if key in ['desc', 'description'] and ' for ' in scorer:
-                            scorer = scorer.split(' for ')[0].strip()
-                        break
-            
-            # Get team
-            team = row.get('td_team') or row.get('posteam') or "UNK"
-            
-            # Only add if we have a scorer and haven't seen this player yet
-            if scorer:
-                # Use player_id as unique key if available, otherwise use normalized name
-                unique_key = player_id if player_id else scorer.lower().strip()
-                
-                if unique_key not in seen_players:
-                    seen_players.add(unique_key)
-                    scorers.append({
-                        'player': scorer,
-                        'team': team,
-                        'player_id': player_id
-                    })
-        
-        if scorers:
-            all_td_map[game_id] = scorers
-            
-    return all_td_map
@@ -6,8 +6,104 @@ to match player names from picks against actual NFL roster/scorer data.
 """
 
 from typing import List, Tuple, Optional, Dict
+import math
 import re
+import zlib
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+# Entries kept by each name memo (normalized names, tokens, nickname variations)
+NAME_CACHE_SIZE = 16384
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _normalize_name(name: str) -> str:
+    if not name:
+        return ""
+    
+    # Lowercase and strip
+    name = name.lower().strip()
+    
+    # Remove periods
+    name = name.replace('.', '')
+    
+    # Remove commas
+    name = name.replace(',', '')
+    
+    # Normalize multiple spaces to single space
+    return _WHITESPACE.sub(' ', name)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _name_tokens(name: str) -> Tuple[str, ...]:
+    return tuple(_normalize_name(name).split())
+
+
+def reverse_nickname_map(nickname_map: Dict[str, str]) -> Dict[str, List[str]]:
+    """
+    Invert a nickname -> full name map to full name -> [nicknames],
+    keeping the nicknames in the map's order.
+    """
+    reverse = {}
+    for nick, full in nickname_map.items():
+        reverse.setdefault(full, []).append(nick)
+    return reverse
+
+
+def bit_parallel_levenshtein(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance using Myers' bit-vector algorithm (Hyyrö's formulation).
+    
+    Each column of the DP matrix is kept as bit vectors of +1/-1 vertical deltas,
+    so one text character costs a handful of integer operations instead of a
+    Python loop over the pattern. Python ints make the vectors any width.
+    
+    Args:
+        s1, s2: Strings to compare
+        max_distance: Optional cutoff; once the distance is certain to exceed it,
+            returns max_distance + 1 without finishing the computation
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    n, m = len(s1), len(s2)
+    
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+    
+    # Bit i of peq[c] is set where the pattern (shorter string) has character c
+    peq = {}
+    for i, c in enumerate(s2):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv = mask, 0
+    score = m
+    
+    for j, c in enumerate(s1):
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+        
+        # The last row changes by at most 1 per remaining character
+        if max_distance is not None and score - (n - j - 1) > max_distance:
+            return max_distance + 1
+    
+    return score
 
 
 class NameMatcher:
@@ -70,6 +166,14 @@ class NameMatcher:
         'pickens': 'george pickens',
     }
     
+    # Full name -> nicknames, so expand_nicknames does one lookup per token
+    REVERSE_NICKNAME_MAP = reverse_nickname_map(NICKNAME_MAP)
+    
+    # Version of the scoring rules, stored with memoized scores (match_score_memo) so
+    # scores from older rules are never reused. Bump the number when a change alters
+    # the score of any name pair; edits to NICKNAME_MAP change the suffix by themselves.
+    SCORER_VERSION = f"1-{zlib.crc32(repr(sorted(NICKNAME_MAP.items())).encode()):08x}"
+    
     # Suffixes to normalize
     SUFFIXES = ['jr', 'sr', 'ii', 'iii', 'iv', 'v']
     
@@ -77,7 +181,8 @@ class NameMatcher:
                  exact_threshold: float = 1.0,
                  high_confidence_threshold: float = 0.85,
                  medium_confidence_threshold: float = 0.70,
-                 auto_accept_threshold: float = 0.85):
+                 auto_accept_threshold: float = 0.85,
+                 score_memo: Optional[Dict[Tuple[str, str], Tuple[float, str]]] = None):
         """
         Initialize the name matcher.
         
@@ -86,11 +191,16 @@ class NameMatcher:
             high_confidence_threshold: Minimum score for high confidence (0.85)
             medium_confidence_threshold: Minimum score for medium confidence (0.70)
             auto_accept_threshold: Minimum score to auto-accept without review (0.85)
+            score_memo: Optional dict of (pick_name, scorer_name) -> (score, reason).
+                When given, find_best_match reads scores from it and adds new ones.
         """
         self.exact_threshold = exact_threshold
         self.high_confidence_threshold = high_confidence_threshold
         self.medium_confidence_threshold = medium_confidence_threshold
         self.auto_accept_threshold = auto_accept_threshold
+        self.score_memo = score_memo
+        # Per-matcher memo of nickname variations (depends on NICKNAME_MAP)
+        self._variations = lru_cache(maxsize=NAME_CACHE_SIZE)(self._build_variations)
     
     def normalize_name(self, name: str) -> str:
         """
@@ -100,29 +210,16 @@ class NameMatcher:
         - Remove extra whitespace
         - Remove periods
         - Handle suffixes (Jr., Sr., etc.)
-        """
-        if not name:
-            return ""
         
-        # Lowercase and strip
-        name = name.lower().strip()
-        
-        # Remove periods
-        name = name.replace('.', '')
-        
-        # Remove commas
-        name = name.replace(',', '')
-        
-        # Normalize multiple spaces to single space
-        name = re.sub(r'\s+', ' ', name)
-        
-        return name
+        Results are memoized (NAME_CACHE_SIZE most recent names).
+        """
+        return _normalize_name(name)
     
     def tokenize_name(self, name: str) -> List[str]:
         """
         Split name into tokens (words).
         """
-        return self.normalize_name(name).split()
+        return list(_name_tokens(name))
     
     def expand_nicknames(self, name: str) -> List[str]:
         """
@@ -130,49 +227,38 @@ class NameMatcher:
         
         Returns a list of possible name variations.
         """
-        normalized = self.normalize_name(name)
+        return [variation for variation, _ in self._variations(name)]
+    
+    def _build_variations(self, name: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        # (variation, tokens) pairs for expand_nicknames, memoized in self._variations
+        normalized = _normalize_name(name)
         tokens = normalized.split()
         variations = [normalized]
         
-        # Try expanding each token if it's a known nickname
         for i, token in enumerate(tokens):
+            # Create variation with expanded nickname
             if token in self.NICKNAME_MAP:
-                # Create variation with expanded nickname
                 expanded_tokens = tokens.copy()
                 expanded_tokens[i] = self.NICKNAME_MAP[token]
                 variations.append(' '.join(expanded_tokens))
             
             # Also try the reverse (if token matches a full name, try nickname)
-            for nick, full in self.NICKNAME_MAP.items():
-                if token == full:
-                    nickname_tokens = tokens.copy()
-                    nickname_tokens[i] = nick
-                    variations.append(' '.join(nickname_tokens))
+            for nick in self.REVERSE_NICKNAME_MAP.get(token, ()):
+                nickname_tokens = tokens.copy()
+                nickname_tokens[i] = nick
+                variations.append(' '.join(nickname_tokens))
         
-        return list(set(variations))  # Remove duplicates
+        # Remove duplicates
+        return tuple((variation, _name_tokens(variation)) for variation in set(variations))
     
-    def levenshtein_distance(self, s1: str, s2: str) -> int:
+    def levenshtein_distance(self, s1: str, s2: str, max_distance: Optional[int] = None) -> int:
         """
         Calculate Levenshtein distance between two strings.
-        """
-        if len(s1) < len(s2):
-            return self.levenshtein_distance(s2, s1)
         
-        if len(s2) == 0:
-            return len(s1)
-        
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                # Cost of insertions, deletions, or substitutions
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        return previous_row[-1]
+        With max_distance, returns max_distance + 1 as soon as the distance is
+        known to be larger (see bit_parallel_levenshtein).
+        """
+        return bit_parallel_levenshtein(s1, s2, max_distance)
     
     def levenshtein_similarity(self, s1: str, s2: str) -> float:
         """
@@ -196,8 +282,8 @@ class NameMatcher:
         Useful for matching "John Smith" with "Smith, John" or partial matches.
         Improved to handle partial name matches better (e.g., "Allen" vs "Josh Allen").
         """
-        tokens1 = self.tokenize_name(name1)  # Keep as list, not set
-        tokens2 = self.tokenize_name(name2)  # Keep as list, not set
+        tokens1 = _name_tokens(name1)  # Keep order, not set
+        tokens2 = _name_tokens(name2)  # Keep order, not set
         
         if not tokens1 or not tokens2:
             return 0.0
@@ -258,29 +344,39 @@ class NameMatcher:
         Returns:
             (score, reason) where score is 0-1 and reason explains the match
         """
+        return self.bounded_match_score(pick_name, scorer_name)
+    
+    def bounded_match_score(self, pick_name: str, scorer_name: str,
+                            min_score: Optional[float] = None) -> Optional[Tuple[float, str]]:
+        """
+        calculate_match_score that can give up early on hopeless pairs.
+        
+        With min_score, returns None as soon as upper bounds on the similarity
+        measures show the score must be below min_score; the Levenshtein distance
+        is computed with a cutoff derived from it. Pairs that can reach min_score
+        get exactly the (score, reason) calculate_match_score returns.
+        """
         # Exact match
         if pick_name == scorer_name:
             return 1.0, "Exact match"
         
-        # Normalize both names
-        norm_pick = self.normalize_name(pick_name)
-        norm_scorer = self.normalize_name(scorer_name)
+        # Normalize both names (memoized, as are tokens and nickname variations)
+        norm_pick = _normalize_name(pick_name)
+        norm_scorer = _normalize_name(scorer_name)
         
         # Case-insensitive exact match
         if norm_pick == norm_scorer:
             return 0.95, "Case-insensitive exact match"
         
         # Check nickname variations
-        pick_variations = self.expand_nicknames(pick_name)
-        scorer_variations = self.expand_nicknames(scorer_name)
+        pick_variations = self._variations(pick_name)
+        scorer_variations = self._variations(scorer_name)
         
-        for pick_var in pick_variations:
-            for scorer_var in scorer_variations:
+        for pick_var, pick_var_tokens in pick_variations:
+            for scorer_var, scorer_var_tokens in scorer_variations:
                 if pick_var == scorer_var:
                     return 0.90, f"Nickname match: '{pick_name}' → '{scorer_name}'"
                 # Also check if nickname variation creates a token match
-                pick_var_tokens = self.tokenize_name(pick_var)
-                scorer_var_tokens = self.tokenize_name(scorer_var)
                 # Check for single name matching last name in full name
                 if len(pick_var_tokens) == 1 and len(scorer_var_tokens) > 1:
                     if pick_var_tokens[0] == scorer_var_tokens[-1] or pick_var_tokens[0] == scorer_var_tokens[0]:
@@ -293,21 +389,15 @@ class NameMatcher:
         token_sim = self.token_similarity(pick_name, scorer_name)
         
         # Check for name order variations (Last, First vs First Last)
-        pick_tokens = self.tokenize_name(pick_name)
-        scorer_tokens = self.tokenize_name(scorer_name)
+        pick_tokens = _name_tokens(pick_name)
+        scorer_tokens = _name_tokens(scorer_name)
         
-        # If pick is "Last, First" format, try reversing
+        # If pick is "Last, First" format, try reversing (tokens are already
+        # normalized, so comparing them is comparing the normalized names)
         if len(pick_tokens) == 2 and len(scorer_tokens) == 2:
-            reversed_pick = f"{pick_tokens[1]} {pick_tokens[0]}"
-            if self.normalize_name(reversed_pick) == norm_scorer:
+            if (pick_tokens[1], pick_tokens[0]) == scorer_tokens:
                 return 0.92, "Name order variation (Last, First)"
         
-        # Calculate Levenshtein similarity
-        lev_sim = self.levenshtein_similarity(norm_pick, norm_scorer)
-        
-        # Use SequenceMatcher for additional context
-        seq_sim = SequenceMatcher(None, norm_pick, norm_scorer).ratio()
-        
         # Special handling for initials (e.g., "P. Mahomes" vs "Patrick Mahomes")
         # Check if one name contains initials
         has_initial_pick = any(len(token) <= 2 and '.' not in token for token in pick_tokens)
@@ -335,6 +425,39 @@ class NameMatcher:
             if initial_match:
                 return 0.88, "Initial match (e.g., 'P. Mahomes' → 'Patrick Mahomes')"
         
+        max_len = max(len(norm_pick), len(norm_scorer))
+        
+        if min_score is not None and max_len > 0:
+            # Upper bounds from lengths alone: distance >= length difference,
+            # and SequenceMatcher's real_quick_ratio bounds its ratio
+            lev_bound = 1.0 - abs(len(norm_pick) - len(norm_scorer)) / max_len
+            seq_bound = 2.0 * min(len(norm_pick), len(norm_scorer)) / (len(norm_pick) + len(norm_scorer))
+            if self._score_upper_bound(token_sim, lev_bound, seq_bound) < min_score:
+                return None
+            
+            # Smallest Levenshtein similarity that could still reach min_score, either
+            # through the weighted combination or through the typo boost
+            min_lev = min(
+                (min_score - token_sim * 0.55 - seq_bound * 0.20) / 0.25,
+                max(0.90, min_score / 0.85)
+            )
+            max_distance = math.floor((1.0 - min_lev) * max_len + 1e-9) if min_lev > 0 else None
+            distance = self.levenshtein_distance(norm_pick, norm_scorer, max_distance)
+            if max_distance is not None and distance > max_distance:
+                return None
+            lev_sim = 1.0 - (distance / max_len)
+            
+            matcher = SequenceMatcher(None, norm_pick, norm_scorer)
+            if self._score_upper_bound(token_sim, lev_sim, matcher.quick_ratio()) < min_score:
+                return None
+            seq_sim = matcher.ratio()
+        else:
+            # Calculate Levenshtein similarity
+            lev_sim = self.levenshtein_similarity(norm_pick, norm_scorer)
+            
+            # Use SequenceMatcher for additional context
+            seq_sim = SequenceMatcher(None, norm_pick, norm_scorer).ratio()
+        
         # Weighted combination of different similarity measures
         # Give more weight to token matching since names are composed of discrete words
         combined_score = (
@@ -357,17 +480,67 @@ class NameMatcher:
         
         return combined_score, reason
     
+    @staticmethod
+    def _score_upper_bound(token_sim: float, lev_sim: float, seq_sim: float) -> float:
+        """
+        Highest score the weighted combination (with typo boost) can give when
+        the Levenshtein and sequence similarities are at most lev_sim and seq_sim.
+        Mirrors the arithmetic in bounded_match_score so rounding stays monotone.
+        """
+        combined = token_sim * 0.55 + lev_sim * 0.25 + seq_sim * 0.20
+        if lev_sim >= 0.90:
+            combined = max(combined, lev_sim * 0.85)
+        return combined
+    
+    def match_score(self, pick_name: str, scorer_name: str,
+                    min_score: Optional[float] = None) -> Optional[Tuple[float, str]]:
+        """
+        bounded_match_score, read from / recorded in score_memo when one is set.
+        Returns None if the pair was cut off below min_score (not memoized).
+        """
+        if self.score_memo is None:
+            return self.bounded_match_score(pick_name, scorer_name, min_score)
+        
+        key = (pick_name, scorer_name)
+        cached = self.score_memo.get(key)
+        if cached is None:
+            cached = self.bounded_match_score(pick_name, scorer_name, min_score)
+            if cached is not None:
+                self.score_memo[key] = cached
+        return cached
+    
+    def get_confidence(self, score: float) -> str:
+        """
+        Confidence level ('exact', 'high', 'medium', 'low') for a match score.
+        """
+        if score >= self.exact_threshold:
+            return 'exact'
+        elif score >= self.high_confidence_threshold:
+            return 'high'
+        elif score >= self.medium_confidence_threshold:
+            return 'medium'
+        return 'low'
+    
+    def build_index(self, names: List[str]) -> 'NameIndex':
+        """
+        Build a reusable candidate index over names for find_best_match.
+        """
+        return NameIndex(names, self)
+    
     def find_best_match(self, 
                        pick_name: str, 
-                       scorer_names: List[str],
-                       min_score: float = 0.0) -> Optional[Dict]:
+                       scorer_names: 'List[str] | NameIndex',
+                       min_score: float = 0.0,
+                       exclude: Optional[set] = None) -> Optional[Dict]:
         """
         Find the best matching scorer name for a pick.
         
         Args:
             pick_name: The player name from the pick
-            scorer_names: List of actual scorer names to match against
+            scorer_names: List of actual scorer names to match against, or a NameIndex
+                over them (only its shortlist for the pick is scored; same result)
             min_score: Minimum acceptable score (default 0.0 returns best match regardless)
+            exclude: Optional set of normalized names (normalize_name) never to match
         
         Returns:
             Dictionary with match details or None if no match meets threshold:
@@ -382,32 +555,31 @@ class NameMatcher:
         if not pick_name or not scorer_names:
             return None
         
-        best_score = 0.0
-        best_match = None
-        best_reason = ""
+        if isinstance(scorer_names, NameIndex):
+            best_score, best_match, best_reason = self._best_candidate(
+                pick_name, self._without(scorer_names.shortlist(pick_name), exclude), min_score
+            )
+            # Names outside the shortlist score below SHORTLIST_FLOOR; only when
+            # nothing in it reached that (and min_score allows less) can they matter
+            if best_score < NameIndex.SHORTLIST_FLOOR and min_score < NameIndex.SHORTLIST_FLOOR:
+                best_score, best_match, best_reason = self._best_candidate(
+                    pick_name, self._without(scorer_names.names, exclude), min_score
+                )
+        else:
+            scorer_names = self._without(scorer_names, exclude)
+            if not scorer_names:
+                return None
+            best_score, best_match, best_reason = self._best_candidate(pick_name, scorer_names, min_score)
         
-        # Score each potential match
-        for scorer_name in scorer_names:
-            score, reason = self.calculate_match_score(pick_name, scorer_name)
-            
-            if score > best_score:
-                best_score = score
-                best_match = scorer_name
-                best_reason = reason
+        if exclude and best_match is None:
+            return None
         
         # Check if best match meets minimum threshold
         if best_score < min_score:
             return None
         
         # Determine confidence level
-        if best_score >= self.exact_threshold:
-            confidence = 'exact'
-        elif best_score >= self.high_confidence_threshold:
-            confidence = 'high'
-        elif best_score >= self.medium_confidence_threshold:
-            confidence = 'medium'
-        else:
-            confidence = 'low'
+        confidence = self.get_confidence(best_score)
         
         # Determine if auto-accept
         auto_accept = best_score >= self.auto_accept_threshold
@@ -421,24 +593,64 @@ class NameMatcher:
             'pick_name': pick_name
         }
     
+    def _without(self, names: List[str], exclude: Optional[set]) -> List[str]:
+        """
+        names minus those whose normalized form is in exclude.
+        """
+        if not exclude:
+            return names
+        return [name for name in names if self.normalize_name(name) not in exclude]
+    
+    def _best_candidate(self, pick_name: str, scorer_names: List[str],
+                        min_score: float) -> Tuple[float, Optional[str], str]:
+        """
+        Highest-scoring name (first one on ties) as (score, name, reason).
+        """
+        best_score = 0.0
+        best_match = None
+        best_reason = ""
+        
+        # Score each potential match; a candidate only matters if it can beat the
+        # current best (and min_score), so hopeless pairs are cut off early
+        for scorer_name in scorer_names:
+            scored = self.match_score(pick_name, scorer_name, max(best_score, min_score))
+            if scored is None:
+                continue
+            score, reason = scored
+            
+            if score > best_score:
+                best_score = score
+                best_match = scorer_name
+                best_reason = reason
+        
+        return best_score, best_match, best_reason
+    
     def batch_match(self, 
                    pick_names: List[str], 
-                   scorer_names: List[str],
+                   scorer_names: 'List[str] | NameIndex',
                    min_score: float = 0.0) -> Dict[str, Optional[Dict]]:
         """
         Match multiple pick names against scorer names.
         
+        The scorer names are normalized and indexed once for the whole batch (pass
+        a NameIndex to reuse one), and each distinct pick name is scored once
+        against its shortlist, so repeated names in large imports cost nothing.
+        Results are the same as calling find_best_match for every pick.
+        
         Args:
             pick_names: List of player names from picks
-            scorer_names: List of actual scorer names
+            scorer_names: List of actual scorer names, or a NameIndex over them
             min_score: Minimum acceptable score
         
         Returns:
             Dictionary mapping pick_name -> match_result
         """
+        index = scorer_names if isinstance(scorer_names, NameIndex) else self.build_index(scorer_names)
+        
         results = {}
         for pick_name in pick_names:
-            results[pick_name] = self.find_best_match(pick_name, scorer_names, min_score)
+            if pick_name not in results:
+                results[pick_name] = self.find_best_match(pick_name, index, min_score)
         return results
     
     def get_confidence_stats(self, matches: Dict[str, Optional[Dict]]) -> Dict:
@@ -472,3 +684,84 @@ class NameMatcher:
             'auto_accept_rate': auto_accepted / total if total > 0 else 0.0,
             'match_rate': (total - no_match) / total if total > 0 else 0.0
         }
+
+
+class NameIndex:
+    """
+    Inverted index over candidate names so find_best_match scores a shortlist.
+    
+    A name is shortlisted for a pick when it
+    - shares a token (last name, first name, ...) with the pick, counting the
+      nickname expansions of both sides,
+    - has the same initials signature (e.g. "P. M." vs "Patrick Mahomes"), or
+    - shares enough character trigrams to be within typo distance (Levenshtein
+      similarity >= 0.90, by the q-gram lemma).
+    Any other name has no token overlap, no nickname or initial match and no typo
+    boost, so calculate_match_score gives it less than 0.25 * 0.90 + 0.20 = SHORTLIST_FLOOR.
+    """
+    
+    # Upper bound (exclusive) on the score of a name left out of the shortlist
+    SHORTLIST_FLOOR = 0.425
+    
+    def __init__(self, names: List[str], matcher: Optional[NameMatcher] = None):
+        self.names = list(names)
+        self.matcher = matcher or NameMatcher()
+        self._tokens = {}
+        self._initials = {}
+        self._trigrams = {}
+        self._normalized = {}
+        
+        for position, name in enumerate(self.names):
+            self._normalized.setdefault(self.matcher.normalize_name(name), name)
+            for token in self._variation_tokens(name):
+                self._tokens.setdefault(token, set()).add(position)
+            signature = self._initials_signature(name)
+            if signature:
+                self._initials.setdefault(signature, set()).add(position)
+            for trigram in self._trigram_set(self.matcher.normalize_name(name)):
+                self._trigrams.setdefault(trigram, []).append(position)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def find(self, normalized_name: str) -> Optional[str]:
+        """
+        The first candidate name whose normalize_name is normalized_name, or None.
+        """
+        return self._normalized.get(normalized_name)
+    
+    def _variation_tokens(self, name: str) -> set:
+        return {token for variation in self.matcher.expand_nicknames(name) for token in variation.split()}
+    
+    def _initials_signature(self, name: str) -> str:
+        return ''.join(token[0] for token in self.matcher.tokenize_name(name))
+    
+    @staticmethod
+    def _trigram_set(text: str) -> set:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def shortlist(self, pick_name: str) -> List[str]:
+        """
+        Candidate names that could score SHORTLIST_FLOOR or more, in original order.
+        """
+        positions = set()
+        for token in self._variation_tokens(pick_name):
+            positions |= self._tokens.get(token, set())
+        positions |= self._initials.get(self._initials_signature(pick_name), set())
+        
+        # Similarity >= 0.90 allows d <= len/9 edits; each edit removes at most three
+        # of the pick's distinct trigrams, so a typo match keeps at least this many
+        norm_pick = self.matcher.normalize_name(pick_name)
+        pick_trigrams = self._trigram_set(norm_pick)
+        required = len(pick_trigrams) - 3 * (len(norm_pick) // 9)
+        if required <= 0:
+            return list(self.names)
+        
+        counts = {}
+        for trigram in pick_trigrams:
+            for position in self._trigrams.get(trigram, ()):
+                counts[position] = counts.get(position, 0) + 1
+        positions.update(position for position, count in counts.items() if count >= required)
+        
+        return [self.names[position] for position in sorted(positions)]
+
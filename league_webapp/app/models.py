@@ -1,4 +1,5 @@
 from datetime import datetime
+import json
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 from . import db
@@ -87,6 +88,7 @@ class Pick(db.Model):
     pick_type = db.Column(db.String(10), nullable=False)  # 'FTD' or 'ATTS'
     player_name = db.Column(db.String(100), nullable=False)
     player_position = db.Column(db.String(10))  # 'WR', 'RB', 'TE', 'QB'
+    player_gsis_id = db.Column(db.String(50))  # Roster gsis_id resolved at submission (NULL if unresolved)
     odds = db.Column(db.Integer, nullable=False)  # American odds (e.g., 900 for +900)
     stake = db.Column(db.Float, default=1.0)  # In betting units
     
@@ -108,9 +110,15 @@ class Pick(db.Model):
     def __repr__(self):
         return f'<Pick {self.user.username}: {self.player_name} ({self.pick_type}) - {self.result}>'
     
-    def calculate_payout(self):
-        """Calculate net payout based on American odds (includes stake for wins)"""
-        if self.result == 'W':
+    def calculate_payout(self, result=None):
+        """
+        Calculate net payout based on American odds (includes stake for wins)
+        
+        Args:
+            result: Result to calculate for (defaults to the pick's current result)
+        """
+        result = result or self.result
+        if result == 'W':
             if self.odds > 0:
                 # Positive odds: profit = stake * (odds / 100), net payout = stake + profit
                 profit = self.stake * (self.odds / 100)
@@ -119,7 +127,7 @@ class Pick(db.Model):
                 # Negative odds: profit = stake / (abs(odds) / 100), net payout = stake + profit
                 profit = self.stake / (abs(self.odds) / 100)
                 return self.stake + profit
-        elif self.result == 'L':
+        elif result == 'L':
             return -self.stake
         else:
             return 0.0
@@ -151,7 +159,7 @@ class MatchDecision(db.Model):
     __tablename__ = 'match_decisions'
     
     id = db.Column(db.Integer, primary_key=True)
-    pick_id = db.Column(db.Integer, db.ForeignKey('picks.id'), nullable=False, index=True)
+    pick_id = db.Column(db.Integer, db.ForeignKey('picks.id'), nullable=False, unique=True, index=True)  # One decision per pick
     
     # The names being matched
     pick_name = db.Column(db.String(100), nullable=False)
@@ -181,3 +189,86 @@ class MatchDecision(db.Model):
     
     def __repr__(self):
         return f'<MatchDecision "{self.pick_name}" → "{self.scorer_name}" ({self.confidence}, {self.match_score:.2f})>'
+
+
+class MatchScoreMemo(db.Model):
+    """Memoized NameMatcher scores so regrades don't re-score known name pairs"""
+    __tablename__ = 'match_score_memo'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Names exactly as passed to the matcher (stripped); the score distinguishes
+    # exact from case-insensitive matches, so case is part of the key
+    pick_name = db.Column(db.String(100), nullable=False)
+    scorer_name = db.Column(db.String(100), nullable=False)
+    
+    # NameMatcher.SCORER_VERSION the score was computed with; other versions are ignored
+    scorer_version = db.Column(db.String(20), nullable=False, default='')
+    
+    match_score = db.Column(db.Float, nullable=False)
+    confidence = db.Column(db.String(20), nullable=False)
+    match_reason = db.Column(db.String(200))
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.UniqueConstraint('pick_name', 'scorer_name', 'scorer_version', name='uq_match_score_memo_names'),
+    )
+    
+    def __repr__(self):
+        return f'<MatchScoreMemo "{self.pick_name}" → "{self.scorer_name}" ({self.match_score:.2f})>'
+
+
+class PlayerAlias(db.Model):
+    """Pick names learned from match reviews: approved aliases and rejected pairs"""
+    __tablename__ = 'player_aliases'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Normalized pick name (NameMatcher.normalize_name) and the player it was reviewed against
+    alias = db.Column(db.String(100), nullable=False, index=True)
+    player_name = db.Column(db.String(100), nullable=False)
+    gsis_id = db.Column(db.String(20))  # From the season roster, when known
+    
+    # True: approved, the alias means this player; False: rejected, never match them
+    is_match = db.Column(db.Boolean, nullable=False, default=True)
+    
+    reviewed_by = db.Column(db.String(50))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        db.UniqueConstraint('alias', 'player_name', name='uq_player_alias_names'),
+    )
+    
+    def __repr__(self):
+        relation = '→' if self.is_match else '≠'
+        return f'<PlayerAlias "{self.alias}" {relation} "{self.player_name}">'
+
+
+class GradingWatermark(db.Model):
+    """Per-season record of what incremental grading has already processed"""
+    __tablename__ = 'grading_watermarks'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    season = db.Column(db.Integer, unique=True, nullable=False)
+    
+    # PBP partition manifest version and per-week fingerprints used for the last run
+    pbp_version = db.Column(db.Integer, default=0)
+    week_fingerprints = db.Column(db.Text, default='{}')  # JSON: {"<week>": "<fingerprint>"}
+    
+    # Highest pick ID that existed when the last run started
+    last_pick_id = db.Column(db.Integer, default=0)
+    
+    games_graded = db.Column(db.Integer, default=0)  # Games processed by the last run
+    graded_at = db.Column(db.DateTime)
+    
+    def get_week_fingerprints(self):
+        return json.loads(self.week_fingerprints or '{}')
+    
+    def set_week_fingerprints(self, fingerprints):
+        self.week_fingerprints = json.dumps(fingerprints, sort_keys=True)
+    
+    def __repr__(self):
+        return f'<GradingWatermark {self.season} v{self.pbp_version} pick>{self.last_pick_id}>'
+
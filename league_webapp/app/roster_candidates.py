@@ -0,0 +1,157 @@
+"""
+Roster candidate names per team, for pick position detection and name enrichment.
+
+The roster is split by team once per loaded season (get_roster_candidates), and the
+candidate list, NameIndex and name lookups for a game's two teams are built the
+first time that pairing is asked for.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import polars as pl
+
+from .data_loader import get_season_artifact
+from .fuzzy_matcher import NameMatcher
+
+# Roster columns used for candidates and lookups (missing columns read as None)
+ROSTER_COLUMNS = ('full_name', 'football_name', 'first_name', 'last_name', 'position', 'gsis_id')
+
+
+class GameCandidates:
+    """
+    Candidate names for one game's two teams.
+
+    The row lists (full_names, first_names, ...) hold both teams' roster rows in
+    roster order, as filtering the roster on either team returns them. names is
+    full names, then football names, first + last names and last names, with
+    case-insensitive duplicates removed (first one wins). index (over names) and
+    full_name_index (over the distinct full names) are NameIndexes built on first use.
+    """
+
+    def __init__(self, rows: Dict[str, list], matcher: NameMatcher):
+        self.full_names = rows['full_name']
+        self.football_names = rows['football_name']
+        self.first_names = rows['first_name']
+        self.last_names = rows['last_name']
+        self.positions = rows['position']
+        self.gsis_ids = rows['gsis_id']
+
+        candidate_names = []
+        candidate_names.extend([n for n in self.full_names if n])
+        candidate_names.extend([fn for fn in self.football_names if fn])
+        candidate_names.extend([f"{fn} {ln}" for fn, ln in zip(self.first_names, self.last_names) if fn and ln])
+        candidate_names.extend([ln for ln in self.last_names if ln])
+
+        seen = set()
+        self.names = []
+        for name in candidate_names:
+            lowered = name.lower()
+            if lowered not in seen:
+                seen.add(lowered)
+                self.names.append(name)
+        self.matcher = matcher
+        self._index = None
+        self._full_name_index = None
+
+        # Lowercase full name -> full name (last row wins), full name -> first row
+        self.full_name_map = {n.lower(): n for n in self.full_names if n}
+        # gsis_id -> full name (first row wins), for ID lookups such as reviewed aliases
+        self.id_names = {}
+        for gsis_id, full in zip(self.gsis_ids, self.full_names):
+            if gsis_id and full:
+                self.id_names.setdefault(gsis_id, full)
+        self._full_name_rows = {}
+        # Lowercase last name / first name (periods removed) -> row positions
+        self.last_name_rows = {}
+        self.first_name_rows = {}
+        for i, (full, first, last) in enumerate(zip(self.full_names, self.first_names, self.last_names)):
+            if full:
+                self._full_name_rows.setdefault(full, i)
+            if last:
+                self.last_name_rows.setdefault(last.lower(), []).append(i)
+            if first:
+                self.first_name_rows.setdefault(first.lower().replace('.', ''), []).append(i)
+
+    def __len__(self):
+        return len(self.full_names)
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = self.matcher.build_index(self.names)
+        return self._index
+
+    @property
+    def full_name_index(self):
+        if self._full_name_index is None:
+            self._full_name_index = self.matcher.build_index(list(self._full_name_rows))
+        return self._full_name_index
+
+    def player(self, full_name: str) -> Optional[dict]:
+        """
+        {'full_name', 'position', 'gsis_id'} for the first roster row with this full name.
+        """
+        i = self._full_name_rows.get(full_name)
+        if i is None:
+            return None
+        return {'full_name': self.full_names[i], 'position': self.positions[i], 'gsis_id': self.gsis_ids[i]}
+
+
+class RosterCandidateIndex:
+    """
+    A season roster split by team; GameCandidates per team pairing are built on demand.
+    """
+
+    def __init__(self, roster_df: Optional[pl.DataFrame], matcher: Optional[NameMatcher] = None):
+        self.matcher = matcher or NameMatcher()
+        self._columns = {}
+        self._team_rows = {}
+        self._games = {}
+        self._lock = threading.Lock()
+
+        height = roster_df.height if roster_df is not None else 0
+        for column in ROSTER_COLUMNS:
+            if height and column in roster_df.columns:
+                self._columns[column] = roster_df[column].to_list()
+            else:
+                self._columns[column] = [None] * height
+
+        teams = roster_df['team'].to_list() if height and 'team' in roster_df.columns else []
+        for i, team in enumerate(teams):
+            self._team_rows.setdefault(team, []).append(i)
+
+    def teams(self) -> List[str]:
+        return list(self._team_rows)
+
+    def for_game(self, home_team: str, away_team: str) -> Optional[GameCandidates]:
+        """
+        Candidates for a game's two teams, or None if neither team has roster rows.
+        """
+        key = (home_team, away_team)
+        with self._lock:
+            if key in self._games:
+                return self._games[key]
+
+        rows = set(self._team_rows.get(home_team, ())) | set(self._team_rows.get(away_team, ()))
+        game = None
+        if rows:
+            rows = sorted(rows)
+            game = GameCandidates(
+                {column: [values[i] for i in rows] for column, values in self._columns.items()},
+                self.matcher
+            )
+
+        with self._lock:
+            return self._games.setdefault(key, game)
+
+
+def get_roster_candidates(season: int) -> RosterCandidateIndex:
+    """
+    The season's RosterCandidateIndex, built once per loaded season (kept with the
+    data loader's season cache, so it is rebuilt when the roster file changes).
+    """
+    return get_season_artifact(
+        season, 'roster_candidates',
+        lambda schedule_df, pbp_df, roster_df: RosterCandidateIndex(roster_df)
+    )
@@ -9,20 +9,21 @@ from sqlalchemy.orm import joinedload
 from nfl_core.stats import (
     get_first_td_scorers, 
     get_player_season_stats, 
+    get_player_season_stats_windows,
     calculate_defense_rankings,
-    get_red_zone_stats,
-    get_opening_drive_stats,
-    get_team_red_zone_splits,
+    get_situational_stats,
     identify_funnel_defenses,
     calculate_fair_odds,
     get_player_position,
     calculate_kelly_criterion
 )
 from nfl_core.config import API_KEY, MARKET_1ST_TD
+from nfl_core.players import get_player_index
 from datetime import datetime
 from .data_loader import load_data_with_cache_web, get_current_nfl_week, get_all_td_scorers
 from .odds_fetcher import get_odds_api_event_ids_for_season, fetch_odds_data, get_best_odds_for_game
-from .services.grading_service import GradingService
+from .services.grading_service import submit_grading_job
+from .services.job_runner import Job
 from .services.match_review_service import MatchReviewService
 import polars as pl
 
@@ -78,13 +79,15 @@ def get_nfl_stats_data(season=2025, use_cache=True):
     
     # Calculate statistics
     first_td_map = get_first_td_scorers(pbp_df, target_game_ids=season_game_ids, roster_df=roster_df)
-    player_stats_recent = get_player_season_stats(schedule_df, first_td_map, last_n_games=5)  # For Recent Form
-    player_stats_full = get_player_season_stats(schedule_df, first_td_map, last_n_games=None)  # For full season data
+    player_stats_windows = get_player_season_stats_windows(schedule_df, first_td_map, windows=(5, None))
+    player_stats_recent = player_stats_windows[5]  # For Recent Form
+    player_stats_full = player_stats_windows[None]  # For full season data
     defense_rankings = calculate_defense_rankings(schedule_df, first_td_map, roster_df)
     funnel_defenses = identify_funnel_defenses(defense_rankings) or {}
-    rz_stats = get_red_zone_stats(pbp_df, roster_df) or {}
-    od_stats = get_opening_drive_stats(pbp_df, roster_df) or {}
-    team_rz_splits = get_team_red_zone_splits(pbp_df) or {}
+    situational_stats = get_situational_stats(pbp_df, roster_df)
+    rz_stats = situational_stats['rz_stats']
+    od_stats = situational_stats['od_stats']
+    team_rz_splits = situational_stats['team_rz_splits']
     
     return {
         'schedule_df': schedule_df,
@@ -235,6 +238,26 @@ def week_view(week_num, season):
                          games=games_data,
                          available_weeks=available_weeks)
 
+def flash_grading_job(job, created, label):
+    """Flash the outcome of a grading job (its result when it already finished, e.g. inline in tests)"""
+    if not created:
+        flash(f'{label} is already being graded (job {job.id})', 'info')
+    elif job.status == Job.FAILED:
+        flash(f'Error grading: {job.error}', 'danger')
+    elif job.done:
+        result = job.result
+        if not result['success']:
+            flash(result['error'], 'warning')
+        else:
+            total = result['total_graded']
+            won = result['total_won']
+            lost = result['total_lost']
+            review = result['total_needs_review']
+            level = 'warning' if review > 0 else 'success'
+            flash(f'{label}: graded {total} picks, {won} wins, {lost} losses, {review} need review', level)
+    else:
+        flash(f'{label} is being graded in the background (job {job.id}). Refresh to see results.', 'info')
+
 @bp.route('/admin/grade/<int:week_num>', methods=['POST'])
 @login_required
 @admin_required
@@ -245,27 +268,11 @@ def grade_week_route(week_num):
     season = int(season_str) if season_str and season_str.strip() else 2025
     
     try:
-        # Use grading service
-        grading_service = GradingService()
-        result = grading_service.grade_week(week_num, season)
-        
-        if not result['success']:
-            flash(result['error'], 'warning')
-            return redirect(url_for('main.week_view', week_num=week_num, season=season))
-        
-        # Build flash message
-        total = result['total_graded']
-        won = result['total_won']
-        lost = result['total_lost']
-        review = result['total_needs_review']
-        games = result['games_graded']
-        ftd = result['ftd']['graded']
-        atts = result['atts']['graded']
-        
-        if review > 0:
-            flash(f'Graded {total} picks across {games} games: {won} wins, {lost} losses, {review} need review (FTD: {ftd}, ATTS: {atts})', 'warning')
-        else:
-            flash(f'Graded {total} picks across {games} games: {won} wins, {lost} losses (FTD: {ftd}, ATTS: {atts})', 'success')
+        # Grade in the background; the job can be polled at /api/jobs/<id>
+        job, created = submit_grading_job(
+            'grade_week', week_num, season, description=f'Grade week {week_num} ({season})'
+        )
+        flash_grading_job(job, created, f'Week {week_num}')
         
     except Exception as e:
         flash(f'Error grading week: {str(e)}', 'danger')
@@ -297,24 +304,13 @@ def grade_current_week():
         return redirect(url_for('main.index'))
     
     try:
-        # Use grading service (same as grade_week_route)
-        grading_service = GradingService()
-        result = grading_service.grade_week(week_to_grade, season, use_cache=False)
-        
-        if not result['success']:
-            flash(result['error'], 'warning')
-            return redirect(url_for('main.index'))
-        
-        # Build flash message
-        total = result['total_graded']
-        won = result['total_won']
-        lost = result['total_lost']
-        review = result['total_needs_review']
-        
-        if review > 0:
-            flash(f'Graded Week {week_to_grade}: {total} picks, {won} wins, {lost} losses, {review} need review', 'warning')
-        else:
-            flash(f'Graded Week {week_to_grade}: {total} picks, {won} wins, {lost} losses', 'success')
+        # Grade in the background with fresh data (use_cache is part of the job key, so this
+        # doesn't coalesce onto a cached grade of the same week)
+        job, created = submit_grading_job(
+            'grade_week', week_to_grade, season, use_cache=False,
+            description=f'Grade week {week_to_grade} ({season})'
+        )
+        flash_grading_job(job, created, f'Week {week_to_grade}')
         
     except Exception as e:
         flash(f'Error grading: {str(e)}', 'danger')
@@ -331,28 +327,11 @@ def grade_all_weeks():
     season = int(season_str) if season_str and season_str.strip() else 2025
     
     try:
-        # Use grading service
-        grading_service = GradingService()
-        result = grading_service.grade_all_weeks(season)
-        
-        if not result['success']:
-            flash(result['error'], 'warning')
-            return redirect(request.referrer or url_for('main.index'))
-        
-        # Build flash message
-        total = result['total_graded']
-        won = result['total_won']
-        lost = result['total_lost']
-        review = result['total_needs_review']
-        games = result['games_graded']
-        weeks = len(result['weeks_graded'])
-        ftd = result['ftd']['graded']
-        atts = result['atts']['graded']
-        
-        if review > 0:
-            flash(f'Graded {total} picks across {games} games in {weeks} weeks: {won} wins, {lost} losses, {review} need review (FTD: {ftd}, ATTS: {atts})', 'warning')
-        else:
-            flash(f'Graded {total} picks across {games} games in {weeks} weeks: {won} wins, {lost} losses (FTD: {ftd}, ATTS: {atts})', 'success')
+        # Grade in the background; the job can be polled at /api/jobs/<id>
+        job, created = submit_grading_job(
+            'grade_all_weeks', season, description=f'Re-grade all weeks ({season})'
+        )
+        flash_grading_job(job, created, f'All weeks of {season}')
         
     except Exception as e:
         flash(f'Error grading all weeks: {str(e)}', 'danger')
@@ -547,7 +526,9 @@ def edit_pick(pick_id):
                 flash('Player name and odds are required', 'danger')
                 return redirect(url_for('main.edit_pick', pick_id=pick_id))
             
-            # Update pick
+            # Update pick (a renamed pick is graded by name until it is resolved again)
+            if player_name != pick.player_name:
+                pick.player_gsis_id = None
             pick.player_name = player_name
             pick.pick_type = pick_type
             pick.odds = int(odds)
@@ -679,9 +660,10 @@ def best_bets_scanner(season):
         player_stats = get_player_season_stats(schedule_df, first_td_map, last_n_games=5)
         defense_rankings = calculate_defense_rankings(schedule_df, first_td_map, roster_df)
         funnel_defenses = identify_funnel_defenses(defense_rankings) or {}
-        rz_stats = get_red_zone_stats(pbp_df, roster_df) or {}
-        od_stats = get_opening_drive_stats(pbp_df, roster_df) or {}
-        team_rz_splits = get_team_red_zone_splits(pbp_df) or {}
+        situational_stats = get_situational_stats(pbp_df, roster_df)
+        rz_stats = situational_stats['rz_stats']
+        od_stats = situational_stats['od_stats']
+        team_rz_splits = situational_stats['team_rz_splits']
         
         # Get odds API event mappings
         print("Fetching odds event IDs...")
@@ -853,6 +835,7 @@ def analysis_page(season):
         rz_stats = stats_data['rz_stats']
         od_stats = stats_data['od_stats']
         team_rz_splits = stats_data['team_rz_splits']
+        player_index = get_player_index(roster_df)
         
         if schedule_df.height == 0:
             return render_template('analysis.html',
@@ -876,17 +859,11 @@ def analysis_page(season):
             stats_recent = player_stats_recent.get(player_name, {'first_tds': 0, 'team_games': 0})
             
             player_id = stats_full.get('player_id', '')
-            position = get_player_position(player_id, player_name, roster_df)
+            position = get_player_position(player_id, player_name, player_index)
             
             # Get team from roster
-            team = '?'
-            if roster_df is not None and roster_df.height > 0:
-                player_rows = roster_df.filter(
-                    (pl.col('gsis_id') == player_id) |
-                    (pl.col('full_name').str.to_lowercase() == player_name.lower())
-                )
-                if player_rows.height > 0:
-                    team = player_rows[0, 'team'] if 'team' in player_rows.columns else '?'
+            roster_entry = player_index.lookup(player_id, player_name)
+            team = (roster_entry['team'] if roster_entry else None) or '?'
             
             # First TD history (get games where this player scored first TD)
             ftd_games = []
@@ -1397,6 +1374,13 @@ def standardize_picks(season):
                     roster_names.append(full_name)
                     roster_lookup[full_name] = position
         
+        # Match every distinct pick name against the roster in one batch
+        roster_matches = {}
+        if roster_names:
+            roster_matches = matcher.batch_match(
+                [pick.player_name.strip() for pick in picks], roster_names, min_score=0.70
+            )
+        
         for pick in picks:
             changes = {}
             
@@ -1405,7 +1389,7 @@ def standardize_picks(season):
             
             if roster_df is not None and not roster_df.is_empty():
                 # Always use fuzzy matcher to find best match
-                match_result = matcher.find_best_match(player_name, roster_names, min_score=0.70)
+                match_result = roster_matches.get(player_name)
                 
                 if match_result and match_result['confidence'] in ['high', 'exact']:
                     suggested_name = match_result['matched_name']
@@ -1476,6 +1460,7 @@ def apply_standardization():
             
             if 'player_name' in changes:
                 pick.player_name = changes['player_name']['suggested']
+                pick.player_gsis_id = None
             
             if 'player_position' in changes:
                 pick.player_position = changes['player_position']['suggested']
@@ -2,8 +2,17 @@
 Service layer for business logic.
 Keeps routes thin and logic testable.
 """
-from .grading_service import GradingService
+from .alias_service import AliasService
+from .grading_service import GradingService, submit_grading_job
+from .job_runner import Job, JobRunner, job_runner
+from .live_grading_service import LiveGradingService
 from .match_review_service import MatchReviewService
+from .schedule_service import ScheduleService
 from .stats_service import StatsService
+from .week_detail_service import WeekDetailService
 
-__all__ = ['GradingService', 'MatchReviewService', 'StatsService']
+__all__ = [
+    'AliasService', 'GradingService', 'submit_grading_job', 'LiveGradingService', 'MatchReviewService', 'ScheduleService',
+    'StatsService', 'WeekDetailService',
+    'Job', 'JobRunner', 'job_runner'
+]
@@ -0,0 +1,157 @@
+"""
+Alias service - reuses match review decisions as player name aliases
+Approved reviews become aliases (pick name → player) that match before any
+fuzzy scoring; rejected reviews become pairs that are never matched again.
+"""
+from datetime import datetime
+from nfl_core.players import get_player_index
+from ..models import PlayerAlias
+from .. import db
+from ..data_loader import load_cached_roster
+from ..fuzzy_matcher import NameMatcher, NameIndex
+
+
+class AliasService:
+    """Player alias lookups; each pick name's aliases are read once per instance"""
+
+    def __init__(self, matcher=None):
+        """
+        Initialize alias service
+
+        Args:
+            matcher: NameMatcher used for normalization and fuzzy fallback (optional)
+        """
+        self.matcher = matcher or NameMatcher()
+        self._approved = {}  # alias -> {normalized player name: (player name, gsis_id)}
+        self._rejected = {}  # alias -> {normalized player name}
+        self._loaded = set()  # aliases already read (with or without rows)
+
+    def prefetch(self, pick_names):
+        """Read the aliases for these pick names that aren't loaded yet (one query)"""
+        aliases = {self.matcher.normalize_name(name) for name in pick_names if name} - self._loaded
+        if not aliases:
+            return
+        self._loaded.update(aliases)
+
+        rows = db.session.query(
+            PlayerAlias.alias, PlayerAlias.player_name, PlayerAlias.gsis_id, PlayerAlias.is_match
+        ).filter(PlayerAlias.alias.in_(aliases))
+        for alias, player_name, gsis_id, is_match in rows:
+            key = self.matcher.normalize_name(player_name)
+            if is_match:
+                self._approved.setdefault(alias, {})[key] = (player_name, gsis_id)
+            else:
+                self._rejected.setdefault(alias, set()).add(key)
+
+    def approved_players(self, pick_name):
+        """Return the player names approved for a pick name (empty if none)"""
+        self.prefetch([pick_name])
+        approved = self._approved.get(self.matcher.normalize_name(pick_name), {})
+        return [player_name for player_name, _ in approved.values()]
+
+    def find_best_match(self, pick_name, scorer_names, min_score=0.0, scorer_ids=None):
+        """
+        NameMatcher.find_best_match that applies reviewed aliases first
+
+        A player approved for this pick name is returned as an exact, auto-accepted
+        match without scoring when it is among the candidates: by gsis_id when the
+        alias has one and scorer_ids is given, else by normalized name. Names
+        rejected for the pick name are dropped from the fuzzy matching shortlist.
+
+        Args:
+            pick_name: The player name from the pick
+            scorer_names: Candidate names, or a NameIndex over them
+            min_score: Minimum acceptable fuzzy score
+            scorer_ids: Optional dict of gsis_id -> name covering the candidates
+
+        Returns:
+            Match dict as returned by NameMatcher.find_best_match, or None; alias
+            matches also carry the alias's 'player_name' and 'gsis_id'
+        """
+        if not pick_name:
+            return None
+
+        alias = self.matcher.normalize_name(pick_name)
+        if alias not in self._loaded:
+            self.prefetch([pick_name])
+
+        for key, (player_name, gsis_id) in self._approved.get(alias, {}).items():
+            if gsis_id and scorer_ids is not None:
+                name = (scorer_ids[gsis_id] or player_name) if gsis_id in scorer_ids else None
+            elif isinstance(scorer_names, NameIndex):
+                name = scorer_names.find(key)
+            else:
+                name = next((n for n in scorer_names if self.matcher.normalize_name(n) == key), None)
+            if name:
+                return {
+                    'matched_name': name,
+                    'score': 1.0,
+                    'confidence': 'exact',
+                    'reason': f"Approved alias: '{pick_name}' → '{name}'",
+                    'auto_accept': True,
+                    'player_name': player_name,
+                    'gsis_id': gsis_id
+                }
+
+        return self.matcher.find_best_match(pick_name, scorer_names, min_score, exclude=self._rejected.get(alias))
+
+    def batch_match(self, pick_names, scorer_names, min_score=0.0, scorer_ids=None):
+        """
+        NameMatcher.batch_match with reviewed aliases applied (see find_best_match)
+
+        Returns:
+            Dictionary mapping pick_name -> match_result
+        """
+        index = scorer_names if isinstance(scorer_names, NameIndex) else self.matcher.build_index(scorer_names)
+        self.prefetch(pick_names)
+
+        results = {}
+        for pick_name in pick_names:
+            if pick_name not in results:
+                results[pick_name] = self.find_best_match(pick_name, index, min_score, scorer_ids=scorer_ids)
+        return results
+
+    @staticmethod
+    def record_review(match, approved, reviewed_by=None, rosters=None):
+        """
+        Store a reviewed MatchDecision as an alias (approved) or a rejected pair
+
+        Adds the row to the session; the caller commits.
+
+        Args:
+            match: Reviewed MatchDecision
+            approved: True if the match was approved, False if rejected
+            reviewed_by: Username of reviewer
+            rosters: Optional dict of season -> cached roster, shared across calls
+
+        Returns:
+            PlayerAlias instance
+        """
+        alias = NameMatcher().normalize_name(match.pick_name)
+        entry = PlayerAlias.query.filter_by(alias=alias, player_name=match.scorer_name).first()
+        if entry is None:
+            entry = PlayerAlias(alias=alias, player_name=match.scorer_name)
+            db.session.add(entry)
+
+        entry.is_match = approved
+        entry.reviewed_by = reviewed_by
+        entry.updated_at = datetime.utcnow()
+        if approved and not entry.gsis_id:
+            entry.gsis_id = AliasService._roster_gsis_id(match, {} if rosters is None else rosters)
+        return entry
+
+    @staticmethod
+    def forget_review(match):
+        """Remove the alias (or rejected pair) learned from a reverted MatchDecision"""
+        alias = NameMatcher().normalize_name(match.pick_name)
+        PlayerAlias.query.filter_by(alias=alias, player_name=match.scorer_name).delete()
+
+    @staticmethod
+    def _roster_gsis_id(match, rosters):
+        # Only the cached roster is used; reviews never trigger a download
+        game = match.pick.game if match.pick else None
+        if game is None:
+            return None
+        if game.season not in rosters:
+            rosters[game.season] = load_cached_roster(game.season)
+        return get_player_index(rosters[game.season]).gsis_id_for_name(match.scorer_name)
@@ -2,12 +2,24 @@
 Grading service - handles all pick grading logic
 Consolidates duplicate grading code from routes.py
 """
+import inspect
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from ..models import Game, Pick, MatchDecision
+from sqlalchemy import insert, update, func
+from ..models import Game, Pick, MatchDecision, MatchScoreMemo, GradingWatermark
 from .. import db
-from ..data_loader import load_data_with_cache_web, get_current_nfl_week, get_all_td_scorers
+from ..data_loader import load_data_with_cache_web, get_current_nfl_week, get_all_td_scorers, get_pbp_manifest
 from nfl_core.stats import get_first_td_scorers
 from ..fuzzy_matcher import NameMatcher
+from .alias_service import AliasService
+from .job_runner import job_runner
+
+
+def _report(progress, message, fraction):
+    """Forward a progress update to an optional job progress callback"""
+    if progress is not None:
+        progress(message, fraction)
 
 
 class GradingService:
@@ -21,10 +33,15 @@ class GradingService:
             auto_accept_threshold: Confidence score to auto-accept matches (default 0.85)
             medium_confidence_threshold: Minimum score to flag for review (default 0.70)
         """
-        self.matcher = NameMatcher(auto_accept_threshold=auto_accept_threshold)
+        self.matcher = NameMatcher(auto_accept_threshold=auto_accept_threshold, score_memo={})
+        # Reviewed aliases are checked before any fuzzy scoring
+        self.aliases = AliasService(self.matcher)
         self.medium_threshold = medium_confidence_threshold
+        # Pick names already looked up in match_score_memo, and name pairs stored there
+        self._memo_pick_names = set()
+        self._stored_scores = set()
     
-    def grade_week(self, week_num, season=2025, use_cache=None, force_regrade=False):
+    def grade_week(self, week_num, season=2025, use_cache=None, force_regrade=False, progress=None):
         """
         Grade all picks for a specific week
         
@@ -33,6 +50,7 @@ class GradingService:
             season: NFL season year
             use_cache: Whether to use cached data (None = auto-detect)
             force_regrade: If True, re-grade already graded picks
+            progress: Optional callback(message, fraction) for job progress
             
         Returns:
             dict with grading results and statistics
@@ -42,8 +60,11 @@ class GradingService:
             current_week = get_current_nfl_week(season)
             use_cache = (week_num < current_week)
         
-        # Load NFL data
-        schedule_df, pbp_df, roster_df = load_data_with_cache_web(season, use_cache=use_cache)
+        # Load NFL data (a fresh download only rewrites this week's PBP partition)
+        _report(progress, 'Loading NFL data', 0.0)
+        schedule_df, pbp_df, roster_df = load_data_with_cache_web(
+            season, use_cache=use_cache, refresh_weeks=None if use_cache else [week_num]
+        )
         
         # Get games for this week
         games = Game.query.filter_by(week=week_num, season=season).all()
@@ -66,9 +87,11 @@ class GradingService:
             }
         
         # Grade FTD picks
+        _report(progress, 'Grading FTD picks', 0.4)
         ftd_results = self._grade_ftd_picks(games, first_td_map, force_regrade=force_regrade)
         
         # Grade ATTS picks
+        _report(progress, 'Grading ATTS picks', 0.7)
         all_td_map = get_all_td_scorers(pbp_df, target_game_ids=game_ids, roster_df=roster_df)
         atts_results = self._grade_atts_picks(games, all_td_map, force_regrade=force_regrade) if all_td_map else {
             'graded': 0, 'won': 0, 'lost': 0, 'needs_review': 0
@@ -90,18 +113,24 @@ class GradingService:
             'total_needs_review': ftd_results['needs_review'] + atts_results['needs_review']
         }
     
-    def grade_all_weeks(self, season=2025, force_regrade=True):
+    def grade_all_weeks(self, season=2025, force_regrade=True, progress=None, incremental=False):
         """
         Grade all weeks for a season
         
         Args:
             season: NFL season year
             force_regrade: If True, re-grade already graded picks (default True for this method)
+            progress: Optional callback(message, fraction) for job progress
+            incremental: If True, only grade what changed since the last run (see grade_incremental)
             
         Returns:
             dict with grading results and statistics
         """
+        if incremental:
+            return self.grade_incremental(season, progress=progress)
+        
         # Always use cached data for bulk grading (more efficient)
+        _report(progress, 'Loading NFL data', 0.0)
         schedule_df, pbp_df, roster_df = load_data_with_cache_web(season, use_cache=True)
         
         # Get all games
@@ -125,9 +154,11 @@ class GradingService:
             }
         
         # Grade FTD picks
+        _report(progress, 'Grading FTD picks', 0.4)
         ftd_results = self._grade_ftd_picks(all_games, first_td_map, force_regrade=force_regrade)
         
         # Grade ATTS picks
+        _report(progress, 'Grading ATTS picks', 0.7)
         all_td_map = get_all_td_scorers(pbp_df, target_game_ids=game_ids, roster_df=roster_df)
         atts_results = self._grade_atts_picks(all_games, all_td_map, force_regrade=force_regrade) if all_td_map else {
             'graded': 0, 'won': 0, 'lost': 0, 'needs_review': 0
@@ -152,7 +183,106 @@ class GradingService:
             'total_needs_review': ftd_results['needs_review'] + atts_results['needs_review']
         }
     
-    def grade_by_pick_type(self, pick_type, season=2025, use_cache=True, force_regrade=False):
+    def grade_incremental(self, season=2025, use_cache=True, progress=None, refresh_weeks=None):
+        """
+        Grade only what changed since the season's grading watermark
+        
+        Games in weeks whose PBP partition fingerprint changed are re-graded, and
+        games with picks created since the last run get those picks graded. The
+        first run for a season (no watermark yet) grades every week.
+        
+        Args:
+            season: NFL season year
+            use_cache: Whether to use cached data (with the cache only, fingerprints
+                change only when something else refreshes the PBP)
+            progress: Optional callback(message, fraction) for job progress
+            refresh_weeks: Weeks to re-download when use_cache is False (None = the
+                whole season)
+            
+        Returns:
+            dict with grading results and statistics (same keys as grade_all_weeks)
+        """
+        _report(progress, 'Loading NFL data', 0.0)
+        schedule_df, pbp_df, roster_df = load_data_with_cache_web(
+            season, use_cache=use_cache, refresh_weeks=None if use_cache else refresh_weeks
+        )
+        
+        manifest = get_pbp_manifest(season)
+        fingerprints = {week: entry['fingerprint'] for week, entry in manifest.get('weeks', {}).items()}
+        
+        watermark = GradingWatermark.query.filter_by(season=season).first()
+        seen = watermark.get_week_fingerprints() if watermark else {}
+        last_pick_id = watermark.last_pick_id if watermark else 0
+        # Read before grading so picks added during this run are picked up next time
+        max_pick_id = db.session.query(func.max(Pick.id)).scalar() or 0
+        
+        # Without a manifest there is nothing to compare against, so every week counts as changed
+        if watermark is None or not fingerprints:
+            changed_weeks = None
+        else:
+            changed_weeks = sorted(int(week) for week, fp in fingerprints.items() if seen.get(week) != fp)
+        
+        _report(progress, 'Finding changed games', 0.2)
+        changed_query = Game.query.filter(Game.season == season)
+        if changed_weeks is not None:
+            changed_query = changed_query.filter(Game.week.in_(changed_weeks))
+        changed_games = changed_query.all()
+        changed_ids = {g.id for g in changed_games}
+        
+        new_pick_games = [
+            g for g in db.session.query(Game).join(Pick).filter(
+                Game.season == season,
+                Pick.id > last_pick_id
+            ).distinct().all()
+            if g.id not in changed_ids
+        ]
+        
+        games = changed_games + new_pick_games
+        game_ids = [g.game_id for g in games]
+        first_td_map = get_first_td_scorers(pbp_df, target_game_ids=game_ids, roster_df=roster_df) if games else {}
+        all_td_map = get_all_td_scorers(pbp_df, target_game_ids=game_ids, roster_df=roster_df) if games else {}
+        
+        # Changed weeks are re-graded; elsewhere only the new (ungraded) picks are
+        _report(progress, 'Grading FTD picks', 0.4)
+        ftd_results = _sum_results(
+            self._grade_ftd_picks(changed_games, first_td_map, force_regrade=True),
+            self._grade_ftd_picks(new_pick_games, first_td_map, force_regrade=False)
+        )
+        _report(progress, 'Grading ATTS picks', 0.7)
+        atts_results = _sum_results(
+            self._grade_atts_picks(changed_games, all_td_map, force_regrade=True),
+            self._grade_atts_picks(new_pick_games, all_td_map, force_regrade=False)
+        )
+        
+        if watermark is None:
+            watermark = GradingWatermark(season=season)
+            db.session.add(watermark)
+        watermark.pbp_version = manifest.get('version', 0)
+        watermark.set_week_fingerprints(fingerprints)
+        watermark.last_pick_id = max_pick_id
+        watermark.games_graded = len(games)
+        watermark.graded_at = datetime.utcnow()
+        
+        db.session.commit()
+        
+        return {
+            'success': True,
+            'mode': 'incremental',
+            'season': season,
+            'pbp_version': watermark.pbp_version,
+            'changed_weeks': changed_weeks if changed_weeks is not None else sorted(set(g.week for g in changed_games)),
+            'games_checked': len(games),
+            'weeks_graded': sorted(set(g.week for g in games if g.game_id in first_td_map)),
+            'games_graded': ftd_results['games_graded'],
+            'ftd': ftd_results,
+            'atts': atts_results,
+            'total_graded': ftd_results['graded'] + atts_results['graded'],
+            'total_won': ftd_results['won'] + atts_results['won'],
+            'total_lost': ftd_results['lost'] + atts_results['lost'],
+            'total_needs_review': ftd_results['needs_review'] + atts_results['needs_review']
+        }
+    
+    def grade_by_pick_type(self, pick_type, season=2025, use_cache=True, force_regrade=False, progress=None):
         """
         Grade all pending picks of a specific type for a season
         
@@ -161,6 +291,7 @@ class GradingService:
             season: NFL season year
             use_cache: Whether to use cached data
             force_regrade: If True, re-grade already graded picks
+            progress: Optional callback(message, fraction) for job progress
             
         Returns:
             dict with grading results and statistics
@@ -172,6 +303,7 @@ class GradingService:
             }
         
         # Load NFL data
+        _report(progress, 'Loading NFL data', 0.0)
         schedule_df, pbp_df, roster_df = load_data_with_cache_web(season, use_cache=use_cache)
         
         # Get all games that have pending picks of this type
@@ -196,6 +328,7 @@ class GradingService:
         game_ids = [g.game_id for g in games_with_pending]
         
         # Grade based on pick type
+        _report(progress, f'Grading {pick_type} picks', 0.5)
         if pick_type == 'FTD':
             # Get first TD scorers
             first_td_map = get_first_td_scorers(pbp_df, target_game_ids=game_ids, roster_df=roster_df)
@@ -236,24 +369,163 @@ class GradingService:
             'needs_review': results.get('needs_review', 0)
         }
     
-    def _grade_ftd_picks(self, games, first_td_map, force_regrade=False):
-        """Grade First TD picks for given games"""
+    def _load_picks(self, games, pick_type):
+        """Load every pick of a type for the given games in one query, grouped by game id"""
+        game_ids = [g.id for g in games]
+        picks_by_game = {game_id: [] for game_id in game_ids}
+        if not game_ids:
+            return picks_by_game
+        
+        picks = Pick.query.filter(
+            Pick.game_id.in_(game_ids),
+            Pick.pick_type == pick_type
+        ).order_by(Pick.id).all()
+        for pick in picks:
+            picks_by_game[pick.game_id].append(pick)
+        return picks_by_game
+    
+    def _load_score_memo(self, picks_by_game):
+        """Preload stored match scores for the pick names about to be graded (one query)"""
+        pick_names = {pick.player_name.strip() for picks in picks_by_game.values() for pick in picks}
+        pick_names -= self._memo_pick_names
+        if not pick_names:
+            return
+        self._memo_pick_names.update(pick_names)
+        
+        rows = db.session.query(
+            MatchScoreMemo.pick_name, MatchScoreMemo.scorer_name,
+            MatchScoreMemo.match_score, MatchScoreMemo.match_reason
+        ).filter(
+            MatchScoreMemo.pick_name.in_(pick_names),
+            MatchScoreMemo.scorer_version == self.matcher.SCORER_VERSION
+        ).all()
+        for pick_name, scorer_name, score, reason in rows:
+            self.matcher.score_memo[(pick_name, scorer_name)] = (score, reason)
+            self._stored_scores.add((pick_name, scorer_name))
+    
+    @staticmethod
+    def clear_score_memo(stale_only=False):
+        """
+        Delete stored match scores; the next grade re-scores those name pairs
+        
+        Adds the delete to the session; the caller commits.
+        
+        Args:
+            stale_only: Only delete scores from other NameMatcher.SCORER_VERSIONs
+        
+        Returns:
+            int: Number of stored scores deleted
+        """
+        query = MatchScoreMemo.query
+        if stale_only:
+            query = query.filter(MatchScoreMemo.scorer_version != NameMatcher.SCORER_VERSION)
+        return query.delete(synchronize_session=False)
+    
+    def _save_score_memo(self):
+        """Store match scores computed since the last save"""
+        new_keys = [key for key in self.matcher.score_memo if key not in self._stored_scores]
+        if not new_keys:
+            return
+        
+        now = datetime.utcnow()
+        rows = []
+        for pick_name, scorer_name in new_keys:
+            score, reason = self.matcher.score_memo[(pick_name, scorer_name)]
+            rows.append({
+                'pick_name': pick_name,
+                'scorer_name': scorer_name,
+                'scorer_version': self.matcher.SCORER_VERSION,
+                'match_score': score,
+                'confidence': self.matcher.get_confidence(score),
+                'match_reason': reason,
+                'created_at': now
+            })
+        db.session.execute(_insert_ignoring_duplicates(MatchScoreMemo), rows)
+        self._stored_scores.update(new_keys)
+    
+    def _upsert_match_decisions(self, match_decisions):
+        """
+        Keep one MatchDecision per pick: update the pick's existing row, insert otherwise.
+        A manual review is kept when the pick still matches the same scorer.
+        """
+        existing = {
+            decision.pick_id: decision
+            for decision in MatchDecision.query.filter(
+                MatchDecision.pick_id.in_([d['pick_id'] for d in match_decisions])
+            )
+        }
+        
+        inserts = []
+        updates = []
+        for decision in match_decisions:
+            current = existing.get(decision['pick_id'])
+            if current is None:
+                inserts.append(decision)
+                continue
+            
+            same_match = (current.pick_name, current.scorer_name) == (decision['pick_name'], decision['scorer_name'])
+            row = {k: v for k, v in decision.items() if k != 'created_at'}
+            row.update({
+                'id': current.id,
+                'manual_decision': current.manual_decision if same_match else None,
+                'reviewed_by': current.reviewed_by if same_match else None,
+                'reviewed_at': current.reviewed_at if same_match else None
+            })
+            updates.append(row)
+        
+        if updates:
+            db.session.execute(update(MatchDecision), updates)
+        if inserts:
+            db.session.execute(insert(MatchDecision), inserts)
+    
+    def _persist_grades(self, pick_updates, match_decisions):
+        """
+        Write pick results, match decisions and new match scores with bulk statements
+        (the caller commits, so everything lands in one transaction)
+        """
+        if pick_updates:
+            db.session.execute(update(Pick), pick_updates)
+        if match_decisions:
+            self._upsert_match_decisions(match_decisions)
+        self._save_score_memo()
+    
+    def grade_first_td_games(self, games, first_td_map, force_regrade=False):
+        """
+        Grade First TD picks for several games in one pass (one picks query, one bulk write)
+        
+        Adds the updates to the session; the caller commits.
+        
+        Args:
+            games: Game instances to grade
+            first_td_map: {game_id: {'player', 'team', 'player_id', ...}}
+            force_regrade: Regrade picks that already have a result
+        
+        Returns:
+            dict: {game_id: {'graded', 'won', 'lost', 'needs_review'}} for each game graded
+        """
+        by_game = {}
+        self._grade_ftd_picks(games, first_td_map, force_regrade=force_regrade, by_game=by_game)
+        return by_game
+    
+    def _grade_ftd_picks(self, games, first_td_map, force_regrade=False, by_game=None):
+        """Grade First TD picks for given games (per-game counts go in by_game, if given)"""
         games_graded = 0
         picks_graded = 0
         picks_won = 0
         picks_lost = 0
         needs_review = 0
+        pick_updates = []
+        match_decisions = []
         
-        for game in games:
-            if game.game_id not in first_td_map:
-                continue
-            
+        graded_games = [g for g in games if (first_td_map.get(g.game_id) or {}).get('player', '').strip()]
+        picks_by_game = self._load_picks(graded_games, 'FTD')
+        self._load_score_memo(picks_by_game)
+        self.aliases.prefetch(pick.player_name.strip() for picks in picks_by_game.values() for pick in picks)
+        
+        for game in graded_games:
             td_data = first_td_map[game.game_id]
             actual_player = td_data.get('player', '').strip()
             
-            if not actual_player:
-                continue
-            
             # Update game
             game.actual_first_td_player = actual_player
             game.actual_first_td_team = td_data.get('team', '')
@@ -261,20 +533,27 @@ class GradingService:
             game.is_final = True
             
             # Grade picks
-            picks = Pick.query.filter_by(game_id=game.id, pick_type='FTD').all()
-            
-            for pick in picks:
+            game_counts = {'graded': 0, 'won': 0, 'lost': 0, 'needs_review': 0}
+            for pick in picks_by_game[game.id]:
                 if pick.graded_at and not force_regrade:
                     continue  # Skip already graded unless force_regrade is True
                 
-                result = self._grade_single_pick(pick, [actual_player], actual_player)
-                picks_graded += result['graded']
-                picks_won += result['won']
-                picks_lost += result['lost']
-                needs_review += result['needs_review']
+                result = self._grade_single_pick(pick, [actual_player], actual_player,
+                                                 pick_updates=pick_updates, match_decisions=match_decisions,
+                                                 scorer_ids=_scorer_ids([td_data]))
+                for key in game_counts:
+                    game_counts[key] += result[key]
             
+            picks_graded += game_counts['graded']
+            picks_won += game_counts['won']
+            picks_lost += game_counts['lost']
+            needs_review += game_counts['needs_review']
+            if by_game is not None:
+                by_game[game.game_id] = game_counts
             games_graded += 1
         
+        self._persist_grades(pick_updates, match_decisions)
+        
         return {
             'games_graded': games_graded,
             'graded': picks_graded,
@@ -289,32 +568,36 @@ class GradingService:
         picks_won = 0
         picks_lost = 0
         needs_review = 0
+        pick_updates = []
+        match_decisions = []
         
-        for game in games:
-            if game.game_id not in all_td_map:
-                continue
-            
+        graded_games = [g for g in games if all_td_map.get(g.game_id)]
+        picks_by_game = self._load_picks(graded_games, 'ATTS')
+        self._load_score_memo(picks_by_game)
+        self.aliases.prefetch(pick.player_name.strip() for picks in picks_by_game.values() for pick in picks)
+        
+        for game in graded_games:
             td_scorers = all_td_map[game.game_id]
             
-            if not td_scorers:
-                continue
-            
             # Extract scorer names for matching
             scorer_names = [s.get('player', '').strip() for s in td_scorers if s.get('player')]
+            scorer_ids = _scorer_ids(td_scorers)
             
             # Grade ATTS picks
-            atts_picks = Pick.query.filter_by(game_id=game.id, pick_type='ATTS').all()
-            
-            for pick in atts_picks:
+            for pick in picks_by_game[game.id]:
                 if pick.graded_at and not force_regrade:
                     continue
                 
-                result = self._grade_single_pick(pick, scorer_names)
+                result = self._grade_single_pick(pick, scorer_names,
+                                                 pick_updates=pick_updates, match_decisions=match_decisions,
+                                                 scorer_ids=scorer_ids)
                 picks_graded += result['graded']
                 picks_won += result['won']
                 picks_lost += result['lost']
                 needs_review += result['needs_review']
         
+        self._persist_grades(pick_updates, match_decisions)
+        
         return {
             'graded': picks_graded,
             'won': picks_won,
@@ -322,7 +605,8 @@ class GradingService:
             'needs_review': needs_review
         }
     
-    def _grade_single_pick(self, pick, scorer_names, matched_scorer=None):
+    def _grade_single_pick(self, pick, scorer_names, matched_scorer=None, pick_updates=None, match_decisions=None,
+                           scorer_ids=None):
         """
         Grade a single pick using fuzzy matching
         
@@ -330,36 +614,70 @@ class GradingService:
             pick: Pick model instance
             scorer_names: List of potential scorer names to match against
             matched_scorer: Optional specific scorer name for display (FTD only)
+            pick_updates: Optional list to collect Pick update rows for a bulk UPDATE
+                (if omitted, the pick is modified in the session directly)
+            match_decisions: Optional list to collect MatchDecision rows for a bulk upsert
+                (if omitted, the pick's MatchDecision is updated or added in the session)
+            scorer_ids: Optional dict of scorer gsis_id -> name covering every scorer;
+                picks with a player_gsis_id among them then win by ID without name
+                matching (a pick whose ID isn't there only goes to review on a name match)
             
         Returns:
             dict with grading counts
         """
         pick_player = pick.player_name.strip()
         
-        # Use fuzzy matcher
-        match_result = self.matcher.find_best_match(pick_player, scorer_names, min_score=0.0)
+        if pick.player_gsis_id and scorer_ids is not None and pick.player_gsis_id in scorer_ids:
+            # Resolved pick: a set-membership check, no name matching
+            match_result = {
+                'matched_name': scorer_ids[pick.player_gsis_id] or pick_player,
+                'score': 1.0,
+                'confidence': 'exact',
+                'reason': f"Player ID match ({pick.player_gsis_id})",
+                'auto_accept': True
+            }
+        elif pick.player_gsis_id and scorer_ids is not None:
+            # The ID was resolved by fuzzy matching when the pick was made and may be the
+            # wrong player (e.g. a shared name), so a name that still matches a scorer is
+            # sent to review rather than graded as a loss
+            match_result = self.aliases.find_best_match(pick_player, scorer_names, min_score=0.0,
+                                                        scorer_ids=scorer_ids)
+            if match_result:
+                match_result = dict(
+                    match_result,
+                    auto_accept=False,
+                    reason=f"{match_result['reason']} (pick resolved to {pick.player_gsis_id}, not a scorer)"[:200]
+                )
+        else:
+            # Use reviewed aliases, then the fuzzy matcher
+            match_result = self.aliases.find_best_match(pick_player, scorer_names, min_score=0.0,
+                                                        scorer_ids=scorer_ids)
         
         result = {'graded': 0, 'won': 0, 'lost': 0, 'needs_review': 0}
+        now = datetime.utcnow()
+        changes = None
         
         if match_result and match_result['score'] >= self.medium_threshold:
             # Create match decision record
-            match_decision = MatchDecision(
-                pick_id=pick.id,
-                pick_name=pick_player,
-                scorer_name=matched_scorer or match_result['matched_name'],
-                match_score=match_result['score'],
-                confidence=match_result['confidence'],
-                match_reason=match_result['reason'],
-                auto_accepted=match_result['auto_accept'],
-                needs_review=not match_result['auto_accept']
-            )
-            db.session.add(match_decision)
+            decision = {
+                'pick_id': pick.id,
+                'pick_name': pick_player,
+                'scorer_name': matched_scorer or match_result['matched_name'],
+                'match_score': match_result['score'],
+                'confidence': match_result['confidence'],
+                'match_reason': match_result['reason'],
+                'auto_accepted': match_result['auto_accept'],
+                'needs_review': not match_result['auto_accept'],
+                'created_at': now
+            }
+            if match_decisions is None:
+                self._upsert_match_decisions([decision])
+            else:
+                match_decisions.append(decision)
             
             # Auto-accept high confidence matches
             if match_result['auto_accept']:
-                pick.result = 'W'
-                pick.payout = pick.calculate_payout()
-                pick.graded_at = datetime.utcnow()
+                changes = {'result': 'W', 'payout': pick.calculate_payout('W'), 'graded_at': now}
                 result['graded'] = 1
                 result['won'] = 1
             else:
@@ -367,10 +685,104 @@ class GradingService:
                 result['needs_review'] = 1
         else:
             # No match or low confidence - mark as loss
-            pick.result = 'L'
-            pick.payout = -pick.stake
-            pick.graded_at = datetime.utcnow()
+            changes = {'result': 'L', 'payout': -pick.stake, 'graded_at': now}
             result['graded'] = 1
             result['lost'] = 1
         
+        if changes:
+            if pick_updates is None:
+                for key, value in changes.items():
+                    setattr(pick, key, value)
+            else:
+                pick_updates.append({'id': pick.id, **changes})
+        
         return result
+
+
+def _scorer_ids(td_scorers):
+    """
+    gsis_id -> scorer name for a game's TD scorers, or None if any scorer has no
+    ID (an unresolved scorer could be the pick's player, so names must be compared)
+    """
+    scorer_ids = {}
+    for scorer in td_scorers:
+        if not scorer.get('player_id'):
+            return None
+        scorer_ids[scorer['player_id']] = (scorer.get('player') or '').strip()
+    return scorer_ids
+
+
+def _sum_results(*results):
+    """Add up the counts of several _grade_*_picks results"""
+    totals = {}
+    for result in results:
+        for key, value in result.items():
+            totals[key] = totals.get(key, 0) + value
+    return totals
+
+
+def _insert_ignoring_duplicates(model):
+    """INSERT that skips rows hitting a unique constraint (SQLite/PostgreSQL)"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        return insert(model)
+    return dialect_insert(model).on_conflict_do_nothing()
+
+
+# One lock per season: grading jobs for a season write the same picks and match decisions
+_season_locks = {}
+_season_locks_guard = threading.Lock()
+
+
+@contextmanager
+def grading_lock(season, progress=None):
+    """
+    Hold the season's grading lock, so grading runs for a season happen one at a time
+    
+    Args:
+        season: NFL season year
+        progress: Optional callback(message, fraction), told when the run has to wait
+    """
+    with _season_locks_guard:
+        lock = _season_locks.setdefault(season, threading.Lock())
+    if not lock.acquire(blocking=False):
+        _report(progress, f'Waiting for another {season} grading run', 0.0)
+        lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+def submit_grading_job(method, *args, description=None, **kwargs):
+    """
+    Run GradingService.<method>(*args, **kwargs) on the background job runner
+    
+    The job key is built from the method, its positional arguments (week, season,
+    pick type) and its keyword options (use_cache, force_regrade, ...), so a second
+    request to grade the same thing the same way while the first is still queued or
+    running gets the existing job back. A request with different options (e.g. a
+    fresh-data grade while a cached one runs) is a separate job, but jobs for the
+    same season hold its grading_lock, so it waits for the first one to finish.
+    
+    Returns:
+        (job, created) from JobRunner.submit
+    """
+    key = ':'.join([
+        'grading', method,
+        *(str(arg) for arg in args),
+        *(f'{name}={value}' for name, value in sorted(kwargs.items()))
+    ])
+    bound = inspect.signature(getattr(GradingService, method)).bind(None, *args, **kwargs)
+    bound.apply_defaults()
+    season = bound.arguments['season']
+    
+    def run(*job_args, progress=None, **job_kwargs):
+        with grading_lock(season, progress):
+            return getattr(GradingService(), method)(*job_args, progress=progress, **job_kwargs)
+    
+    return job_runner.submit(key, run, *args, description=description, **kwargs)
@@ -0,0 +1,186 @@
+"""
+Job runner - runs long tasks (grading, downloads) off the request thread
+Jobs get an ID that can be polled for status/progress, and submitting a job
+whose key is already queued or running returns the existing job instead.
+"""
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    """Status record for a submitted job"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    def __init__(self, key, description=None):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.description = description or key
+        self.status = self.QUEUED
+        self.progress = 0.0
+        self.message = None
+        self.result = None
+        self.error = None
+        self.created_at = datetime.utcnow()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def done(self):
+        return self.status in (self.COMPLETED, self.FAILED)
+
+    def report(self, message=None, fraction=None):
+        """
+        Progress callback handed to the job function
+
+        Args:
+            message: Short description of the current step
+            fraction: Overall progress between 0 and 1
+        """
+        if message is not None:
+            self.message = message
+        if fraction is not None:
+            self.progress = min(max(float(fraction), 0.0), 1.0)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'key': self.key,
+            'description': self.description,
+            'status': self.status,
+            'progress': round(self.progress, 3),
+            'message': self.message,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class JobRunner:
+    """In-process thread pool with job IDs and deduplication by job key"""
+
+    def __init__(self, app=None, max_workers=2, history_size=100):
+        """
+        Initialize job runner
+
+        Args:
+            app: Flask app to configure from (optional, see init_app)
+            max_workers: Number of jobs that can run at once
+            history_size: Number of finished jobs kept for status lookups
+        """
+        self.max_workers = max_workers
+        self.history_size = history_size
+        self.run_inline = False
+        self._executor = None
+        self._jobs = OrderedDict()
+        self._active = {}
+        self._lock = threading.Lock()
+
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read JOB_WORKERS / JOB_HISTORY_SIZE / JOBS_RUN_INLINE from the app config"""
+        self.max_workers = app.config.get('JOB_WORKERS', self.max_workers)
+        self.history_size = app.config.get('JOB_HISTORY_SIZE', self.history_size)
+        self.run_inline = app.config.get('JOBS_RUN_INLINE', self.run_inline)
+        app.extensions['job_runner'] = self
+
+    def submit(self, key, func, *args, description=None, **kwargs):
+        """
+        Queue func(*args, progress=job.report, **kwargs) in the current app's context
+
+        Args:
+            key: Identity of the job; a queued or running job with the same key is reused
+            func: Callable to run, must accept a progress keyword argument
+            description: Human-readable label for status listings
+
+        Returns:
+            (job, created) - created is False when an identical job was already active
+        """
+        app = current_app._get_current_object()
+
+        with self._lock:
+            active = self._active.get(key)
+            if active is not None:
+                return active, False
+
+            job = Job(key, description)
+            self._jobs[job.id] = job
+            self._active[key] = job
+            self._trim_history()
+
+        if self.run_inline:
+            self._run(app, job, func, args, kwargs)
+        else:
+            self._get_executor().submit(self._run, app, job, func, args, kwargs)
+
+        return job, True
+
+    def get(self, job_id):
+        """Return the job with this ID, or None if unknown (or trimmed from history)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, status=None):
+        """Return known jobs, newest first, optionally filtered by status"""
+        with self._lock:
+            jobs = list(reversed(self._jobs.values()))
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        return jobs
+
+    def shutdown(self, wait=True):
+        """Stop the worker pool (a new one is started on the next submit)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job')
+            return self._executor
+
+    def _run(self, app, job, func, args, kwargs):
+        job.status = Job.RUNNING
+        job.started_at = datetime.utcnow()
+
+        try:
+            with app.app_context():
+                job.result = func(*args, progress=job.report, **kwargs)
+            job.progress = 1.0
+            job.status = Job.COMPLETED
+        except Exception as e:
+            logger.exception('Job %s (%s) failed', job.id, job.key)
+            job.error = str(e)
+            job.status = Job.FAILED
+        finally:
+            job.finished_at = datetime.utcnow()
+            with self._lock:
+                if self._active.get(job.key) is job:
+                    del self._active[job.key]
+
+    def _trim_history(self):
+        # Drop the oldest finished jobs; active jobs are always kept
+        excess = len(self._jobs) - self.history_size
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done][:excess]:
+            del self._jobs[job_id]
+
+
+job_runner = JobRunner()
@@ -0,0 +1,105 @@
+"""
+Live grading service - grades FTD picks from a streaming play feed
+Detects each game's first TD as its plays land in the feed drop directory,
+so FTD picks are graded within seconds instead of after a full PBP reload.
+"""
+import logging
+import threading
+from nfl_core.live import PlayFeed, FirstTdTracker
+from ..models import Game
+from .. import db
+from ..data_loader import load_cached_roster
+from .grading_service import GradingService, grading_lock
+
+logger = logging.getLogger(__name__)
+
+
+class LiveGradingService:
+    """Tails a play feed and grades a game's FTD picks as soon as its first TD is seen"""
+    
+    def __init__(self, feed_dir, season=2025, roster_df=None, grading_service_factory=None):
+        """
+        Initialize live grading service
+        
+        Args:
+            feed_dir: Drop directory of JSONL/parquet play files (see nfl_core.live.PlayFeed)
+            season: NFL season year (used to load the cached roster for scorer names)
+            roster_df: Optional roster DataFrame (default: cached roster for the season)
+            grading_service_factory: Optional callable returning the GradingService to
+                grade with (default GradingService); called once per poll that grades
+        """
+        self.season = season
+        self.feed = PlayFeed(feed_dir)
+        self.tracker = FirstTdTracker(roster_df if roster_df is not None else load_cached_roster(season))
+        # A new GradingService per poll: aliases approved meanwhile are read again, and
+        # its in-memory score memo doesn't grow for the life of the process
+        self.grading_service_factory = grading_service_factory or GradingService
+        # First TDs seen but not yet graded and committed (game not in the database yet,
+        # or a failed poll); retried on every poll
+        self.pending = {}
+    
+    def poll(self):
+        """
+        Read new plays and grade FTD picks for games whose first TD has landed
+        
+        The feed position and the tracker only move past a game once its grades are
+        committed, so a failed poll (or a game whose row doesn't exist yet) is retried.
+        
+        Returns:
+            list of dicts, one per game graded, with the grading counts
+        """
+        plays_df = self.feed.read_new(commit=False)
+        for game_id, td in self.tracker.detect(plays_df).items():
+            self.pending.setdefault(game_id, td)
+        if not self.pending:
+            self.feed.commit()
+            return []
+        
+        games = Game.query.filter(Game.game_id.in_(list(self.pending))).all()
+        with grading_lock(self.season):
+            grading_service = self.grading_service_factory()
+            counts = grading_service.grade_first_td_games(games, self.pending, force_regrade=False)
+            db.session.commit()
+        
+        # Games in the database are done (a first TD without a scorer name has nothing to grade)
+        graded = {game.game_id: self.pending.pop(game.game_id) for game in games}
+        self.tracker.record(graded)
+        self.feed.commit()
+        
+        results = []
+        for game in games:
+            if game.game_id not in counts:
+                continue
+            td = graded[game.game_id]
+            results.append({
+                'game_id': game.game_id,
+                'week': game.week,
+                'player': td['player'],
+                'team': td['team'],
+                **counts[game.game_id]
+            })
+        
+        if self.pending:
+            logger.info('First TD for games not in the database yet: %s', sorted(self.pending))
+        
+        return results
+    
+    def run(self, interval=5.0, stop_event=None, on_result=None):
+        """
+        Poll the feed every `interval` seconds until stop_event is set
+        
+        Args:
+            interval: Seconds between polls
+            stop_event: Optional threading.Event to stop the loop
+            on_result: Optional callback(result) for each graded game
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                for result in self.poll():
+                    if on_result:
+                        on_result(result)
+            except Exception:
+                db.session.rollback()
+                logger.exception('Live grading poll failed')
+            stop_event.wait(interval)
@@ -5,6 +5,7 @@ Consolidates match review logic from routes.py
 from datetime import datetime
 from ..models import MatchDecision
 from .. import db
+from .alias_service import AliasService
 
 
 class MatchReviewService:
@@ -88,7 +89,7 @@ class MatchReviewService:
     @staticmethod
     def approve_match(match_id, reviewed_by='admin'):
         """
-        Approve a fuzzy match and grade the pick as win
+        Approve a fuzzy match, remember it as a player alias and grade the pick as win
         
         Args:
             match_id: MatchDecision ID
@@ -108,6 +109,7 @@ class MatchReviewService:
         match.reviewed_by = reviewed_by
         match.reviewed_at = datetime.utcnow()
         match.needs_review = False
+        AliasService.record_review(match, approved=True, reviewed_by=reviewed_by)
         
         # Grade pick as win
         pick.result = 'W'
@@ -121,7 +123,7 @@ class MatchReviewService:
     @staticmethod
     def reject_match(match_id, reviewed_by='admin'):
         """
-        Reject a fuzzy match and grade the pick as loss
+        Reject a fuzzy match, remember the rejected pair and grade the pick as loss
         
         Args:
             match_id: MatchDecision ID
@@ -141,6 +143,7 @@ class MatchReviewService:
         match.reviewed_by = reviewed_by
         match.reviewed_at = datetime.utcnow()
         match.needs_review = False
+        AliasService.record_review(match, approved=False, reviewed_by=reviewed_by)
         
         # Grade pick as loss
         pick.result = 'L'
@@ -154,7 +157,7 @@ class MatchReviewService:
     @staticmethod
     def revert_match(match_id):
         """
-        Revert a manually reviewed match back to pending
+        Revert a manually reviewed match back to pending (and forget its alias)
         
         Args:
             match_id: MatchDecision ID
@@ -177,6 +180,7 @@ class MatchReviewService:
         match.reviewed_by = None
         match.reviewed_at = None
         match.needs_review = True
+        AliasService.forget_review(match)
         
         # Reset pick to pending
         pick.result = 'Pending'
@@ -201,11 +205,13 @@ class MatchReviewService:
         pending_matches = MatchDecision.query.filter_by(needs_review=True, manual_decision=None).all()
         
         count = 0
+        rosters = {}
         for match in pending_matches:
             match.manual_decision = 'approved'
             match.reviewed_by = reviewed_by
             match.reviewed_at = datetime.utcnow()
             match.needs_review = False
+            AliasService.record_review(match, approved=True, reviewed_by=reviewed_by, rosters=rosters)
             
             pick = match.pick
             pick.result = 'W'
@@ -231,11 +237,13 @@ class MatchReviewService:
         pending_matches = MatchDecision.query.filter_by(needs_review=True, manual_decision=None).all()
         
         count = 0
+        rosters = {}
         for match in pending_matches:
             match.manual_decision = 'rejected'
             match.reviewed_by = reviewed_by
             match.reviewed_at = datetime.utcnow()
             match.needs_review = False
+            AliasService.record_review(match, approved=False, reviewed_by=reviewed_by, rosters=rosters)
             
             pick = match.pick
             pick.result = 'L'
@@ -263,6 +271,7 @@ class MatchReviewService:
             match.reviewed_by = None
             match.reviewed_at = None
             match.needs_review = True
+            AliasService.forget_review(match)
             
             pick = match.pick
             pick.result = 'Pending'
@@ -0,0 +1,105 @@
+"""
+Schedule service - syncs nflverse schedule rows into the games table
+Dates, times and standalone flags are computed with polars expressions and all
+rows are written with one INSERT ... ON CONFLICT (game_id) DO UPDATE.
+"""
+import polars as pl
+from sqlalchemy import insert, update
+from nfl_core.data import is_standalone_game
+from ..models import Game
+from .. import db
+
+# Game columns taken from the schedule (game_id is the upsert key)
+SCHEDULE_COLUMNS = ('season', 'week', 'gameday', 'game_date', 'game_time', 'home_team', 'away_team', 'is_standalone')
+
+
+class ScheduleService:
+    """Set-based schedule import"""
+
+    @staticmethod
+    def schedule_rows(schedule_df, season=None):
+        """
+        Convert a schedule DataFrame into Game column dicts
+
+        Args:
+            schedule_df: nflverse schedule (any number of seasons)
+            season: Season used for rows without one (optional)
+
+        Returns:
+            list: Dicts with game_id plus SCHEDULE_COLUMNS, one per schedule row with a game_id
+        """
+        if schedule_df is None or 'game_id' not in schedule_df.columns:
+            return []
+
+        missing = [c for c in ('season', 'week', 'gameday', 'gametime', 'home_team', 'away_team') if c not in schedule_df.columns]
+        df = schedule_df.with_columns([pl.lit(None, dtype=pl.Utf8).alias(c) for c in missing])
+
+        gameday = pl.col('gameday').cast(pl.Utf8)
+        gametime = pl.col('gametime').cast(pl.Utf8)
+        return df.filter(
+            pl.col('game_id').is_not_null() & (pl.col('game_id').cast(pl.Utf8) != '')
+        ).select(
+            pl.col('game_id').cast(pl.Utf8),
+            pl.col('season').cast(pl.Int64, strict=False).fill_null(season),
+            pl.col('week').cast(pl.Int64, strict=False),
+            gameday.alias('gameday'),
+            gameday.str.to_date('%Y-%m-%d', strict=False).alias('game_date'),
+            gametime.str.to_time('%H:%M', strict=False).alias('game_time'),
+            pl.col('home_team').cast(pl.Utf8),
+            pl.col('away_team').cast(pl.Utf8),
+            is_standalone_game(gameday, gametime).fill_null(False).alias('is_standalone')
+        ).to_dicts()
+
+    @staticmethod
+    def sync_games(schedule_df, season=None):
+        """
+        Insert new games and update existing ones (matched on game_id) from a schedule
+
+        Adds the statements to the session; the caller commits.
+
+        Args:
+            schedule_df: nflverse schedule (any number of seasons)
+            season: Season used for rows without one (optional)
+
+        Returns:
+            tuple: (games_added, games_updated)
+        """
+        rows = ScheduleService.schedule_rows(schedule_df, season)
+        if not rows:
+            return 0, 0
+
+        existing = dict(
+            db.session.query(Game.game_id, Game.id).filter(Game.game_id.in_({row['game_id'] for row in rows}))
+        )
+        games_added = len({row['game_id'] for row in rows} - set(existing))
+
+        stmt = _upsert(Game, 'game_id', SCHEDULE_COLUMNS)
+        if stmt is not None:
+            db.session.execute(stmt, rows)
+        else:
+            # No dialect upsert: update by primary key, insert the rest (last row per game wins)
+            latest = {row['game_id']: row for row in rows}
+            updates = [dict(row, id=existing[game_id]) for game_id, row in latest.items() if game_id in existing]
+            inserts = [row for game_id, row in latest.items() if game_id not in existing]
+            if updates:
+                db.session.execute(update(Game), updates)
+            if inserts:
+                db.session.execute(insert(Game), inserts)
+
+        return games_added, len(rows) - games_added
+
+
+def _upsert(model, key, columns):
+    """INSERT ... ON CONFLICT (key) DO UPDATE columns (SQLite/PostgreSQL), else None"""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        return None
+    stmt = dialect_insert(model)
+    return stmt.on_conflict_do_update(
+        index_elements=[key],
+        set_={column: stmt.excluded[column] for column in columns}
+    )
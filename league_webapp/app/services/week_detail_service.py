@@ -0,0 +1,247 @@
+"""
+Week detail service - serialized week view (games with their FTD/ATTS picks)
+Payloads are cached per (season, week) and dropped when a commit touches a pick,
+game or username in that week (any week, for bulk statements that can't be traced).
+"""
+import uuid
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, joinedload
+from flask import has_app_context
+from ..models import Game, Pick, User
+from .. import db, cache
+
+WEEK_DETAIL_TIMEOUT = 300
+# Cache keys include a namespace token; replacing it drops every week at once
+_NAMESPACE_KEY = 'week_detail:namespace'
+# session.info key: set of (season, week) to drop on commit, or None for all weeks
+_PENDING = 'week_detail_pending'
+
+
+class WeekDetailService:
+    """Week view payloads for /api/week-detail"""
+
+    @staticmethod
+    def get_week_detail(season, week):
+        """
+        Get the week's games with their picks, from cache when available
+
+        Args:
+            season (int): NFL season year
+            week (int): Week number
+
+        Returns:
+            dict: {'games', 'week', 'season', 'available_weeks'} (plus 'message' if no games)
+        """
+        key = _cache_key(season, week)
+        payload = cache.get(key)
+        if payload is None:
+            payload = WeekDetailService.build_week_detail(season, week)
+            cache.set(key, payload, timeout=WEEK_DETAIL_TIMEOUT)
+        return payload
+
+    @staticmethod
+    def build_week_detail(season, week):
+        """Build the week payload: games, picks and users in one query, grouped in memory"""
+        games = Game.query.filter_by(
+            week=week,
+            season=season
+        ).options(
+            joinedload(Game.picks).joinedload(Pick.user)
+        ).order_by(Game.game_date, Game.game_time).all()
+
+        if not games:
+            return {
+                'games': [],
+                'week': week,
+                'season': season,
+                'available_weeks': [],
+                'message': 'No games found for this week'
+            }
+
+        games_data = []
+        for game in games:
+            picks_data = {'FTD': [], 'ATTS': []}
+            for pick in sorted(game.picks, key=lambda p: (p.user.username, p.id)):
+                if pick.pick_type not in picks_data:
+                    continue
+                picks_data[pick.pick_type].append({
+                    'id': pick.id,
+                    'user_id': pick.user_id,
+                    'username': pick.user.username,
+                    'player_name': pick.player_name,
+                    'player_position': pick.player_position,
+                    'odds': pick.odds,
+                    'stake': float(pick.stake),
+                    'result': pick.result,
+                    'payout': float(pick.payout) if pick.payout else 0.0,
+                    'graded_at': pick.graded_at.isoformat() if pick.graded_at else None
+                })
+
+            games_data.append({
+                'game_id': game.game_id,
+                'db_id': game.id,
+                'week': game.week,
+                'matchup': f"{game.away_team} @ {game.home_team}",
+                'home_team': game.home_team,
+                'away_team': game.away_team,
+                'game_date': game.game_date.isoformat() if game.game_date else None,
+                'game_time': game.game_time.strftime('%H:%M:%S') if game.game_time else None,
+                'is_final': game.is_final,
+                'home_score': None,
+                'away_score': None,
+                'actual_first_td_player': game.actual_first_td_player,
+                'ftd_picks': picks_data['FTD'],
+                'atts_picks': picks_data['ATTS'],
+                'total_picks': len(picks_data['FTD']) + len(picks_data['ATTS'])
+            })
+
+        all_weeks = db.session.query(Game.week).filter_by(
+            season=season
+        ).distinct().order_by(Game.week).all()
+
+        return {
+            'games': games_data,
+            'week': week,
+            'season': season,
+            'available_weeks': [w[0] for w in all_weeks]
+        }
+
+    @staticmethod
+    def invalidate(weeks=None):
+        """
+        Drop cached week payloads
+
+        Args:
+            weeks: Iterable of (season, week) pairs, or None for every week
+        """
+        if weeks is None:
+            cache.set(_NAMESPACE_KEY, uuid.uuid4().hex, timeout=0)
+        else:
+            keys = [_cache_key(season, week) for season, week in set(weeks)]
+            if keys:
+                cache.delete_many(*keys)
+
+
+def _cache_key(season, week):
+    # A missing namespace (never set, or evicted) starts a new one, so entries
+    # cached under an older namespace can't be served again
+    namespace = cache.get(_NAMESPACE_KEY)
+    if namespace is None:
+        namespace = uuid.uuid4().hex
+        cache.set(_NAMESPACE_KEY, namespace, timeout=0)
+    return f'week_detail:{namespace}:{season}:{week}'
+
+
+def _mark(session, weeks=None):
+    """Record weeks (or every week, if None) to invalidate when the session commits"""
+    if weeks is None:
+        session.info[_PENDING] = None
+        return
+    pending = session.info.get(_PENDING, set())
+    if pending is not None:
+        pending.update(weeks)
+        session.info[_PENDING] = pending
+
+
+def _loaded(session, model, ident, *attrs):
+    """Attribute values of an instance already in the session, without loading (else None)"""
+    obj = session.identity_map.get(session.identity_key(model, ident))
+    if obj is None or any(attr not in obj.__dict__ for attr in attrs):
+        return None
+    return tuple(obj.__dict__[attr] for attr in attrs)
+
+
+def _weeks_for(session, game_ids=(), pick_ids=()):
+    """
+    (season, week) pairs for game and pick ids, read from instances already in the
+    session where possible (one query each for the rest)
+    """
+    game_ids = set(game_ids)
+    missing_picks = set()
+    for pick_id in set(pick_ids):
+        loaded = _loaded(session, Pick, pick_id, 'game_id')
+        if loaded is None:
+            missing_picks.add(pick_id)
+        else:
+            game_ids.add(loaded[0])
+
+    weeks = set()
+    missing_games = set()
+    for game_id in game_ids:
+        loaded = _loaded(session, Game, game_id, 'season', 'week')
+        if loaded is None:
+            missing_games.add(game_id)
+        else:
+            weeks.add(loaded)
+
+    connection = session.connection()
+    if missing_games:
+        weeks.update(connection.execute(
+            select(Game.season, Game.week).where(Game.id.in_(missing_games))
+        ).all())
+    if missing_picks:
+        weeks.update(connection.execute(
+            select(Game.season, Game.week).join(Pick, Pick.game_id == Game.id).where(Pick.id.in_(missing_picks))
+        ).all())
+    return {tuple(week) for week in weeks}
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_flushed_changes(session, flush_context):
+    weeks = set()
+    game_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Pick):
+            history = inspect(obj).attrs.game_id.history
+            game_ids.update(g for g in history.sum() if g is not None)
+        elif isinstance(obj, Game):
+            weeks.add((obj.season, obj.week))
+            state = inspect(obj)
+            for attr in ('season', 'week'):
+                if state.attrs[attr].history.deleted:
+                    _mark(session)
+                    return
+        elif isinstance(obj, User) and inspect(obj).attrs.username.history.has_changes():
+            _mark(session)
+            return
+
+    if game_ids:
+        weeks.update(_weeks_for(session, game_ids=game_ids))
+    if weeks:
+        _mark(session, weeks)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _track_bulk_statements(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mappers = {mapper.class_ for mapper in orm_execute_state.all_mappers}
+    if not mappers & {Pick, Game, User}:
+        return
+
+    session = orm_execute_state.session
+    params = orm_execute_state.parameters
+    rows = params if isinstance(params, list) else None
+    # Bulk INSERT/UPDATE of picks with row dicts (CSV import, grading) can be traced to weeks
+    if mappers == {Pick} and rows and not orm_execute_state.is_delete:
+        if orm_execute_state.is_insert and all('game_id' in row for row in rows):
+            _mark(session, _weeks_for(session, game_ids=[row['game_id'] for row in rows]))
+            return
+        if orm_execute_state.is_update and all('id' in row for row in rows):
+            _mark(session, _weeks_for(session, pick_ids=[row['id'] for row in rows]))
+            return
+    _mark(session)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed(session):
+    if _PENDING not in session.info:
+        return
+    weeks = session.info.pop(_PENDING)
+    if has_app_context():
+        WeekDetailService.invalidate(weeks)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending(session):
+    session.info.pop(_PENDING, None)
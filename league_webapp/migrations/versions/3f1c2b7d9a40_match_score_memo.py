@@ -0,0 +1,58 @@
+"""Match score memo and one match decision per pick
+
+Revision ID: 3f1c2b7d9a40
+Revises: 66a861c9f537
+Create Date: 2025-12-08 21:04:12.118532
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2b7d9a40'
+down_revision = '66a861c9f537'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    # db.create_all() may already have created the table on app startup
+    if 'match_score_memo' not in inspector.get_table_names():
+        op.create_table('match_score_memo',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('pick_name', sa.String(length=100), nullable=False),
+            sa.Column('scorer_name', sa.String(length=100), nullable=False),
+            sa.Column('match_score', sa.Float(), nullable=False),
+            sa.Column('confidence', sa.String(length=20), nullable=False),
+            sa.Column('match_reason', sa.String(length=200), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('pick_name', 'scorer_name', name='uq_match_score_memo_names')
+        )
+
+    # Regrades used to insert a new decision each time; keep one per pick, the newest
+    # reviewed one if an admin decided any (so the review survives), else the newest
+    op.execute(
+        'DELETE FROM match_decisions WHERE id NOT IN '
+        '(SELECT COALESCE(MAX(CASE WHEN manual_decision IS NOT NULL THEN id END), MAX(id)) '
+        'FROM match_decisions GROUP BY pick_id)'
+    )
+
+    indexes = {index['name']: index for index in inspector.get_indexes('match_decisions')}
+    with op.batch_alter_table('match_decisions', schema=None) as batch_op:
+        if 'ix_match_decisions_pick_id' in indexes:
+            if indexes['ix_match_decisions_pick_id']['unique']:
+                return
+            batch_op.drop_index('ix_match_decisions_pick_id')
+        batch_op.create_index('ix_match_decisions_pick_id', ['pick_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('match_decisions', schema=None) as batch_op:
+        batch_op.drop_index('ix_match_decisions_pick_id')
+        batch_op.create_index('ix_match_decisions_pick_id', ['pick_id'], unique=False)
+
+    op.drop_table('match_score_memo')
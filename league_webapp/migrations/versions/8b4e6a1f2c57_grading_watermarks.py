@@ -0,0 +1,38 @@
+"""Grading watermarks for incremental grading
+
+Revision ID: 8b4e6a1f2c57
+Revises: 3f1c2b7d9a40
+Create Date: 2025-12-10 19:42:37.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e6a1f2c57'
+down_revision = '3f1c2b7d9a40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() may already have created the table on app startup
+    if 'grading_watermarks' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table('grading_watermarks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=False),
+        sa.Column('pbp_version', sa.Integer(), nullable=True),
+        sa.Column('week_fingerprints', sa.Text(), nullable=True),
+        sa.Column('last_pick_id', sa.Integer(), nullable=True),
+        sa.Column('games_graded', sa.Integer(), nullable=True),
+        sa.Column('graded_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('season')
+    )
+
+
+def downgrade():
+    op.drop_table('grading_watermarks')
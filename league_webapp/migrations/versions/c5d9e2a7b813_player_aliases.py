@@ -0,0 +1,44 @@
+"""Player aliases learned from match reviews
+
+Revision ID: c5d9e2a7b813
+Revises: 8b4e6a1f2c57
+Create Date: 2025-12-12 10:18:51.270443
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d9e2a7b813'
+down_revision = '8b4e6a1f2c57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() may already have created the table on app startup
+    if 'player_aliases' in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table('player_aliases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('alias', sa.String(length=100), nullable=False),
+        sa.Column('player_name', sa.String(length=100), nullable=False),
+        sa.Column('gsis_id', sa.String(length=20), nullable=True),
+        sa.Column('is_match', sa.Boolean(), nullable=False),
+        sa.Column('reviewed_by', sa.String(length=50), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('alias', 'player_name', name='uq_player_alias_names')
+    )
+    with op.batch_alter_table('player_aliases', schema=None) as batch_op:
+        batch_op.create_index('ix_player_aliases_alias', ['alias'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('player_aliases', schema=None) as batch_op:
+        batch_op.drop_index('ix_player_aliases_alias')
+
+    op.drop_table('player_aliases')
@@ -0,0 +1,31 @@
+"""Roster player ID on picks
+
+Revision ID: d2a8f4c61e95
+Revises: c5d9e2a7b813
+Create Date: 2025-12-13 16:05:22.839170
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a8f4c61e95'
+down_revision = 'c5d9e2a7b813'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created by db.create_all() already have the column
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('picks')]
+    if 'player_gsis_id' in columns:
+        return
+
+    with op.batch_alter_table('picks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('player_gsis_id', sa.String(length=50), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('picks', schema=None) as batch_op:
+        batch_op.drop_column('player_gsis_id')
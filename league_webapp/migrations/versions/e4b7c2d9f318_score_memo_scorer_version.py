@@ -0,0 +1,40 @@
+"""Scorer version on stored match scores
+
+Revision ID: e4b7c2d9f318
+Revises: d2a8f4c61e95
+Create Date: 2025-12-14 11:42:07.503918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c2d9f318'
+down_revision = 'd2a8f4c61e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases created by db.create_all() already have the column
+    columns = [column['name'] for column in sa.inspect(op.get_bind()).get_columns('match_score_memo')]
+    if 'scorer_version' in columns:
+        return
+
+    # Scores stored so far don't record the rules they were computed with
+    op.execute('DELETE FROM match_score_memo')
+
+    with op.batch_alter_table('match_score_memo', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('scorer_version', sa.String(length=20), nullable=False, server_default=''))
+        batch_op.drop_constraint('uq_match_score_memo_names', type_='unique')
+        batch_op.create_unique_constraint('uq_match_score_memo_names', ['pick_name', 'scorer_name', 'scorer_version'])
+
+
+def downgrade():
+    op.execute('DELETE FROM match_score_memo')
+
+    with op.batch_alter_table('match_score_memo', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_match_score_memo_names', type_='unique')
+        batch_op.create_unique_constraint('uq_match_score_memo_names', ['pick_name', 'scorer_name'])
+        batch_op.drop_column('scorer_version')
@@ -13,6 +13,9 @@ from .config import (
     BASE_URL,
     API_TIMEOUT,
     MARKET_1ST_TD,
+    DATA_CACHE_DIR,
+    NFLVERSE_BASE_URL,
+    DOWNLOAD_WORKERS,
     ODDS_CACHE_DIR,
     ODDS_CACHE_EXPIRY,
     NFL_TEAM_MAP
@@ -21,12 +24,37 @@ from .config import (
 from .data import (
     is_standalone_game,
     get_season_games,
-    load_data_with_cache
+    load_data_with_cache,
+    PBP_COLUMNS,
+    pbp_columns,
+    scan_pbp,
+    pbp_partition_dir,
+    read_pbp_manifest,
+    write_pbp_partitions,
+    ensure_pbp_partitions,
+    download_pbp,
+    download_seasons
+)
+
+from .players import (
+    PlayerIndex,
+    get_player_index
+)
+
+from .live import (
+    PlayFeed,
+    FirstTdTracker
 )
 
 from .stats import (
     get_first_td_scorers,
+    get_first_td_scorers_df,
+    get_all_td_scorers,
+    get_all_td_scorers_df,
+    get_game_touchdowns_df,
+    GameTouchdownIndex,
     get_player_season_stats,
+    get_player_season_stats_windows,
     get_player_position,
     calculate_defense_rankings,
     calculate_fair_odds,
@@ -34,18 +62,27 @@ from .stats import (
     get_opening_drive_stats,
     calculate_kelly_criterion,
     get_team_red_zone_splits,
+    get_situational_stats,
     identify_funnel_defenses
 )
 
 __all__ = [
     # Config
     'API_KEY', 'SPORT', 'REGION', 'BASE_URL', 'API_TIMEOUT',
-    'MARKET_1ST_TD', 'ODDS_CACHE_DIR', 'ODDS_CACHE_EXPIRY', 'NFL_TEAM_MAP',
+    'MARKET_1ST_TD', 'DATA_CACHE_DIR', 'NFLVERSE_BASE_URL', 'DOWNLOAD_WORKERS', 'ODDS_CACHE_DIR', 'ODDS_CACHE_EXPIRY', 'NFL_TEAM_MAP',
     # Data
     'is_standalone_game', 'get_season_games', 'load_data_with_cache',
+    'PBP_COLUMNS', 'pbp_columns', 'scan_pbp', 'pbp_partition_dir', 'read_pbp_manifest',
+    'write_pbp_partitions', 'ensure_pbp_partitions', 'download_pbp', 'download_seasons',
+    # Players
+    'PlayerIndex', 'get_player_index',
+    # Live
+    'PlayFeed', 'FirstTdTracker',
     # Stats
-    'get_first_td_scorers', 'get_player_season_stats', 'get_player_position',
+    'get_first_td_scorers', 'get_first_td_scorers_df', 'get_all_td_scorers',
+    'get_all_td_scorers_df', 'get_game_touchdowns_df', 'GameTouchdownIndex', 'get_player_season_stats',
+    'get_player_season_stats_windows', 'get_player_position',
     'calculate_defense_rankings', 'calculate_fair_odds', 'get_red_zone_stats',
     'get_opening_drive_stats', 'calculate_kelly_criterion', 'get_team_red_zone_splits',
-    'identify_funnel_defenses'
+    'get_situational_stats', 'identify_funnel_defenses'
 ]
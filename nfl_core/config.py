@@ -7,6 +7,9 @@ REGION = 'us'
 BASE_URL = "https://api.the-odds-api.com/v4/sports"
 API_TIMEOUT = 10
 MARKET_1ST_TD = "player_1st_td"
+DATA_CACHE_DIR = "../cache"
+NFLVERSE_BASE_URL = os.environ.get('NFLVERSE_BASE_URL', 'https://github.com/nflverse')
+DOWNLOAD_WORKERS = 4
 ODDS_CACHE_DIR = "../cache/odds"
 ODDS_CACHE_EXPIRY = 3600  # 1 hour in seconds
 
@@ -3,6 +3,286 @@ import polars as pl
 import os
 import requests
 import io
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from .config import DATA_CACHE_DIR, NFLVERSE_BASE_URL, DOWNLOAD_WORKERS
+
+PBP_PARTITION_FILE = "data.parquet"
+PBP_MANIFEST_FILE = "_manifest.json"
+
+# nflverse file locations relative to NFLVERSE_BASE_URL. The schedule is a single
+# file covering every season; PBP and rosters are published one file per season.
+NFLVERSE_PATHS = {
+    'schedule': "nfldata/raw/master/data/games.csv",
+    'pbp': "nflverse-data/releases/download/pbp/play_by_play_{season}.parquet",
+    'roster': "nflverse-data/releases/download/rosters/roster_{season}.parquet",
+}
+
+# Play-by-play columns read by each consumer. The nflverse PBP file has 370+
+# columns; scanning only these lets polars skip the rest at the parquet level.
+PBP_COLUMNS = {
+    'first_td': [
+        'game_id', 'play_id', 'qtr', 'time', 'touchdown', 'td_player_name',
+        'td_player_id', 'td_team', 'posteam', 'home_team',
+        'fantasy_player_name', 'player_name', 'desc', 'description'
+    ],
+    'red_zone': [
+        'yardline_100', 'rusher_player_id', 'receiver_player_id',
+        'touchdown', 'td_player_id'
+    ],
+    'opening_drive': [
+        'game_id', 'posteam', 'drive', 'rusher_player_id',
+        'receiver_player_id', 'touchdown', 'td_player_id', 'fixed_drive_result'
+    ],
+    'team_splits': ['posteam', 'yardline_100', 'play_type'],
+}
+
+def pbp_columns(*consumers: str) -> list[str]:
+    """
+    Returns the union of PBP columns needed by the given consumers (all consumers if none given).
+    """
+    names = consumers or tuple(PBP_COLUMNS.keys())
+    columns = []
+    for name in names:
+        if name not in PBP_COLUMNS:
+            raise KeyError(f"Unknown PBP consumer '{name}'. Known: {', '.join(PBP_COLUMNS)}")
+        for col in PBP_COLUMNS[name]:
+            if col not in columns:
+                columns.append(col)
+    return columns
+
+def scan_pbp(pbp_path: str, *consumers: str, columns: list[str] | None = None, weeks: list[int] | None = None) -> pl.LazyFrame:
+    """
+    Lazily scans cached PBP, projected to the columns the consumers use.
+    pbp_path may be a single parquet file or a week-partitioned season directory.
+    Columns missing from the data are skipped. The optional weeks filter and any filters
+    applied to the returned LazyFrame are pushed down into the parquet read.
+    With no consumers the projection is the union of all of them: the season loaders scan
+    that way because their frame is cached and shared by every consumer, so one read
+    replaces a scan per consumer. Name the consumers for a one-off read.
+    """
+    if os.path.isdir(pbp_path):
+        lf = pl.scan_parquet(
+            os.path.join(pbp_path, "week=*", PBP_PARTITION_FILE),
+            hive_partitioning=True,
+            hive_schema={"season": pl.Int32, "week": pl.Int32}
+        )
+    else:
+        lf = pl.scan_parquet(pbp_path)
+
+    if weeks is not None:
+        lf = lf.filter(pl.col("week").is_in(weeks))
+
+    available = set(lf.collect_schema().names())
+    wanted = columns if columns is not None else pbp_columns(*consumers)
+    return lf.select([c for c in wanted if c in available])
+
+def pbp_partition_dir(season: int, cache_dir: str = DATA_CACHE_DIR) -> str:
+    """
+    Returns the week-partitioned PBP directory for a season (hive layout: season=YYYY/week=N/).
+    """
+    return os.path.join(cache_dir, "pbp", f"season={season}")
+
+def read_pbp_manifest(season: int, cache_dir: str = DATA_CACHE_DIR) -> dict:
+    """
+    Returns the partition manifest for a season, or {} if the season has not been partitioned.
+    Format: {'season': int, 'version': int, 'weeks': {'<week>': {'rows', 'fingerprint', 'updated_at'}}}
+    """
+    manifest_path = os.path.join(pbp_partition_dir(season, cache_dir), PBP_MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path) as f:
+        return json.load(f)
+
+def _week_fingerprint(week_df: pl.DataFrame) -> str:
+    """
+    Order-independent content fingerprint for one week of plays.
+    Row hashes are only stable within a polars version, so an upgrade costs one rewrite.
+    """
+    return f"{week_df.height}:{len(week_df.columns)}:{week_df.hash_rows(seed=0).sum()}"
+
+def _write_atomic(path: str, write) -> None:
+    """
+    Writes via a temp file in the same directory and renames it into place.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_pbp_partitions(pbp_df: pl.DataFrame, season: int, cache_dir: str = DATA_CACHE_DIR, weeks: list[int] | None = None) -> list[int]:
+    """
+    Stores PBP as one parquet partition per week and records each week in the manifest.
+    Weeks whose content is unchanged since the last write are left alone, so a refresh
+    only rewrites the weeks that actually changed. Returns the weeks that were written.
+    """
+    season_dir = pbp_partition_dir(season, cache_dir)
+    os.makedirs(season_dir, exist_ok=True)
+
+    manifest = read_pbp_manifest(season, cache_dir) or {'season': season, 'version': 0, 'weeks': {}}
+    written = []
+
+    partitions = pbp_df.filter(pl.col("week").is_not_null()).partition_by("week", as_dict=True)
+    for (week,), week_df in sorted(partitions.items()):
+        week = int(week)
+        if weeks is not None and week not in weeks:
+            continue
+
+        fingerprint = _week_fingerprint(week_df)
+        part_path = os.path.join(season_dir, f"week={week}", PBP_PARTITION_FILE)
+        entry = manifest['weeks'].get(str(week))
+        if entry and entry['fingerprint'] == fingerprint and os.path.exists(part_path):
+            continue
+
+        os.makedirs(os.path.dirname(part_path), exist_ok=True)
+        # The week value lives in the directory name
+        _write_atomic(part_path, week_df.drop("week").write_parquet)
+        manifest['weeks'][str(week)] = {
+            'rows': week_df.height,
+            'fingerprint': fingerprint,
+            'updated_at': datetime.now(timezone.utc).isoformat()
+        }
+        written.append(week)
+
+    if written:
+        manifest['version'] = manifest.get('version', 0) + 1
+        manifest_path = os.path.join(season_dir, PBP_MANIFEST_FILE)
+
+        def write_manifest(path):
+            with open(path, "w") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+
+        _write_atomic(manifest_path, write_manifest)
+
+    return written
+
+def ensure_pbp_partitions(season: int, cache_dir: str = DATA_CACHE_DIR) -> bool:
+    """
+    Returns True if week partitions exist for the season, migrating a legacy
+    season_{season}_pbp.parquet file into partitions the first time it is seen.
+    """
+    if read_pbp_manifest(season, cache_dir).get('weeks'):
+        return True
+
+    legacy_path = os.path.join(cache_dir, f"season_{season}_pbp.parquet")
+    if not os.path.exists(legacy_path):
+        return False
+
+    print(f"Partitioning cached {season} PBP by week...")
+    write_pbp_partitions(pl.read_parquet(legacy_path), season, cache_dir)
+    return bool(read_pbp_manifest(season, cache_dir).get('weeks'))
+
+def download_pbp(season: int) -> pl.DataFrame:
+    """
+    Downloads a full season of play-by-play data (nflverse publishes one file per season).
+    """
+    try:
+        pbp_df = nfl.load_pbp(seasons=season)
+        if not isinstance(pbp_df, pl.DataFrame):
+            pbp_df = pl.from_pandas(pbp_df)
+    except Exception as e:
+        print(f"nflreadpy pbp load failed ({e}), trying manual download...")
+        url = f"https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.parquet"
+        r = requests.get(url)
+        pbp_df = pl.read_parquet(io.BytesIO(r.content))
+    return pbp_df
+
+def _http_session(pool_size: int) -> requests.Session:
+    """
+    Returns a session whose connection pool is large enough for every worker to keep a connection alive.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _fetch(session: requests.Session, url: str, timeout: int) -> bytes:
+    """
+    GETs a URL and returns the body, raising on HTTP errors.
+    """
+    r = session.get(url, timeout=timeout)
+    r.raise_for_status()
+    return r.content
+
+def _download_dataset(session: requests.Session, dataset: str, seasons: list[int], base_url: str, cache_dir: str, timeout: int) -> dict:
+    """
+    Downloads one dataset and writes it to the cache. Returns {season: path}.
+    """
+    url = f"{base_url.rstrip('/')}/{NFLVERSE_PATHS[dataset]}"
+    written = {}
+
+    if dataset == 'schedule':
+        schedule_df = pl.read_csv(io.BytesIO(_fetch(session, url, timeout)), infer_schema_length=10000)
+        for season in seasons:
+            path = os.path.join(cache_dir, f"season_{season}_schedule.parquet")
+            _write_atomic(path, schedule_df.filter(pl.col("season") == season).write_parquet)
+            written[season] = path
+        return written
+
+    season = seasons[0]
+    df = pl.read_parquet(io.BytesIO(_fetch(session, url.format(season=season), timeout)))
+    if dataset == 'pbp':
+        write_pbp_partitions(df, season, cache_dir)
+        written[season] = pbp_partition_dir(season, cache_dir)
+    else:
+        path = os.path.join(cache_dir, f"season_{season}_{dataset}.parquet")
+        _write_atomic(path, df.write_parquet)
+        written[season] = path
+    return written
+
+def download_seasons(seasons: list[int], datasets: tuple[str, ...] = ('schedule', 'pbp', 'roster'),
+                     cache_dir: str = DATA_CACHE_DIR, max_workers: int = DOWNLOAD_WORKERS,
+                     base_url: str = NFLVERSE_BASE_URL, timeout: int = 120) -> dict:
+    """
+    Downloads nflverse data for several seasons concurrently and writes it to the cache.
+    
+    Every (dataset, season) file is fetched on a bounded thread pool sharing one HTTP
+    session, so connections are reused across files. Files are written atomically; PBP
+    goes into the week-partitioned cache. The schedule is fetched once for all seasons.
+    
+    Returns {season: {dataset: path}}. Raises RuntimeError after all downloads finish
+    if any of them failed (files that succeeded are kept).
+    """
+    unknown = [d for d in datasets if d not in NFLVERSE_PATHS]
+    if unknown:
+        raise ValueError(f"Unknown dataset(s) {unknown}. Known: {', '.join(NFLVERSE_PATHS)}")
+
+    seasons = sorted(set(seasons))
+    os.makedirs(cache_dir, exist_ok=True)
+    results = {season: {} for season in seasons}
+    errors = []
+
+    with _http_session(max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for dataset in datasets:
+            jobs = [seasons] if dataset == 'schedule' else [[season] for season in seasons]
+            for job_seasons in jobs:
+                future = pool.submit(_download_dataset, session, dataset, job_seasons, base_url, cache_dir, timeout)
+                futures[future] = (dataset, job_seasons)
+
+        for future in as_completed(futures):
+            dataset, job_seasons = futures[future]
+            try:
+                for season, path in future.result().items():
+                    results[season][dataset] = path
+                print(f"Downloaded {dataset} for {', '.join(map(str, job_seasons))}")
+            except Exception as e:
+                print(f"Failed to download {dataset} for {', '.join(map(str, job_seasons))}: {e}")
+                errors.append(f"{dataset} {job_seasons}: {e}")
+
+    if errors:
+        raise RuntimeError(f"{len(errors)} download(s) failed: " + "; ".join(errors))
+
+    return results
 
 def is_standalone_game(gameday_expr: pl.Expr, gametime_expr: pl.Expr) -> pl.Expr:
     """
@@ -47,20 +327,21 @@ def load_data_with_cache(season: int) -> tuple[pl.DataFrame, pl.DataFrame, pl.Da
     """
     Loads schedule, pbp, and roster data, using local parquet cache if available.
     """
-    cache_dir = "../cache"
+    cache_dir = DATA_CACHE_DIR
     os.makedirs(cache_dir, exist_ok=True)
     
     schedule_path = os.path.join(cache_dir, f"season_{season}_schedule.parquet")
-    pbp_path = os.path.join(cache_dir, f"season_{season}_pbp.parquet")
+    pbp_dir = pbp_partition_dir(season, cache_dir)
     roster_path = os.path.join(cache_dir, f"season_{season}_roster.parquet")
     
-    if os.path.exists(schedule_path) and os.path.exists(pbp_path) and os.path.exists(roster_path):
+    if os.path.exists(schedule_path) and os.path.exists(roster_path) and ensure_pbp_partitions(season, cache_dir):
         use_cache = input("\nFound cached data. Load from cache? (y/n): ").strip().lower()
         if use_cache == 'y':
             print("Loading from cache...")
             try:
                 schedule_df = pl.read_parquet(schedule_path)
-                pbp_df = pl.read_parquet(pbp_path)
+                # Every consumer's columns: the returned frame feeds all of the stats
+                pbp_df = scan_pbp(pbp_dir).collect()
                 roster_df = pl.read_parquet(roster_path)
                 return schedule_df, pbp_df, roster_df
             except Exception as e:
@@ -80,15 +361,7 @@ def load_data_with_cache(season: int) -> tuple[pl.DataFrame, pl.DataFrame, pl.Da
         schedule_df = pl.read_csv(io.BytesIO(r.content))
 
     # PBP
-    try:
-        pbp_df = nfl.load_pbp(seasons=season)
-        if not isinstance(pbp_df, pl.DataFrame):
-            pbp_df = pl.from_pandas(pbp_df)
-    except Exception as e:
-        print(f"nflreadpy pbp load failed ({e}), trying manual download...")
-        url = f"https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.parquet"
-        r = requests.get(url)
-        pbp_df = pl.read_parquet(io.BytesIO(r.content))
+    pbp_df = download_pbp(season)
 
     # Roster
     try:
@@ -103,7 +376,12 @@ def load_data_with_cache(season: int) -> tuple[pl.DataFrame, pl.DataFrame, pl.Da
 
     print("Saving to cache...")
     schedule_df.write_parquet(schedule_path)
-    pbp_df.write_parquet(pbp_path)
     roster_df.write_parquet(roster_path)
-    
+    ensure_pbp_partitions(season, cache_dir)
+    written = write_pbp_partitions(pbp_df, season, cache_dir)
+    print(f"Updated PBP weeks: {written or 'none (no changes)'}")
+
+    # Hand back the same projection a cache hit would
+    pbp_df = scan_pbp(pbp_dir).collect()
+
     return schedule_df, pbp_df, roster_df
@@ -0,0 +1,134 @@
+import glob
+import os
+import polars as pl
+from .stats import get_first_td_scorers
+
+# File types read from a play feed drop directory
+PLAY_FEED_PATTERNS = ("*.jsonl", "*.parquet")
+
+class PlayFeed:
+    """
+    Incremental reader over an append-only drop directory of plays.
+    JSONL files may keep growing (only complete lines are read, resuming at the last
+    byte offset); parquet files are read once, when they first appear. Files are
+    consumed in name order, so writers should use sortable names (e.g. timestamps).
+    Each row uses the nflverse PBP columns (game_id, play_id, touchdown, td_player_id, ...).
+    """
+
+    def __init__(self, feed_dir: str):
+        self.feed_dir = feed_dir
+        self.offsets = {}
+        self._staged = {}
+
+    def _files(self) -> list[str]:
+        paths = []
+        for pattern in PLAY_FEED_PATTERNS:
+            paths.extend(glob.glob(os.path.join(self.feed_dir, pattern)))
+        return sorted(paths)
+
+    def _read_jsonl(self, path: str, offsets: dict) -> pl.DataFrame | None:
+        offset = self.offsets.get(path, 0)
+        if os.path.getsize(path) <= offset:
+            return None
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+
+        # A writer may be mid-line; leave the partial line for the next read
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return None
+        offsets[path] = offset + end
+
+        lines = data[:end].strip()
+        if not lines:
+            return None
+        return pl.read_ndjson(lines, infer_schema_length=None)
+
+    def _read_parquet(self, path: str, offsets: dict) -> pl.DataFrame | None:
+        if path in self.offsets:
+            return None
+        offsets[path] = os.path.getsize(path)
+        return pl.read_parquet(path)
+
+    def read_new(self, commit: bool = True) -> pl.DataFrame:
+        """
+        Returns the plays added since the previous committed read (an empty DataFrame if none).
+        With commit=False the read position only moves on commit(), so a caller that
+        fails to process the plays gets them again on its next read.
+        """
+        self._staged = {}
+        if not os.path.isdir(self.feed_dir):
+            return pl.DataFrame()
+
+        offsets = {}
+        frames = []
+        for path in self._files():
+            if path.endswith(".jsonl"):
+                df = self._read_jsonl(path, offsets)
+            else:
+                df = self._read_parquet(path, offsets)
+            if df is not None and df.height > 0:
+                frames.append(df)
+
+        if commit:
+            self.offsets.update(offsets)
+        else:
+            self._staged = offsets
+
+        if not frames:
+            return pl.DataFrame()
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def commit(self) -> None:
+        """
+        Moves the read position past the plays returned by the last read_new(commit=False).
+        """
+        self.offsets.update(self._staged)
+        self._staged = {}
+
+class FirstTdTracker:
+    """
+    Finds each game's first touchdown as plays stream in.
+    Plays are expected in order within a game (as the live feed publishes them), so
+    once a game's first TD is known its later plays are ignored. Scorers are resolved
+    exactly as get_first_td_scorers does for a full season.
+    """
+
+    def __init__(self, roster_df: pl.DataFrame | None = None):
+        self.roster_df = roster_df
+        self.first_tds = {}
+
+    def detect(self, plays_df: pl.DataFrame) -> dict:
+        """
+        Returns the first TDs in a batch of plays for games not yet recorded, without
+        recording them: {game_id: {'player', 'team', 'player_id', 'is_home_game'}}
+        """
+        if plays_df.height == 0 or 'game_id' not in plays_df.columns:
+            return {}
+
+        pending = plays_df.filter(~pl.col('game_id').cast(pl.Utf8).is_in(list(self.first_tds)))
+        if pending.height == 0:
+            return {}
+
+        for column in ('touchdown', 'td_player_name'):
+            if column not in pending.columns:
+                pending = pending.with_columns(pl.lit(None).alias(column))
+
+        return get_first_td_scorers(pending, roster_df=self.roster_df)
+
+    def record(self, first_tds: dict) -> None:
+        """
+        Marks games' first TDs as handled; their later plays are ignored from now on.
+        """
+        self.first_tds.update(first_tds)
+
+    def update(self, plays_df: pl.DataFrame) -> dict:
+        """
+        Consumes a batch of plays and returns (and records) the first TDs found in it:
+        {game_id: {'player', 'team', 'player_id', 'is_home_game'}}
+        """
+        found = self.detect(plays_df)
+        self.record(found)
+        return found
@@ -0,0 +1,114 @@
+import threading
+import weakref
+import polars as pl
+
+class PlayerIndex:
+    """
+    Prebuilt roster lookups: gsis_id -> player and normalized full name -> player.
+    Each record is {'gsis_id', 'name', 'position', 'team'}; when a key appears on
+    several roster rows the first row wins, matching a filter(...)[0] lookup.
+    """
+
+    def __init__(self, roster_df: pl.DataFrame | None):
+        self.by_id = {}
+        self.by_name = {}
+
+        if roster_df is None or roster_df.height == 0:
+            return
+
+        def column(name):
+            if name in roster_df.columns:
+                return roster_df[name].cast(pl.Utf8).to_list()
+            return [None] * roster_df.height
+
+        for gsis_id, name, position, team in zip(column('gsis_id'), column('full_name'), column('position'), column('team')):
+            record = {'gsis_id': gsis_id, 'name': name, 'position': position, 'team': team}
+            if gsis_id and gsis_id not in self.by_id:
+                self.by_id[gsis_id] = record
+            if name:
+                self.by_name.setdefault(self.normalize(name), record)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """
+        Normalizes a full name for lookups (case-insensitive).
+        """
+        return name.lower()
+
+    def get(self, player_id: str | None) -> dict | None:
+        """
+        Returns the roster record for a gsis_id.
+        """
+        return self.by_id.get(player_id) if player_id else None
+
+    def find_by_name(self, player_name: str | None) -> dict | None:
+        """
+        Returns the roster record for an exact (case-insensitive) full name.
+        """
+        return self.by_name.get(self.normalize(player_name)) if player_name else None
+
+    def gsis_id_for_name(self, player_name: str | None) -> str | None:
+        """
+        Returns the gsis_id for an exact (case-insensitive) full name.
+        """
+        record = self.find_by_name(player_name)
+        return record['gsis_id'] if record else None
+
+    def lookup(self, player_id: str | None = None, player_name: str | None = None) -> dict | None:
+        """
+        Returns the roster record by ID, falling back to name.
+        """
+        return self.get(player_id) or self.find_by_name(player_name)
+
+    def position(self, player_id: str | None, player_name: str | None, default: str | None = "UNK") -> str | None:
+        """
+        Returns a player's position by ID, falling back to name.
+        """
+        record = self.lookup(player_id, player_name)
+        return record['position'] if record else default
+
+    def id_frame(self) -> pl.DataFrame:
+        """
+        Returns (gsis_id, name, position, team) for joining against player IDs.
+        """
+        records = list(self.by_id.values())
+        return pl.DataFrame(
+            {
+                'gsis_id': list(self.by_id.keys()),
+                'name': [r['name'] for r in records],
+                'position': [r['position'] for r in records],
+                'team': [r['team'] for r in records],
+            },
+            schema={'gsis_id': pl.Utf8, 'name': pl.Utf8, 'position': pl.Utf8, 'team': pl.Utf8}
+        )
+
+    def name_frame(self) -> pl.DataFrame:
+        """
+        Returns (name_key, position) for joining against normalized names.
+        """
+        return pl.DataFrame(
+            {'name_key': list(self.by_name.keys()), 'position': [r['position'] for r in self.by_name.values()]},
+            schema={'name_key': pl.Utf8, 'position': pl.Utf8}
+        )
+
+# Indexes are reused for as long as the roster DataFrame they were built from is alive
+_index_cache = {}
+_index_cache_lock = threading.Lock()
+
+def get_player_index(roster_df: pl.DataFrame | None) -> PlayerIndex:
+    """
+    Returns the PlayerIndex for a roster DataFrame, building it once per DataFrame object.
+    """
+    if roster_df is None:
+        return PlayerIndex(None)
+
+    key = id(roster_df)
+    with _index_cache_lock:
+        entry = _index_cache.get(key)
+        if entry is not None and entry[0]() is roster_df:
+            return entry[1]
+
+    index = PlayerIndex(roster_df)
+    with _index_cache_lock:
+        _index_cache[key] = (weakref.ref(roster_df, lambda _: _index_cache.pop(key, None)), index)
+    return index
@@ -1,236 +1,416 @@
 import polars as pl
+from .players import PlayerIndex, get_player_index
 
-def get_first_td_scorers(pbp_df: pl.DataFrame, target_game_ids: list[str] | None = None, roster_df: pl.DataFrame | None = None) -> dict:
+# Columns tried in order when the scorer is not on the roster
+FIRST_TD_NAME_COLUMNS = ['fantasy_player_name', 'player_name', 'td_player_name', 'desc', 'description']
+
+FIRST_TD_SCHEMA = {
+    'game_id': pl.Utf8,
+    'player': pl.Utf8,
+    'team': pl.Utf8,
+    'player_id': pl.Utf8,
+    'is_home_game': pl.Boolean,
+}
+
+def _non_empty(column: str, columns: list[str]) -> pl.Expr:
     """
-    Processes play-by-play data to find the first TD scorer for specified games.
+    Returns the column as a string with empty values nulled (null literal if the column is missing).
     """
-    first_td_map = {}
-    
-    if pbp_df.height == 0:
-        return first_td_map
+    if column not in columns:
+        return pl.lit(None, dtype=pl.Utf8)
+    value = pl.col(column).cast(pl.Utf8)
+    return pl.when(value != "").then(value)
+
+def _td_plays(pbp_df: pl.DataFrame, target_game_ids: list[str] | None) -> pl.LazyFrame:
+    """
+    Returns touchdown plays, optionally limited to specific games.
+    """
+    lf = pbp_df.lazy()
 
     # Optimization: Filter for only the games we care about
     if target_game_ids:
-        pbp_df = pbp_df.filter(pl.col("game_id").is_in(target_game_ids))
-        if pbp_df.height == 0:
-            return first_td_map
+        lf = lf.filter(pl.col("game_id").is_in(target_game_ids))
 
-    # Filter for touchdown plays
-    td_plays = pbp_df.filter(
+    return lf.filter(
         (pl.col('touchdown') == 1) | 
         (pl.col('td_player_name').is_not_null())
     )
 
-    if td_plays.height == 0:
-        return first_td_map
+def _with_td_scorer(td_plays: pl.LazyFrame, columns: list[str], roster_df: pl.DataFrame | None) -> pl.LazyFrame:
+    """
+    Adds player_id, player (scorer name) and team columns to touchdown plays.
+    The name comes from the roster by td_player_id, falling back to the PBP name columns.
+    """
+    player_id = pl.col('td_player_id').cast(pl.Utf8) if 'td_player_id' in columns else pl.lit(None, dtype=pl.Utf8)
+    td_plays = td_plays.with_columns(player_id.alias('player_id'))
+
+    # 1. Roster lookup (ID -> full name)
+    name_sources = []
+    if roster_df is not None and "gsis_id" in roster_df.columns and "full_name" in roster_df.columns:
+        id_to_name = (
+            roster_df.lazy()
+            .select(pl.col("gsis_id").cast(pl.Utf8), pl.col("full_name").cast(pl.Utf8).alias("_roster_name"))
+            .filter((pl.col("gsis_id") != "") & (pl.col("_roster_name") != ""))
+            .unique(subset="gsis_id", keep="last", maintain_order=True)
+        )
+        td_plays = td_plays.join(
+            id_to_name, left_on="player_id", right_on="gsis_id", how="left", maintain_order="left"
+        )
+        name_sources.append(pl.col("_roster_name"))
+
+    # 2. PBP columns if no roster match; descriptions read "<name> for N yards..."
+    for key in FIRST_TD_NAME_COLUMNS:
+        name = _non_empty(key, columns)
+        if key in ['desc', 'description']:
+            name = pl.when(name.str.contains(" for ", literal=True)).then(
+                name.str.split(" for ").list.first().str.strip_chars()
+            ).otherwise(name)
+        name_sources.append(name)
+
+    team = pl.coalesce(_non_empty('td_team', columns), _non_empty('posteam', columns), pl.lit("UNK"))
+
+    return td_plays.with_columns(
+        pl.col('game_id').cast(pl.Utf8),
+        pl.coalesce(name_sources).alias('player'),
+        team.alias('team'),
+    ).filter(
+        pl.col('game_id').is_not_null() & (pl.col('game_id') != "") &
+        pl.col('player').is_not_null() & (pl.col('player') != "")
+    )
+
+def get_first_td_scorers_df(pbp_df: pl.DataFrame, target_game_ids: list[str] | None = None, roster_df: pl.DataFrame | None = None) -> pl.DataFrame:
+    """
+    Processes play-by-play data to find the first TD scorer for specified games.
+    Returns one row per game: game_id, player, team, player_id, is_home_game.
+    """
+    if pbp_df.height == 0:
+        return pl.DataFrame(schema=FIRST_TD_SCHEMA)
+
+    td_plays = _td_plays(pbp_df, target_game_ids)
 
-    # Sort by game_id and then by play_id/time
-    if 'play_id' in td_plays.columns:
+    # Sort by game_id and then by play_id/time, then take the first touchdown for each game_id
+    if 'play_id' in pbp_df.columns:
         td_plays = td_plays.sort(['game_id', 'play_id'])
     else:
-        td_plays = td_plays.sort(['game_id', 'qtr', 'time']) 
+        td_plays = td_plays.sort(['game_id', 'qtr', 'time'])
+    first_td_per_game = td_plays.group_by('game_id', maintain_order=True).first()
+
+    home_team = _non_empty('home_team', pbp_df.columns)
+
+    return (
+        _with_td_scorer(first_td_per_game, pbp_df.columns, roster_df)
+        .select(
+            'game_id', 'player', 'team', 'player_id',
+            pl.when(home_team.is_not_null()).then(pl.col('team') == home_team).alias('is_home_game'),
+        )
+        .collect()
+    )
+
+def get_first_td_scorers(pbp_df: pl.DataFrame, target_game_ids: list[str] | None = None, roster_df: pl.DataFrame | None = None) -> dict:
+    """
+    Processes play-by-play data to find the first TD scorer for specified games.
+    Returns: {game_id: {'player': str, 'team': str, 'player_id': str, 'is_home_game': bool}}
+    """
+    first_td_df = get_first_td_scorers_df(pbp_df, target_game_ids=target_game_ids, roster_df=roster_df)
+    return {
+        row['game_id']: {
+            'player': row['player'],
+            'team': row['team'],
+            'player_id': row['player_id'],
+            'is_home_game': row['is_home_game']
+        }
+        for row in first_td_df.iter_rows(named=True)
+    }
+
+def get_all_td_scorers_df(pbp_df: pl.DataFrame, target_game_ids: list[str] | None = None, roster_df: pl.DataFrame | None = None) -> pl.DataFrame:
+    """
+    Processes play-by-play data to find ALL touchdown scorers for specified games.
+    Returns one row per (game, scorer) in play order: game_id, player, team, player_id.
+    A scorer is identified by player ID when present, otherwise by normalized name.
+    """
+    schema = {k: v for k, v in FIRST_TD_SCHEMA.items() if k != 'is_home_game'}
+    if pbp_df.height == 0:
+        return pl.DataFrame(schema=schema)
+
+    return (
+        _with_td_scorer(_td_plays(pbp_df, target_game_ids), pbp_df.columns, roster_df)
+        .with_columns(
+            pl.when(pl.col('player_id').is_not_null() & (pl.col('player_id') != ""))
+            .then(pl.col('player_id'))
+            .otherwise(pl.col('player').str.to_lowercase().str.strip_chars())
+            .alias('_scorer_key')
+        )
+        .unique(subset=['game_id', '_scorer_key'], keep='first', maintain_order=True)
+        .select(list(schema))
+        .collect()
+    )
+
+def get_all_td_scorers(pbp_df: pl.DataFrame, target_game_ids: list[str] | None = None, roster_df: pl.DataFrame | None = None) -> dict:
+    """
+    Processes play-by-play data to find ALL touchdown scorers for specified games.
+    Used for grading Anytime TD Scorer (ATTS) picks.
+    Returns: {game_id: [{'player': str, 'team': str, 'player_id': str}, ...]}
+    """
+    all_td_df = get_all_td_scorers_df(pbp_df, target_game_ids=target_game_ids, roster_df=roster_df)
+    all_td_map = {}
+    for row in all_td_df.iter_rows(named=True):
+        all_td_map.setdefault(row['game_id'], []).append({
+            'player': row['player'],
+            'team': row['team'],
+            'player_id': row['player_id']
+        })
+    return all_td_map
+
+GAME_TOUCHDOWNS_SCHEMA = {
+    'game_id': pl.Utf8,
+    'order': pl.Int64,
+    'player': pl.Utf8,
+    'team': pl.Utf8,
+    'position': pl.Utf8,
+    'quarter': pl.Float64,
+    'time': pl.Utf8,
+}
+
+def get_game_touchdowns_df(pbp_df: pl.DataFrame, roster_df: pl.DataFrame | None = None) -> pl.DataFrame:
+    """
+    Processes play-by-play data into every game's touchdowns in play order.
+    Returns one row per touchdown play with a known scorer, grouped by game:
+    game_id, order (1-based among the game's TD plays), player, team, position, quarter, time.
+    Position comes from the roster row that supplied the scorer's name (null otherwise).
+    """
+    if pbp_df.height == 0:
+        return pl.DataFrame(schema=GAME_TOUCHDOWNS_SCHEMA)
 
-    # Get the first touchdown for each game_id
-    first_td_per_game = td_plays.group_by('game_id').first()
+    td_plays = _td_plays(pbp_df, None)
+    if 'play_id' in pbp_df.columns:
+        td_plays = td_plays.sort(['game_id', 'play_id'])
+    else:
+        td_plays = td_plays.sort(['game_id', 'qtr', 'time'])
+    # Number plays before scorer-less ones are dropped, so order matches the play sequence
+    td_plays = td_plays.with_columns((pl.int_range(pl.len()).over('game_id') + 1).alias('order'))
 
-    # Create a mapping from ID to Full Name if roster is provided
-    id_to_name = {}
+    position = pl.lit(None, dtype=pl.Utf8)
     if roster_df is not None and "gsis_id" in roster_df.columns and "full_name" in roster_df.columns:
-        # Create a dictionary for fast lookup
-        temp_df = roster_df.select(["gsis_id", "full_name"]).unique()
-        for r in temp_df.to_dicts():
-            if r["gsis_id"] and r["full_name"]:
-                id_to_name[r["gsis_id"]] = r["full_name"]
-
-    for row in first_td_per_game.to_dicts():
-        game_id = row.get('game_id')
-        if not game_id:
-            continue
-            
-        scorer = None
-        player_id = row.get('td_player_id')
-
-        # 1. Try Roster Lookup
-        if player_id and player_id in id_to_name:
-            scorer = id_to_name[player_id]
-
-        # 2. Try PBP columns if no roster match
-        if not scorer:
-            for key in ['fantasy_player_name', 'player_name', 'td_player_name', 'desc', 'description']:
-                if key in row and row.get(key):
-                    scorer = str(row.get(key))
-                    if key in ['desc', 'description'] and ' for ' in scorer:
-                        scorer = scorer.split(' for ')[0].strip()
-                    break
-        
-        # Get team
-        team = row.get('td_team') or row.get('posteam') or "UNK"
-        
-        # Determine if this was a home game for the scoring team
-        home_team = row.get('home_team')
-        is_home_game = (team == home_team) if home_team else None
-        
-        if scorer:
-            first_td_map[game_id] = {
-                'player': scorer, 
-                'team': team, 
-                'player_id': player_id,
-                'is_home_game': is_home_game
+        # Same roster rows (and duplicate resolution) as the scorer name lookup
+        roster_position = pl.col("position").cast(pl.Utf8) if "position" in roster_df.columns else pl.lit(None, dtype=pl.Utf8)
+        id_to_position = (
+            roster_df.lazy()
+            .select(pl.col("gsis_id").cast(pl.Utf8).alias("_position_id"), pl.col("full_name").cast(pl.Utf8), roster_position.alias("_roster_position"))
+            .filter((pl.col("_position_id") != "") & (pl.col("full_name") != ""))
+            .unique(subset="_position_id", keep="last", maintain_order=True)
+            .drop("full_name")
+        )
+        player_id = pl.col('td_player_id').cast(pl.Utf8) if 'td_player_id' in pbp_df.columns else pl.lit(None, dtype=pl.Utf8)
+        td_plays = td_plays.with_columns(player_id.alias('_position_id')).join(
+            id_to_position, on="_position_id", how="left", maintain_order="left"
+        )
+        position = pl.col("_roster_position")
+
+    quarter = pl.col('qtr') if 'qtr' in pbp_df.columns else pl.lit(None, dtype=pl.Float64)
+    time = pl.col('time').cast(pl.Utf8) if 'time' in pbp_df.columns else pl.lit(None, dtype=pl.Utf8)
+
+    return (
+        _with_td_scorer(td_plays, pbp_df.columns, roster_df)
+        .select(
+            'game_id', 'order', 'player', 'team',
+            position.alias('position'), quarter.alias('quarter'), time.alias('time')
+        )
+        .collect()
+    )
+
+class GameTouchdownIndex:
+    """
+    All games' touchdowns (get_game_touchdowns_df) with a game_id -> (offset, length)
+    index into the table, so one game's touchdowns are a slice.
+    """
+
+    def __init__(self, pbp_df: pl.DataFrame, roster_df: pl.DataFrame | None = None):
+        self.table = get_game_touchdowns_df(pbp_df, roster_df)
+        self.rows = [
+            {
+                'order': row['order'],
+                'player': row['player'],
+                'team': row['team'],
+                'position': row['position'],
+                'quarter': row['quarter'],
+                'time': row['time'],
+                'is_first_td': row['order'] == 1
             }
-            
-    return first_td_map
+            for row in self.table.iter_rows(named=True)
+        ]
+        self.ranges = {}
+        for offset, game_id in enumerate(self.table['game_id'].to_list()):
+            start, length = self.ranges.get(game_id, (offset, 0))
+            self.ranges[game_id] = (start, length + 1)
 
-def get_player_season_stats(schedule_df: pl.DataFrame, first_td_map: dict, last_n_games: int | None = None) -> dict:
+    def touchdowns(self, game_id: str) -> list[dict]:
+        """
+        Returns the game's touchdowns in order (empty if it has none):
+        [{'order', 'player', 'team', 'position', 'quarter', 'time', 'is_first_td'}, ...]
+        """
+        start, length = self.ranges.get(game_id, (0, 0))
+        return self.rows[start:start + length]
+
+def _first_td_frame(first_td_map: dict | pl.DataFrame) -> pl.DataFrame:
     """
-    Calculates season stats (games played by team, 1st TDs by player) to determine probabilities.
-    Optionally filters to the last N games for each team.
-    Returns: {player_name: {'team': str, 'first_tds': int, 'team_games': int, 'prob': float, 'player_id': str}}
+    Returns first TDs as a DataFrame (game_id, player, team, player_id) in first_td_map order.
     """
-    # 1. Get completed games sorted by date
-    completed_game_ids = list(first_td_map.keys())
-    if not completed_game_ids:
-        return {}
-        
-    relevant_games = schedule_df.filter(pl.col("game_id").is_in(completed_game_ids))
-    # Sort by gameday, gametime to ensure "last N" is accurate
-    relevant_games = relevant_games.sort(["gameday", "gametime"])
-    
-    # 2. Determine valid games per team
-    team_valid_games = {} # team -> set(game_ids)
-    
-    # Get all teams involved in these games
-    all_teams = set(relevant_games["home_team"].unique().to_list() + relevant_games["away_team"].unique().to_list())
-    
-    for team in all_teams:
-        # Find games where this team played
-        team_games_df = relevant_games.filter(
-            (pl.col("home_team") == team) | (pl.col("away_team") == team)
+    if isinstance(first_td_map, pl.DataFrame):
+        return first_td_map.select('game_id', 'player', 'team', 'player_id')
+    return pl.DataFrame(
+        {
+            'game_id': list(first_td_map.keys()),
+            'player': [d['player'] for d in first_td_map.values()],
+            'team': [d['team'] for d in first_td_map.values()],
+            'player_id': [d.get('player_id') for d in first_td_map.values()],
+        },
+        schema={'game_id': pl.Utf8, 'player': pl.Utf8, 'team': pl.Utf8, 'player_id': pl.Utf8}
+    )
+
+def get_player_season_stats_windows(schedule_df: pl.DataFrame, first_td_map: dict | pl.DataFrame, windows: tuple = (3, 5, 8, None)) -> dict:
+    """
+    Calculates get_player_season_stats for several last-N-games windows in one pass.
+    A window of None means the full season.
+    Returns: {window: {player_name: {'team', 'first_tds', 'team_games', 'prob', 'player_id'}}}
+    """
+    tds = _first_td_frame(first_td_map).with_row_index('_order')
+    if tds.height == 0:
+        return {n: {} for n in windows}
+
+    # 1. Team-game long table: one row per (team, completed game), numbered back from the team's latest game
+    relevant_games = (
+        schedule_df.lazy()
+        .filter(pl.col("game_id").is_in(tds['game_id'].implode()))
+        .sort(["gameday", "gametime"], maintain_order=True)
+        .with_row_index('_slot')
+    )
+    team_games = (
+        pl.concat([
+            relevant_games.select('game_id', '_slot', pl.col('home_team').alias('team')),
+            relevant_games.select('game_id', '_slot', pl.col('away_team').alias('team')),
+        ])
+        .unique(['team', 'game_id'])
+        .with_columns(
+            pl.col('_slot').rank('ordinal', descending=True).over('team').alias('games_ago')
         )
-        
-        # Get IDs
-        all_ids = team_games_df["game_id"].to_list()
-        
-        if last_n_games:
-            # Take last N
-            valid_ids = set(all_ids[-last_n_games:])
-        else:
-            valid_ids = set(all_ids)
-            
-        team_valid_games[team] = valid_ids
+    )
 
-    # 3. Count 1st TDs per Player (filtering by valid games)
-    player_stats = {}
-    
-    for game_id, data in first_td_map.items():
-        p_name = data['player']
-        p_team = data['team']
-        p_id = data.get('player_id')
-        
-        # Check if this game is in the player's team's valid list
-        # (It should be, unless we are filtering)
-        if p_team in team_valid_games and game_id in team_valid_games[p_team]:
-             if p_name not in player_stats:
-                player_stats[p_name] = {'team': p_team, 'first_tds': 0, 'player_id': p_id}
-             player_stats[p_name]['first_tds'] += 1
-             # Update team/id to most recent
-             player_stats[p_name]['team'] = p_team
-             if p_id: player_stats[p_name]['player_id'] = p_id
-        
-    # 4. Calculate Probabilities
-    final_stats = {}
-    for p_name, stats in player_stats.items():
-        team = stats['team']
-        # Denominator is the number of valid games for that team
-        valid_ids = team_valid_games.get(team, set())
-        games_count = len(valid_ids)
-        
-        first_tds = stats['first_tds']
-        
-        if games_count > 0:
-            prob = first_tds / games_count
-            final_stats[p_name] = {
-                'team': team,
-                'first_tds': first_tds,
-                'team_games': games_count,
-                'prob': prob,
-                'player_id': stats.get('player_id')
+    # 2. Attach each first TD to its scoring team's game (TDs for a team not in the game are ignored)
+    scored = (
+        tds.lazy()
+        .join(team_games.select('team', 'game_id', 'games_ago'), on=['team', 'game_id'], how='inner')
+        .sort('_order')
+    )
+
+    plans = []
+    for n in windows:
+        in_window = pl.col('games_ago') <= n if n else pl.lit(True)
+        team_counts = team_games.filter(in_window).group_by('team').agg(pl.len().alias('team_games'))
+        plans.append(
+            scored.filter(in_window)
+            .group_by('player', maintain_order=True)
+            .agg(
+                # Team is the most recent one the player scored for
+                pl.col('team').last(),
+                pl.len().alias('first_tds'),
+                pl.coalesce(
+                    pl.col('player_id').filter(pl.col('player_id').is_not_null() & (pl.col('player_id') != "")).last(),
+                    pl.col('player_id').first()
+                ).alias('player_id'),
+            )
+            .join(team_counts, on='team', how='inner', maintain_order='left')
+            .with_columns((pl.col('first_tds') / pl.col('team_games')).alias('prob'))
+        )
+
+    results = {}
+    for n, df in zip(windows, pl.collect_all(plans)):
+        results[n] = {
+            row['player']: {
+                'team': row['team'],
+                'first_tds': row['first_tds'],
+                'team_games': row['team_games'],
+                'prob': row['prob'],
+                'player_id': row['player_id']
             }
-            
-    return final_stats
+            for row in df.iter_rows(named=True)
+        }
+    return results
 
-def get_player_position(player_id: str, player_name: str, roster_df: pl.DataFrame) -> str:
+def get_player_season_stats(schedule_df: pl.DataFrame, first_td_map: dict | pl.DataFrame, last_n_games: int | None = None) -> dict:
     """
-    Helper to find a player's position from the roster DataFrame.
+    Calculates season stats (games played by team, 1st TDs by player) to determine probabilities.
+    Optionally filters to the last N games for each team.
+    Returns: {player_name: {'team': str, 'first_tds': int, 'team_games': int, 'prob': float, 'player_id': str}}
     """
-    # Try by ID first (gsis_id is standard in nflreadpy rosters)
-    if player_id:
-        # Check if gsis_id column exists
-        if "gsis_id" in roster_df.columns:
-            res = roster_df.filter(pl.col("gsis_id") == player_id)
-            if res.height > 0:
-                return res["position"][0]
-    
-    # Try by name
-    if player_name:
-        # Check if full_name column exists
-        if "full_name" in roster_df.columns:
-            res = roster_df.filter(pl.col("full_name").str.to_lowercase() == player_name.lower())
-            if res.height > 0:
-                return res["position"][0]
-            
-    return "UNK"
+    return get_player_season_stats_windows(schedule_df, first_td_map, windows=(last_n_games,))[last_n_games]
+
+def get_player_position(player_id: str, player_name: str, roster_df: pl.DataFrame | PlayerIndex) -> str:
+    """
+    Helper to find a player's position from the roster (by gsis_id, then by full name).
+    Accepts a roster DataFrame or a prebuilt PlayerIndex.
+    """
+    index = roster_df if isinstance(roster_df, PlayerIndex) else get_player_index(roster_df)
+    return index.position(player_id, player_name)
+
+DEFENSE_RANK_POSITIONS = ['WR', 'RB', 'TE', 'QB', 'Total']
 
-def calculate_defense_rankings(schedule_df: pl.DataFrame, first_td_map: dict, roster_df: pl.DataFrame) -> dict:
+def calculate_defense_rankings(schedule_df: pl.DataFrame, first_td_map: dict | pl.DataFrame, roster_df: pl.DataFrame | PlayerIndex) -> dict:
     """
     Calculates defense rankings vs positions based on First TDs allowed.
     Rank 1 = Fewest Allowed (Best Defense), Rank 32 = Most Allowed (Worst Defense).
+    Ties are broken alphabetically by team.
     Returns: {team: {pos: rank}}
     """
-    # Defense Team -> {WR: 0, RB: 0, TE: 0, QB: 0, Other: 0}
-    defense_stats = {}
-    all_teams = set(schedule_df["home_team"].unique().to_list() + schedule_df["away_team"].unique().to_list())
-    for t in all_teams:
-        defense_stats[t] = {'WR': 0, 'RB': 0, 'TE': 0, 'QB': 0, 'Other': 0, 'Total': 0}
+    index = roster_df if isinstance(roster_df, PlayerIndex) else get_player_index(roster_df)
 
-    # Get game details
-    games_df = schedule_df.filter(pl.col("game_id").is_in(list(first_td_map.keys())))
-    game_map = {row['game_id']: {'home': row['home_team'], 'away': row['away_team']} for row in games_df.select(['game_id', 'home_team', 'away_team']).to_dicts()}
-    
-    for game_id, data in first_td_map.items():
-        if game_id not in game_map: continue
-        
-        scorer_team = data['team']
-        player_name = data['player']
-        player_id = data.get('player_id')
-        
-        game_info = game_map[game_id]
-        if scorer_team == game_info['home']: defense_team = game_info['away']
-        elif scorer_team == game_info['away']: defense_team = game_info['home']
-        else: continue
-            
-        pos = get_player_position(player_id, player_name, roster_df)
-        if pos in ['WR', 'RB', 'TE', 'QB']: group_pos = pos
-        else: group_pos = 'Other'
-            
-        if defense_team in defense_stats:
-            defense_stats[defense_team][group_pos] += 1
-            defense_stats[defense_team]['Total'] += 1
-
-    # Convert counts to ranks
-    # We want to rank for each position.
-    rankings = {} # team -> {pos: rank}
-    for t in all_teams: rankings[t] = {}
-    
-    for pos in ['WR', 'RB', 'TE', 'QB', 'Total']:
-        # Sort teams by count allowed (ascending)
-        # Fewest allowed = Rank 1 (Best Defense)
-        # Most allowed = Rank 32 (Worst Defense)
-        sorted_teams = sorted(defense_stats.items(), key=lambda x: x[1].get(pos, 0))
-        
-        for rank, (team, stats) in enumerate(sorted_teams, 1):
-            rankings[team][pos] = rank
-            
-    return rankings
+    all_teams = pl.concat([
+        schedule_df.select(pl.col("home_team").alias("defense_team")),
+        schedule_df.select(pl.col("away_team").alias("defense_team")),
+    ]).unique().sort("defense_team")
+
+    games = schedule_df.select(['game_id', 'home_team', 'away_team'])
+    by_id = index.id_frame().select('gsis_id', pl.col('position').alias('_id_position'), pl.lit(True).alias('_id_hit'))
+    by_name = index.name_frame().rename({'position': '_name_position'})
+
+    # One row per first TD with the defense that allowed it and the scorer's position
+    tds = (
+        _first_td_frame(first_td_map).lazy()
+        .join(games.lazy(), on='game_id', how='inner')
+        .with_columns(
+            pl.when(pl.col('team') == pl.col('home_team')).then(pl.col('away_team'))
+            .when(pl.col('team') == pl.col('away_team')).then(pl.col('home_team'))
+            .alias('defense_team'),
+            pl.col('player').str.to_lowercase().alias('name_key'),
+        )
+        .filter(pl.col('defense_team').is_not_null())
+        .join(by_id.lazy(), left_on='player_id', right_on='gsis_id', how='left')
+        .join(by_name.lazy(), on='name_key', how='left')
+        .with_columns(
+            pl.when(pl.col('_id_hit')).then(pl.col('_id_position'))
+            .otherwise(pl.col('_name_position')).alias('position')
+        )
+    )
+
+    # Pivot to one row per defense with a count column per position group
+    counts = (
+        all_teams.lazy()
+        .join(
+            tds.group_by('defense_team').agg(
+                *[(pl.col('position') == pos).sum().alias(pos) for pos in DEFENSE_RANK_POSITIONS[:-1]],
+                pl.len().alias('Total')
+            ),
+            on='defense_team', how='left', maintain_order='left'
+        )
+        .with_columns(pl.col(DEFENSE_RANK_POSITIONS).fill_null(0))
+        # Fewest allowed = Rank 1 (Best Defense), Most allowed = Rank 32 (Worst Defense)
+        .with_columns(pl.col(DEFENSE_RANK_POSITIONS).rank('ordinal').cast(pl.Int64))
+        .collect()
+    )
+
+    return {
+        row['defense_team']: {pos: row[pos] for pos in DEFENSE_RANK_POSITIONS}
+        for row in counts.iter_rows(named=True)
+    }
 
 def calculate_fair_odds(prob: float) -> int:
     """
@@ -246,6 +426,65 @@ def calculate_fair_odds(prob: float) -> int:
     else:
         return int(((1 - prob) / prob) * 100)
 
+def _player_situation_plan(pbp_df: pl.DataFrame, roster_df: pl.DataFrame | PlayerIndex | None, situations: tuple[str, ...] = ('rz', 'od')) -> pl.LazyFrame:
+    """
+    Builds one lazy plan of per-player opportunity/TD counts for each situation
+    ('rz' = red zone, 'od' = opening drive). Each play contributes an opportunity for its
+    rusher and its receiver and a TD for its TD scorer; situation flags are computed once
+    and shared. Columns: player_id, name, then <situation>_opps / <situation>_tds.
+    """
+    flags = {
+        'rz': (pl.col("yardline_100") <= 20),
+        # Opening drive: min drive number per game per posteam (plays with null keys never qualify)
+        'od': (
+            pl.col("drive").is_not_null() & pl.col("game_id").is_not_null() & pl.col("posteam").is_not_null() &
+            (pl.col("drive") == pl.col("drive").min().over(["game_id", "posteam"]))
+        ),
+    }
+
+    flagged = pbp_df.lazy().select(
+        "rusher_player_id", "receiver_player_id", "td_player_id", "touchdown",
+        *[flags[sit].fill_null(False).alias(f"_{sit}") for sit in situations]
+    ).filter(pl.any_horizontal([pl.col(f"_{sit}") for sit in situations]))
+
+    sit_cols = [f"_{sit}" for sit in situations]
+    events = pl.concat([
+        flagged.select(pl.col("rusher_player_id").alias("player_id"), pl.lit(1).alias("_opp"), pl.lit(0).alias("_td"), *sit_cols),
+        flagged.select(pl.col("receiver_player_id").alias("player_id"), pl.lit(1).alias("_opp"), pl.lit(0).alias("_td"), *sit_cols),
+        flagged.filter(pl.col("touchdown") == 1)
+            .select(pl.col("td_player_id").alias("player_id"), pl.lit(0).alias("_opp"), pl.lit(1).alias("_td"), *sit_cols),
+    ]).filter(pl.col("player_id").is_not_null() & (pl.col("player_id") != ""))
+
+    counts = events.group_by("player_id").agg(
+        *[
+            agg
+            for sit in situations
+            for agg in (
+                (pl.col("_opp") * pl.col(f"_{sit}")).sum().alias(f"{sit}_opps"),
+                (pl.col("_td") * pl.col(f"_{sit}")).sum().alias(f"{sit}_tds"),
+            )
+        ]
+    )
+
+    # Name from the roster, falling back to the ID
+    index = roster_df if isinstance(roster_df, PlayerIndex) else get_player_index(roster_df)
+    names = index.id_frame().select("gsis_id", "name").filter(pl.col("name").is_not_null() & (pl.col("name") != ""))
+    return (
+        counts.join(names.lazy(), left_on="player_id", right_on="gsis_id", how="left")
+        .with_columns(pl.coalesce("name", "player_id").alias("name"))
+        .sort("player_id")
+    )
+
+def _player_situation_dicts(df: pl.DataFrame, prefix: str) -> dict:
+    """
+    Converts per-player counts to {player_name: {'<prefix>_opps': int, '<prefix>_tds': int}}.
+    """
+    opps, tds = f"{prefix}_opps", f"{prefix}_tds"
+    return {
+        row['name']: {opps: row[opps], tds: row[tds]}
+        for row in df.filter((pl.col(opps) > 0) | (pl.col(tds) > 0)).select('name', opps, tds).iter_rows(named=True)
+    }
+
 def get_red_zone_stats(pbp_df: pl.DataFrame, roster_df: pl.DataFrame) -> dict:
     """
     Calculates Red Zone (<= 20 yards) stats for players.
@@ -253,61 +492,7 @@ def get_red_zone_stats(pbp_df: pl.DataFrame, roster_df: pl.DataFrame) -> dict:
     """
     if pbp_df.height == 0:
         return {}
-
-    # Filter for Red Zone plays
-    rz_plays = pbp_df.filter(pl.col("yardline_100") <= 20)
-    
-    if rz_plays.height == 0:
-        return {}
-
-    # 1. Rushing Opps (rusher_player_id)
-    rush_opps = rz_plays.filter(pl.col("rusher_player_id").is_not_null()) \
-        .group_by("rusher_player_id").count().rename({"count": "rushes"})
-        
-    # 2. Receiving Targets (receiver_player_id)
-    rec_opps = rz_plays.filter(pl.col("receiver_player_id").is_not_null()) \
-        .group_by("receiver_player_id").count().rename({"count": "targets"})
-        
-    # 3. Touchdowns (td_player_id)
-    tds = rz_plays.filter((pl.col("touchdown") == 1) & (pl.col("td_player_id").is_not_null())) \
-        .group_by("td_player_id").count().rename({"count": "tds"})
-
-    # Merge these
-    all_ids = set()
-    if "rusher_player_id" in rush_opps.columns:
-        all_ids.update(rush_opps["rusher_player_id"].to_list())
-    if "receiver_player_id" in rec_opps.columns:
-        all_ids.update(rec_opps["receiver_player_id"].to_list())
-    if "td_player_id" in tds.columns:
-        all_ids.update(tds["td_player_id"].to_list())
-        
-    # Create ID to Name map
-    id_to_name = {}
-    if roster_df is not None and "gsis_id" in roster_df.columns and "full_name" in roster_df.columns:
-        temp_df = roster_df.select(["gsis_id", "full_name"]).unique()
-        for r in temp_df.to_dicts():
-            if r["gsis_id"] and r["full_name"]:
-                id_to_name[r["gsis_id"]] = r["full_name"]
-                
-    # Build result dict
-    final_stats = {}
-    
-    rush_map = {row['rusher_player_id']: row['rushes'] for row in rush_opps.to_dicts()} if rush_opps.height > 0 else {}
-    rec_map = {row['receiver_player_id']: row['targets'] for row in rec_opps.to_dicts()} if rec_opps.height > 0 else {}
-    td_map = {row['td_player_id']: row['tds'] for row in tds.to_dicts()} if tds.height > 0 else {}
-    
-    for pid in all_ids:
-        if not pid: continue
-        
-        name = id_to_name.get(pid, pid) # Fallback to ID if name not found
-        
-        opps = rush_map.get(pid, 0) + rec_map.get(pid, 0)
-        td_count = td_map.get(pid, 0)
-        
-        if opps > 0 or td_count > 0:
-            final_stats[name] = {'rz_opps': opps, 'rz_tds': td_count}
-            
-    return final_stats
+    return _player_situation_dicts(_player_situation_plan(pbp_df, roster_df, ('rz',)).collect(), 'rz')
 
 def get_opening_drive_stats(pbp_df: pl.DataFrame, roster_df: pl.DataFrame) -> dict:
     """
@@ -316,69 +501,7 @@ def get_opening_drive_stats(pbp_df: pl.DataFrame, roster_df: pl.DataFrame) -> di
     """
     if pbp_df.height == 0:
         return {}
-
-    # Identify opening drives: Min drive number per game per posteam
-    valid_drives = pbp_df.filter(pl.col("drive").is_not_null())
-    
-    if valid_drives.height == 0:
-        return {}
-        
-    opening_drives = valid_drives.group_by(["game_id", "posteam"]).agg(pl.col("drive").min().alias("min_drive"))
-    
-    # Join back to filter pbp
-    od_plays = valid_drives.join(opening_drives, left_on=["game_id", "posteam"], right_on=["game_id", "posteam"])
-    od_plays = od_plays.filter(pl.col("drive") == pl.col("min_drive"))
-    
-    if od_plays.height == 0:
-        return {}
-
-    # 1. Rushing Opps
-    rush_opps = od_plays.filter(pl.col("rusher_player_id").is_not_null()) \
-        .group_by("rusher_player_id").count().rename({"count": "rushes"})
-        
-    # 2. Receiving Targets
-    rec_opps = od_plays.filter(pl.col("receiver_player_id").is_not_null()) \
-        .group_by("receiver_player_id").count().rename({"count": "targets"})
-        
-    # 3. Touchdowns
-    tds = od_plays.filter((pl.col("touchdown") == 1) & (pl.col("td_player_id").is_not_null())) \
-        .group_by("td_player_id").count().rename({"count": "tds"})
-
-    # Merge
-    all_ids = set()
-    if "rusher_player_id" in rush_opps.columns:
-        all_ids.update(rush_opps["rusher_player_id"].to_list())
-    if "receiver_player_id" in rec_opps.columns:
-        all_ids.update(rec_opps["receiver_player_id"].to_list())
-    if "td_player_id" in tds.columns:
-        all_ids.update(tds["td_player_id"].to_list())
-        
-    # Create ID to Name map
-    id_to_name = {}
-    if roster_df is not None and "gsis_id" in roster_df.columns and "full_name" in roster_df.columns:
-        temp_df = roster_df.select(["gsis_id", "full_name"]).unique()
-        for r in temp_df.to_dicts():
-            if r["gsis_id"] and r["full_name"]:
-                id_to_name[r["gsis_id"]] = r["full_name"]
-                
-    final_stats = {}
-    
-    rush_map = {row['rusher_player_id']: row['rushes'] for row in rush_opps.to_dicts()} if rush_opps.height > 0 else {}
-    rec_map = {row['receiver_player_id']: row['targets'] for row in rec_opps.to_dicts()} if rec_opps.height > 0 else {}
-    td_map = {row['td_player_id']: row['tds'] for row in tds.to_dicts()} if tds.height > 0 else {}
-    
-    for pid in all_ids:
-        if not pid: continue
-        
-        name = id_to_name.get(pid, pid)
-        
-        opps = rush_map.get(pid, 0) + rec_map.get(pid, 0)
-        td_count = td_map.get(pid, 0)
-        
-        if opps > 0 or td_count > 0:
-            final_stats[name] = {'od_opps': opps, 'od_tds': td_count}
-            
-    return final_stats
+    return _player_situation_dicts(_player_situation_plan(pbp_df, roster_df, ('od',)).collect(), 'od')
 
 def calculate_kelly_criterion(prob: float, decimal_odds: float, bankroll: float = 1000.0, fractional: float = 0.25) -> float:
     """
@@ -404,6 +527,41 @@ def calculate_kelly_criterion(prob: float, decimal_odds: float, bankroll: float
         
     return bankroll * f_star * fractional
 
+def _team_red_zone_splits_plan(pbp_df: pl.DataFrame) -> pl.LazyFrame:
+    """
+    Builds the lazy plan of red zone run/pass counts per team.
+    """
+    # We only care about plays that are actually runs or passes (exclude FGs, punts, etc if any)
+    # play_type is usually 'pass' or 'run' in nflverse data
+    return (
+        pbp_df.lazy()
+        .filter(
+            (pl.col("yardline_100") <= 20) &
+            (pl.col("play_type").is_in(["pass", "run"])) &
+            pl.col("posteam").is_not_null()
+        )
+        .group_by("posteam")
+        .agg(
+            pl.len().alias("total"),
+            (pl.col("play_type") == "pass").sum().alias("passes"),
+            (pl.col("play_type") == "run").sum().alias("runs"),
+        )
+        .sort("posteam")
+    )
+
+def _team_red_zone_splits_dict(df: pl.DataFrame) -> dict:
+    """
+    Converts per-team counts to {team: {'pass_pct', 'run_pct', 'total_plays'}}.
+    """
+    return {
+        row['posteam']: {
+            'pass_pct': (row['passes'] / row['total']) * 100,
+            'run_pct': (row['runs'] / row['total']) * 100,
+            'total_plays': row['total']
+        }
+        for row in df.iter_rows(named=True)
+    }
+
 def get_team_red_zone_splits(pbp_df: pl.DataFrame) -> dict:
     """
     Calculates Run/Pass splits for each team in the Red Zone (<= 20 yards).
@@ -411,44 +569,28 @@ def get_team_red_zone_splits(pbp_df: pl.DataFrame) -> dict:
     """
     if pbp_df.height == 0:
         return {}
+    return _team_red_zone_splits_dict(_team_red_zone_splits_plan(pbp_df).collect())
 
-    # Filter for Red Zone plays
-    # We only care about plays that are actually runs or passes (exclude FGs, punts, etc if any)
-    # play_type is usually 'pass' or 'run' in nflverse data
-    rz_plays = pbp_df.filter(
-        (pl.col("yardline_100") <= 20) &
-        (pl.col("play_type").is_in(["pass", "run"]))
-    )
-    
-    if rz_plays.height == 0:
-        return {}
+def get_situational_stats(pbp_df: pl.DataFrame, roster_df: pl.DataFrame | PlayerIndex | None) -> dict:
+    """
+    Computes red zone, opening drive and team red zone split stats in one pass.
+    Both plans are collected together so polars scans the PBP frame once and shares
+    the common filters.
+    Returns: {'rz_stats': ..., 'od_stats': ..., 'team_rz_splits': ...} (same shapes as the
+    individual functions).
+    """
+    if pbp_df.height == 0:
+        return {'rz_stats': {}, 'od_stats': {}, 'team_rz_splits': {}}
 
-    # Group by team and play_type
-    splits = rz_plays.group_by(["posteam", "play_type"]).count()
-    
-    # Get total plays per team
-    total_plays = rz_plays.group_by("posteam").count().rename({"count": "total"})
-    
-    # Join back
-    splits = splits.join(total_plays, on="posteam")
-    
-    team_stats = {}
-    
-    for row in splits.to_dicts():
-        team = row['posteam']
-        ptype = row['play_type']
-        count = row['count']
-        total = row['total']
-        
-        if team not in team_stats:
-            team_stats[team] = {'pass_pct': 0.0, 'run_pct': 0.0, 'total_plays': total}
-            
-        if ptype == 'pass':
-            team_stats[team]['pass_pct'] = (count / total) * 100
-        elif ptype == 'run':
-            team_stats[team]['run_pct'] = (count / total) * 100
-            
-    return team_stats
+    players_df, splits_df = pl.collect_all([
+        _player_situation_plan(pbp_df, roster_df),
+        _team_red_zone_splits_plan(pbp_df),
+    ])
+    return {
+        'rz_stats': _player_situation_dicts(players_df, 'rz'),
+        'od_stats': _player_situation_dicts(players_df, 'od'),
+        'team_rz_splits': _team_red_zone_splits_dict(splits_df),
+    }
 
 def identify_funnel_defenses(defense_rankings: dict) -> dict:
     """
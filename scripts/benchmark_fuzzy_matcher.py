@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""Benchmark NameMatcher's bit-parallel, cutoff-bounded and indexed matching against the full DP scoring"""
+import argparse
+import random
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import polars as pl
+from league_webapp.app.fuzzy_matcher import NameMatcher
+
+class ReferenceMatcher(NameMatcher):
+    """Previous implementation: row-by-row DP distance and full scoring of every candidate"""
+
+    def levenshtein_distance(self, s1, s2, max_distance=None):
+        if len(s1) < len(s2):
+            return self.levenshtein_distance(s2, s1)
+
+        if len(s2) == 0:
+            return len(s1)
+
+        previous_row = range(len(s2) + 1)
+        for i, c1 in enumerate(s1):
+            current_row = [i + 1]
+            for j, c2 in enumerate(s2):
+                insertions = previous_row[j + 1] + 1
+                deletions = current_row[j] + 1
+                substitutions = previous_row[j] + (c1 != c2)
+                current_row.append(min(insertions, deletions, substitutions))
+            previous_row = current_row
+
+        return previous_row[-1]
+
+    def find_best_match(self, pick_name, scorer_names, min_score=0.0):
+        best_score, best_match, best_reason = 0.0, None, ""
+        for scorer_name in scorer_names:
+            score, reason = self.calculate_match_score(pick_name, scorer_name)
+            if score > best_score:
+                best_score, best_match, best_reason = score, scorer_name, reason
+        if not pick_name or not scorer_names or best_score < min_score:
+            return None
+        return {
+            'matched_name': best_match,
+            'score': best_score,
+            'confidence': self.get_confidence(best_score),
+            'reason': best_reason,
+            'auto_accept': best_score >= self.auto_accept_threshold,
+            'pick_name': pick_name
+        }
+
+def sample_picks(names: list[str], count: int, seed: int) -> list[str]:
+    """Roster names written the way picks come in: last names, lowercase, typos, initials"""
+    rng = random.Random(seed)
+    picks = []
+    for name in rng.sample(names, min(count, len(names))):
+        style = rng.random()
+        if style < 0.25:
+            picks.append(name.split()[-1])
+        elif style < 0.45:
+            picks.append(name.lower())
+        elif style < 0.65:
+            i = rng.randrange(len(name))
+            picks.append(name[:i] + name[i + 1:])
+        elif style < 0.75:
+            picks.append(f"{name[0]}. {name.split()[-1]}")
+        else:
+            picks.append(name)
+    return picks
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--season', type=int, default=2025)
+    parser.add_argument('--cache-dir', default=os.path.join(os.path.dirname(__file__), '..', 'cache'))
+    parser.add_argument('--picks', type=int, default=25, help='Number of pick names to match')
+    parser.add_argument('--min-score', type=float, default=0.70)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    roster_path = os.path.join(args.cache_dir, f"season_{args.season}_roster.parquet")
+    if not os.path.exists(roster_path):
+        sys.exit(f"No cached roster for {args.season} in {args.cache_dir}")
+    names = pl.read_parquet(roster_path)['full_name'].drop_nulls().unique().sort().to_list()
+    picks = sample_picks(names, args.picks, args.seed)
+    print(f"Season {args.season}: {len(picks)} picks x {len(names):,} roster names")
+
+    reference, fast = ReferenceMatcher(), NameMatcher()
+    pairs = [(fast.normalize_name(p), fast.normalize_name(n)) for p in picks for n in names]
+
+    _, dp_time = timed(lambda: [reference.levenshtein_distance(a, b) for a, b in pairs])
+    _, bp_time = timed(lambda: [fast.levenshtein_distance(a, b) for a, b in pairs])
+    _, cut_time = timed(lambda: [fast.levenshtein_distance(a, b, 3) for a, b in pairs])
+    print(f"{'distance':>12}: DP {dp_time:.2f}s, bit-parallel {bp_time:.2f}s, "
+          f"bit-parallel (cutoff 3) {cut_time:.2f}s")
+
+    expected, ref_time = timed(lambda: [reference.find_best_match(p, names, args.min_score) for p in picks])
+    actual, fast_time = timed(lambda: [fast.find_best_match(p, names, args.min_score) for p in picks])
+    if actual != expected:
+        sys.exit("Bounded matching returned different results from the reference")
+    print(f"{'best match':>12}: reference {ref_time:.2f}s, bounded {fast_time:.2f}s "
+          f"({ref_time / fast_time:.1f}x, results identical)")
+
+    index, build_time = timed(lambda: fast.build_index(names))
+    indexed, index_time = timed(lambda: [fast.find_best_match(p, index, args.min_score) for p in picks])
+    if indexed != expected:
+        sys.exit("Indexed matching returned different results from the reference")
+    print(f"{'indexed':>12}: build {build_time:.2f}s, match {index_time:.2f}s "
+          f"({ref_time / index_time:.1f}x, results identical)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""Benchmark the fused situational stats pass against the previous per-stat sequence"""
+import argparse
+import sys
+import os
+import timeit
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import polars as pl
+from nfl_core.data import scan_pbp, pbp_partition_dir, ensure_pbp_partitions
+from nfl_core.stats import get_situational_stats
+
+# Previous implementation, kept here as the baseline: each stat re-filters the PBP,
+# rebuilds the roster name map and merges its group counts through Python dicts.
+# (GroupBy.count() is spelled len(name="count"), its non-deprecated equivalent.)
+
+def _reference_id_to_name(roster_df):
+    id_to_name = {}
+    if roster_df is not None and "gsis_id" in roster_df.columns and "full_name" in roster_df.columns:
+        temp_df = roster_df.select(["gsis_id", "full_name"]).unique()
+        for r in temp_df.to_dicts():
+            if r["gsis_id"] and r["full_name"]:
+                id_to_name[r["gsis_id"]] = r["full_name"]
+    return id_to_name
+
+def _reference_player_counts(plays, roster_df, opps_key, tds_key):
+    rush_opps = plays.filter(pl.col("rusher_player_id").is_not_null()) \
+        .group_by("rusher_player_id").len(name="count").rename({"count": "rushes"})
+    rec_opps = plays.filter(pl.col("receiver_player_id").is_not_null()) \
+        .group_by("receiver_player_id").len(name="count").rename({"count": "targets"})
+    tds = plays.filter((pl.col("touchdown") == 1) & (pl.col("td_player_id").is_not_null())) \
+        .group_by("td_player_id").len(name="count").rename({"count": "tds"})
+
+    all_ids = set()
+    all_ids.update(rush_opps["rusher_player_id"].to_list())
+    all_ids.update(rec_opps["receiver_player_id"].to_list())
+    all_ids.update(tds["td_player_id"].to_list())
+
+    id_to_name = _reference_id_to_name(roster_df)
+
+    rush_map = {row['rusher_player_id']: row['rushes'] for row in rush_opps.to_dicts()} if rush_opps.height > 0 else {}
+    rec_map = {row['receiver_player_id']: row['targets'] for row in rec_opps.to_dicts()} if rec_opps.height > 0 else {}
+    td_map = {row['td_player_id']: row['tds'] for row in tds.to_dicts()} if tds.height > 0 else {}
+
+    final_stats = {}
+    for pid in all_ids:
+        if not pid:
+            continue
+        name = id_to_name.get(pid, pid)
+        opps = rush_map.get(pid, 0) + rec_map.get(pid, 0)
+        td_count = td_map.get(pid, 0)
+        if opps > 0 or td_count > 0:
+            final_stats[name] = {opps_key: opps, tds_key: td_count}
+    return final_stats
+
+def reference_red_zone_stats(pbp_df, roster_df):
+    if pbp_df.height == 0:
+        return {}
+    rz_plays = pbp_df.filter(pl.col("yardline_100") <= 20)
+    if rz_plays.height == 0:
+        return {}
+    return _reference_player_counts(rz_plays, roster_df, 'rz_opps', 'rz_tds')
+
+def reference_opening_drive_stats(pbp_df, roster_df):
+    if pbp_df.height == 0:
+        return {}
+    valid_drives = pbp_df.filter(pl.col("drive").is_not_null())
+    if valid_drives.height == 0:
+        return {}
+    opening_drives = valid_drives.group_by(["game_id", "posteam"]).agg(pl.col("drive").min().alias("min_drive"))
+    od_plays = valid_drives.join(opening_drives, left_on=["game_id", "posteam"], right_on=["game_id", "posteam"])
+    od_plays = od_plays.filter(pl.col("drive") == pl.col("min_drive"))
+    if od_plays.height == 0:
+        return {}
+    return _reference_player_counts(od_plays, roster_df, 'od_opps', 'od_tds')
+
+def reference_team_red_zone_splits(pbp_df):
+    if pbp_df.height == 0:
+        return {}
+    rz_plays = pbp_df.filter(
+        (pl.col("yardline_100") <= 20) &
+        (pl.col("play_type").is_in(["pass", "run"]))
+    )
+    if rz_plays.height == 0:
+        return {}
+
+    splits = rz_plays.group_by(["posteam", "play_type"]).len(name="count")
+    total_plays = rz_plays.group_by("posteam").len(name="count").rename({"count": "total"})
+    splits = splits.join(total_plays, on="posteam")
+
+    team_stats = {}
+    for row in splits.to_dicts():
+        team = row['posteam']
+        ptype = row['play_type']
+        count = row['count']
+        total = row['total']
+        if team not in team_stats:
+            team_stats[team] = {'pass_pct': 0.0, 'run_pct': 0.0, 'total_plays': total}
+        if ptype == 'pass':
+            team_stats[team]['pass_pct'] = (count / total) * 100
+        elif ptype == 'run':
+            team_stats[team]['run_pct'] = (count / total) * 100
+    return team_stats
+
+def load_season(season: int, cache_dir: str) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Loads cached PBP (projected the way the apps load it) and roster for a season"""
+    if not ensure_pbp_partitions(season, cache_dir):
+        sys.exit(f"No cached PBP for {season} in {cache_dir}")
+    pbp_df = scan_pbp(pbp_partition_dir(season, cache_dir)).collect()
+    roster_df = pl.read_parquet(os.path.join(cache_dir, f"season_{season}_roster.parquet"))
+    return pbp_df, roster_df
+
+def run_sequence(pbp_df, roster_df):
+    return (
+        reference_red_zone_stats(pbp_df, roster_df),
+        reference_opening_drive_stats(pbp_df, roster_df),
+        reference_team_red_zone_splits(pbp_df)
+    )
+
+def run_fused(pbp_df, roster_df):
+    stats = get_situational_stats(pbp_df, roster_df)
+    return stats['rz_stats'], stats['od_stats'], stats['team_rz_splits']
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--season', type=int, default=2025)
+    parser.add_argument('--cache-dir', default=os.path.join(os.path.dirname(__file__), '..', 'cache'))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=10)
+    args = parser.parse_args()
+
+    pbp_df, roster_df = load_season(args.season, args.cache_dir)
+    print(f"Season {args.season}: {pbp_df.height:,} plays, {roster_df.height:,} roster rows")
+
+    if run_sequence(pbp_df, roster_df) != run_fused(pbp_df, roster_df):
+        sys.exit("Fused results differ from the previous per-stat sequence")
+
+    results = {}
+    for name, fn in [('sequence', run_sequence), ('fused', run_fused)]:
+        timings = timeit.repeat(lambda: fn(pbp_df, roster_df), number=args.number, repeat=args.repeat)
+        results[name] = min(timings) / args.number
+        print(f"{name:>10}: {results[name] * 1000:.2f} ms (best of {args.repeat})")
+
+    print(f"{'speedup':>10}: {results['sequence'] / results['fused']:.2f}x")
+
+if __name__ == '__main__':
+    main()
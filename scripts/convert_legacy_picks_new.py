@@ -77,8 +77,9 @@ def parse_odds(odds_str):
 
 def get_player_info_from_roster(player_name, game, roster_df, matcher):
     """
-    Get enriched player name and position from game rosters.
-    Returns (full_name, position) or (original_name, 'UNK') if not found.
+    Get enriched player name, position and gsis_id from game rosters.
+    Returns (full_name, position, gsis_id) or (original_name, 'UNK', None) if not found.
+    The gsis_id is only set for full name or first + last name matches.
     """
     try:
         # Filter roster to game teams only (don't filter by week - roster 'week' represents transactions, not game availability)
@@ -88,7 +89,7 @@ def get_player_info_from_roster(player_name, game, roster_df, matcher):
         )
         
         if len(game_roster) == 0:
-            return player_name, 'UNK'
+            return player_name, 'UNK', None
         
         # Build candidate names with position mapping
         full_names = game_roster['full_name'].to_list() if 'full_name' in game_roster.columns else []
@@ -96,16 +97,21 @@ def get_player_info_from_roster(player_name, game, roster_df, matcher):
         first_names = game_roster['first_name'].to_list() if 'first_name' in game_roster.columns else []
         last_names = game_roster['last_name'].to_list() if 'last_name' in game_roster.columns else []
         positions = game_roster['position'].to_list() if 'position' in game_roster.columns else []
+        gsis_ids = game_roster['gsis_id'].to_list() if 'gsis_id' in game_roster.columns else []
         
-        # Build name-to-position mapping
+        # Build name-to-position and name-to-gsis_id mappings
         name_to_position = {}
+        name_to_gsis_id = {}
         for i in range(len(positions)):
+            gsis_id = gsis_ids[i] if i < len(gsis_ids) else None
             if i < len(full_names) and full_names[i]:
                 name_to_position[full_names[i]] = positions[i]
+                name_to_gsis_id[full_names[i]] = gsis_id
             if i < len(football_names) and football_names[i]:
                 name_to_position[football_names[i]] = positions[i]
             if i < len(first_names) and i < len(last_names) and first_names[i] and last_names[i]:
                 name_to_position[f"{first_names[i]} {last_names[i]}"] = positions[i]
+                name_to_gsis_id[f"{first_names[i]} {last_names[i]}"] = gsis_id
             if i < len(last_names) and last_names[i]:
                 name_to_position[last_names[i]] = positions[i]
         
@@ -118,19 +124,21 @@ def get_player_info_from_roster(player_name, game, roster_df, matcher):
         if match_result and match_result['score'] >= 0.70:
             matched_name = match_result['matched_name']
             position = name_to_position.get(matched_name)
+            # Grading trusts the ID over the name, so only keep it for auto-accepted matches
+            gsis_id = name_to_gsis_id.get(matched_name) if match_result['auto_accept'] else None
             
             if position:
                 # Map position to standard codes
                 if position in ['QB', 'RB', 'WR', 'TE']:
-                    return matched_name, position
+                    return matched_name, position, gsis_id
                 elif position in ['FB', 'HB']:
-                    return matched_name, 'RB'
+                    return matched_name, 'RB', gsis_id
         
-        return player_name, 'UNK'
+        return player_name, 'UNK', None
     
     except Exception as e:
         print(f"  Error enriching player '{player_name}': {e}")
-        return player_name, 'UNK'
+        return player_name, 'UNK', None
 
 
 def convert_csv(input_file, season=2025):
@@ -208,7 +216,7 @@ def convert_csv(input_file, season=2025):
                     continue
                 
                 # Get enriched player info from roster
-                enriched_name, position = get_player_info_from_roster(player, game, roster_df, matcher)
+                enriched_name, position, gsis_id = get_player_info_from_roster(player, game, roster_df, matcher)
                 
                 print(f"Row {row_num}: {picker} - {player} -> {enriched_name} ({position})")
                 
@@ -219,6 +227,7 @@ def convert_csv(input_file, season=2025):
                     pick_type='FTD',
                     player_name=enriched_name,
                     player_position=position,
+                    player_gsis_id=gsis_id,
                     odds=ftd_odds,
                     stake=1.00,
                     result='Pending',
@@ -235,6 +244,7 @@ def convert_csv(input_file, season=2025):
                     pick_type='ATTS',
                     player_name=enriched_name,
                     player_position=position,
+                    player_gsis_id=gsis_id,
                     odds=atts_odds_value,
                     stake=1.00,
                     result='Pending',
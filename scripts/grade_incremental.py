@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Grade only games/picks that changed since the last run (for cron/scheduled runs)
+
+By default the current (and previous) week's PBP is downloaded first, so games that
+went final since the last run change their week's fingerprint and get graded. This is
+the mode to run from cron. --cache-only grades from the cached PBP without downloading
+(only new picks and weeks refreshed by something else are graded); --download
+refreshes the whole season.
+"""
+import argparse
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Set working directory to project root
+os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+
+from league_webapp.app import create_app
+from league_webapp.app.data_loader import get_current_nfl_week
+from league_webapp.app.services.grading_service import GradingService
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--season', type=int, default=2025)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--cache-only', action='store_true', help='Grade from the cached PBP without downloading')
+    mode.add_argument('--download', action='store_true', help='Download fresh PBP for the whole season')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        if args.cache_only:
+            result = GradingService().grade_incremental(args.season, use_cache=True)
+        elif args.download:
+            result = GradingService().grade_incremental(args.season, use_cache=False)
+        else:
+            # The previous week too: its late games can go final after the week rolls over
+            current_week = get_current_nfl_week(args.season)
+            refresh_weeks = [week for week in (current_week - 1, current_week) if week >= 1]
+            print(f"Refreshing PBP for weeks {refresh_weeks}")
+            result = GradingService().grade_incremental(
+                args.season, use_cache=False, refresh_weeks=refresh_weeks
+            )
+
+    print(f"Season {result['season']} (PBP version {result['pbp_version']})")
+    print(f"Changed weeks: {result['changed_weeks'] or 'none'}")
+    print(f"Games checked: {result['games_checked']}, graded: {result['games_graded']}")
+    print(f"Picks graded: {result['total_graded']} ({result['total_won']} W, {result['total_lost']} L, "
+          f"{result['total_needs_review']} need review)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""Grade FTD picks live from a play feed drop directory (JSONL/parquet files of plays)"""
+import argparse
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Set working directory to project root
+os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+
+from league_webapp.app import create_app
+from league_webapp.app.services.live_grading_service import LiveGradingService
+
+def print_result(result):
+    print(f"Week {result['week']} {result['game_id']}: first TD {result['player']} ({result['team']}) - "
+          f"graded {result['graded']} FTD picks ({result['won']} W, {result['lost']} L, "
+          f"{result['needs_review']} need review)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('feed_dir', help='Directory the play feed drops files into')
+    parser.add_argument('--season', type=int, default=2025)
+    parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls')
+    parser.add_argument('--once', action='store_true', help='Poll once and exit')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        service = LiveGradingService(args.feed_dir, season=args.season)
+        if args.once:
+            for result in service.poll():
+                print_result(result)
+            return
+
+        print(f"Watching {args.feed_dir} every {args.interval:g}s (Ctrl+C to stop)")
+        try:
+            service.run(interval=args.interval, on_result=print_result)
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == '__main__':
+    main()
@@ -32,3 +32,171 @@ class TestDataLoading:
         # First load - downloads data
         # Second load - uses cache (should be faster)
         pass
+
+
+class TestPbpProjection:
+    """Test column-projected PBP scanning"""
+    
+    def test_pbp_columns_union_is_ordered_and_unique(self):
+        """Test that consumer column lists are merged without duplicates"""
+        from nfl_core.data import pbp_columns, PBP_COLUMNS
+        
+        cols = pbp_columns('red_zone', 'team_splits')
+        assert cols[:len(PBP_COLUMNS['red_zone'])] == PBP_COLUMNS['red_zone']
+        assert len(cols) == len(set(cols))
+        assert 'play_type' in cols
+    
+    def test_pbp_columns_unknown_consumer(self):
+        """Test that an unknown consumer name is rejected"""
+        from nfl_core.data import pbp_columns
+        
+        with pytest.raises(KeyError):
+            pbp_columns('not_a_consumer')
+    
+    def test_scan_pbp_projects_and_skips_missing(self, tmp_path):
+        """Test that scan_pbp only reads registered columns that exist in the file"""
+        import polars as pl
+        from nfl_core.data import scan_pbp
+        
+        path = tmp_path / "pbp.parquet"
+        pl.DataFrame({
+            'game_id': ['g1', 'g1', 'g2'],
+            'posteam': ['KC', 'DET', 'KC'],
+            'yardline_100': [10.0, 45.0, 5.0],
+            'play_type': ['run', 'pass', 'pass'],
+            'epa': [0.1, -0.2, 0.3],
+        }).write_parquet(path)
+        
+        df = scan_pbp(str(path), 'team_splits').filter(pl.col('yardline_100') <= 20).collect()
+        
+        assert df.columns == ['posteam', 'yardline_100', 'play_type']
+        assert df.height == 2
+
+
+class TestPbpPartitions:
+    """Test the week-partitioned PBP cache"""
+    
+    @staticmethod
+    def _pbp(weeks):
+        import polars as pl
+        return pl.DataFrame({
+            'game_id': [f'g{w}' for w in weeks],
+            'week': weeks,
+            'posteam': ['KC'] * len(weeks),
+            'touchdown': [1] * len(weeks),
+        }).with_columns(pl.col('week').cast(pl.Int32))
+    
+    def test_refresh_rewrites_only_changed_weeks(self, tmp_path):
+        """Test that unchanged weeks are skipped and the manifest version bumps on change"""
+        import polars as pl
+        from nfl_core.data import write_pbp_partitions, read_pbp_manifest
+        
+        assert write_pbp_partitions(self._pbp([1, 2, 3]), 2025, str(tmp_path)) == [1, 2, 3]
+        assert read_pbp_manifest(2025, str(tmp_path))['version'] == 1
+        
+        assert write_pbp_partitions(self._pbp([1, 2, 3]), 2025, str(tmp_path)) == []
+        assert read_pbp_manifest(2025, str(tmp_path))['version'] == 1
+        
+        updated = pl.concat([self._pbp([1, 2, 3]), self._pbp([3])])
+        assert write_pbp_partitions(updated, 2025, str(tmp_path)) == [3]
+        manifest = read_pbp_manifest(2025, str(tmp_path))
+        assert manifest['version'] == 2
+        assert manifest['weeks']['3']['rows'] == 2
+    
+    def test_weeks_argument_limits_rewrite(self, tmp_path):
+        """Test that only the requested weeks are considered for a rewrite"""
+        from nfl_core.data import write_pbp_partitions
+        
+        assert write_pbp_partitions(self._pbp([1, 2]), 2025, str(tmp_path), weeks=[2]) == [2]
+    
+    def test_scan_partitioned_directory(self, tmp_path):
+        """Test that scan_pbp reads a partitioned season and filters by week"""
+        from nfl_core.data import write_pbp_partitions, pbp_partition_dir, scan_pbp
+        
+        write_pbp_partitions(self._pbp([1, 2, 3]), 2025, str(tmp_path))
+        season_dir = pbp_partition_dir(2025, str(tmp_path))
+        
+        assert scan_pbp(season_dir).collect().height == 3
+        df = scan_pbp(season_dir, columns=['game_id', 'week'], weeks=[2, 3]).collect()
+        assert sorted(df['game_id'].to_list()) == ['g2', 'g3']
+    
+    def test_legacy_file_is_migrated(self, tmp_path):
+        """Test that a single-file season cache is split into week partitions once"""
+        from nfl_core.data import ensure_pbp_partitions, read_pbp_manifest
+        
+        assert ensure_pbp_partitions(2025, str(tmp_path)) is False
+        self._pbp([1, 2]).write_parquet(tmp_path / "season_2025_pbp.parquet")
+        
+        assert ensure_pbp_partitions(2025, str(tmp_path)) is True
+        assert set(read_pbp_manifest(2025, str(tmp_path))['weeks']) == {'1', '2'}
+
+
+class TestDownloadSeasons:
+    """Test the concurrent multi-season downloader against a local HTTP server"""
+    
+    @pytest.fixture
+    def nflverse_server(self, tmp_path):
+        """Serve fixture files laid out like the nflverse release URLs"""
+        import functools
+        import threading
+        import polars as pl
+        from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+        
+        root = tmp_path / "server"
+        (root / "nfldata/raw/master/data").mkdir(parents=True)
+        (root / "nflverse-data/releases/download/pbp").mkdir(parents=True)
+        (root / "nflverse-data/releases/download/rosters").mkdir(parents=True)
+        
+        pl.DataFrame({
+            'season': [2023, 2024, 2024],
+            'game_id': ['2023_01_A_B', '2024_01_A_B', '2024_02_C_D'],
+        }).write_csv(root / "nfldata/raw/master/data/games.csv")
+        for season in (2023, 2024):
+            pl.DataFrame({'game_id': [f'{season}_01_A_B'] * 2, 'week': [1, 2], 'touchdown': [1, 0]}).write_parquet(
+                root / f"nflverse-data/releases/download/pbp/play_by_play_{season}.parquet")
+            pl.DataFrame({'gsis_id': ['00-1'], 'season': [season]}).write_parquet(
+                root / f"nflverse-data/releases/download/rosters/roster_{season}.parquet")
+        
+        class QuietHandler(SimpleHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+        
+        server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(QuietHandler, directory=str(root)))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+    
+    def test_downloads_all_seasons(self, tmp_path, nflverse_server):
+        """Test that every dataset for every season is written to the cache"""
+        import polars as pl
+        from nfl_core.data import download_seasons, read_pbp_manifest
+        
+        cache_dir = str(tmp_path / "cache")
+        results = download_seasons([2024, 2023], cache_dir=cache_dir, max_workers=3, base_url=nflverse_server)
+        
+        assert set(results) == {2023, 2024}
+        assert set(results[2024]) == {'schedule', 'pbp', 'roster'}
+        assert pl.read_parquet(results[2024]['schedule']).height == 2
+        assert pl.read_parquet(results[2023]['roster'])['season'].to_list() == [2023]
+        assert set(read_pbp_manifest(2023, cache_dir)['weeks']) == {'1', '2'}
+        assert not [f for f in (tmp_path / "cache").iterdir() if f.name.endswith('.tmp')]
+    
+    def test_missing_file_raises_after_others_finish(self, tmp_path, nflverse_server):
+        """Test that a failed download is reported without discarding the rest"""
+        import os
+        from nfl_core.data import download_seasons
+        
+        cache_dir = str(tmp_path / "cache")
+        with pytest.raises(RuntimeError, match="roster"):
+            download_seasons([2024, 2030], datasets=('roster',), cache_dir=cache_dir, base_url=nflverse_server)
+        
+        assert os.path.exists(os.path.join(cache_dir, "season_2024_roster.parquet"))
+    
+    def test_unknown_dataset(self, tmp_path):
+        """Test that unknown dataset names are rejected up front"""
+        from nfl_core.data import download_seasons
+        
+        with pytest.raises(ValueError):
+            download_seasons([2024], datasets=('injuries',), cache_dir=str(tmp_path))
@@ -0,0 +1,91 @@
+"""Tests for nfl_core.live module"""
+import json
+import polars as pl
+from nfl_core.live import PlayFeed, FirstTdTracker
+
+
+def play(game_id, play_id, touchdown=0, td_player_id=None, td_player_name=None, td_team=None):
+    return {
+        'game_id': game_id, 'play_id': play_id, 'touchdown': touchdown,
+        'td_player_id': td_player_id, 'td_player_name': td_player_name,
+        'td_team': td_team, 'posteam': td_team, 'home_team': 'DET'
+    }
+
+
+def append_lines(path, plays, partial=''):
+    with open(path, 'a') as f:
+        for p in plays:
+            f.write(json.dumps(p) + '\n')
+        f.write(partial)
+
+
+class TestPlayFeed:
+    """Test incremental reads from the drop directory"""
+    
+    def test_jsonl_reads_only_new_complete_lines(self, tmp_path):
+        """Test appended lines are read once and a partial line waits for its newline"""
+        path = tmp_path / '0001.jsonl'
+        feed = PlayFeed(str(tmp_path))
+        
+        append_lines(path, [play('G1', 1), play('G1', 2)], partial='{"game_id": "G1", ')
+        assert feed.read_new()['play_id'].to_list() == [1, 2]
+        assert feed.read_new().height == 0
+        
+        with open(path, 'a') as f:
+            f.write('"play_id": 3, "touchdown": 0}\n')
+        assert feed.read_new()['play_id'].to_list() == [3]
+    
+    def test_parquet_files_are_read_once(self, tmp_path):
+        """Test new parquet drops are picked up alongside JSONL"""
+        feed = PlayFeed(str(tmp_path))
+        pl.DataFrame([play('G2', 10, 1, '00-2', 'J.Allen', 'BUF')]).write_parquet(tmp_path / '0002.parquet')
+        append_lines(tmp_path / '0001.jsonl', [play('G1', 1)])
+        
+        assert feed.read_new()['game_id'].to_list() == ['G1', 'G2']
+        assert feed.read_new().height == 0
+    
+    def test_uncommitted_read_is_repeated(self, tmp_path):
+        """Test read_new(commit=False) only moves past the plays once commit() is called"""
+        feed = PlayFeed(str(tmp_path))
+        append_lines(tmp_path / '0001.jsonl', [play('G1', 1)])
+        pl.DataFrame([play('G2', 10)]).write_parquet(tmp_path / '0002.parquet')
+        
+        assert feed.read_new(commit=False).height == 2
+        assert feed.read_new(commit=False).height == 2
+        feed.commit()
+        assert feed.read_new().height == 0
+    
+    def test_missing_directory(self, tmp_path):
+        """Test a feed directory that does not exist yet"""
+        assert PlayFeed(str(tmp_path / 'missing')).read_new().height == 0
+
+
+class TestFirstTdTracker:
+    """Test streaming first TD detection"""
+    
+    def test_first_td_reported_once_per_game(self):
+        """Test a game's first TD is reported when it lands and later TDs are ignored"""
+        roster_df = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Amon-Ra St. Brown']})
+        tracker = FirstTdTracker(roster_df)
+        
+        assert tracker.update(pl.DataFrame([play('G1', 1), play('G2', 1)])) == {}
+        
+        found = tracker.update(pl.DataFrame([
+            play('G1', 5, 1, '00-1', 'A.St. Brown', 'DET'),
+            play('G1', 9, 1, '00-9', 'J.Gibbs', 'DET'),
+        ]))
+        assert found == {'G1': {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1', 'is_home_game': True}}
+        
+        assert tracker.update(pl.DataFrame([play('G1', 20, 1, '00-9', 'J.Gibbs', 'DET')])) == {}
+        assert set(tracker.update(pl.DataFrame([play('G2', 7, 1, '00-2', 'J.Allen', 'BUF')]))) == {'G2'}
+        assert set(tracker.first_tds) == {'G1', 'G2'}
+    
+    def test_detect_does_not_record(self):
+        """Test detect() reports first TDs without marking the games as seen"""
+        tracker = FirstTdTracker()
+        plays_df = pl.DataFrame([play('G1', 5, 1, '00-1', 'A.St. Brown', 'DET')])
+        
+        assert set(tracker.detect(plays_df)) == {'G1'}
+        assert tracker.first_tds == {}
+        tracker.record(tracker.detect(plays_df))
+        assert tracker.detect(plays_df) == {}
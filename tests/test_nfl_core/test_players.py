@@ -0,0 +1,77 @@
+"""Tests for nfl_core.players module"""
+import pytest
+import polars as pl
+
+
+@pytest.fixture
+def roster_df():
+    """Small roster with a duplicate ID and a player without an ID"""
+    return pl.DataFrame({
+        'gsis_id': ['00-1', '00-2', '00-1', None],
+        'full_name': ['Travis Kelce', 'Josh Allen', 'Travis Kelce (dup)', 'Josh Allen'],
+        'position': ['TE', 'QB', 'WR', 'LB'],
+        'team': ['KC', 'BUF', 'KC', 'JAX'],
+    })
+
+
+class TestPlayerIndex:
+    """Test roster index lookups"""
+    
+    def test_lookup_by_id_first_row_wins(self, roster_df):
+        """Test that ID lookups return the first roster row"""
+        from nfl_core.players import PlayerIndex
+        
+        index = PlayerIndex(roster_df)
+        assert index.get('00-1')['position'] == 'TE'
+        assert index.get(None) is None
+    
+    def test_lookup_by_name(self, roster_df):
+        """Test case-insensitive name lookup and ID fallback order"""
+        from nfl_core.players import PlayerIndex
+        
+        index = PlayerIndex(roster_df)
+        assert index.gsis_id_for_name('JOSH ALLEN') == '00-2'
+        assert index.position(None, 'josh allen') == 'QB'
+        assert index.position('00-9', 'Nobody') == 'UNK'
+        assert index.lookup('00-1', 'Josh Allen')['team'] == 'KC'
+    
+    def test_shared_index_per_dataframe(self, roster_df):
+        """Test that the same DataFrame reuses one index"""
+        from nfl_core.players import get_player_index
+        
+        assert get_player_index(roster_df) is get_player_index(roster_df)
+        assert get_player_index(roster_df.clone()) is not get_player_index(roster_df)
+    
+    def test_get_player_position_matches_index(self, roster_df):
+        """Test the stats helper accepts a DataFrame or an index"""
+        from nfl_core.players import PlayerIndex
+        from nfl_core.stats import get_player_position
+        
+        assert get_player_position('00-2', None, roster_df) == 'QB'
+        assert get_player_position(None, 'Travis Kelce', PlayerIndex(roster_df)) == 'TE'
+
+
+class TestDefenseRankings:
+    """Test defense vs position rankings"""
+    
+    def test_rankings(self, roster_df):
+        """Test that TDs allowed are counted against the opposing defense"""
+        from nfl_core.stats import calculate_defense_rankings
+        
+        schedule = pl.DataFrame({
+            'game_id': ['g1', 'g2', 'g3'],
+            'home_team': ['KC', 'BUF', 'KC'],
+            'away_team': ['BUF', 'MIA', 'MIA'],
+        })
+        first_tds = {
+            'g1': {'player': 'Travis Kelce', 'team': 'KC', 'player_id': '00-1'},
+            'g2': {'player': 'Josh Allen', 'team': 'BUF', 'player_id': None},
+            'g3': {'player': 'Travis Kelce', 'team': 'KC', 'player_id': '00-1'},
+        }
+        
+        rankings = calculate_defense_rankings(schedule, first_tds, roster_df)
+        
+        assert set(rankings) == {'KC', 'BUF', 'MIA'}
+        assert rankings['BUF']['TE'] == 2
+        assert rankings['MIA']['Total'] == 3
+        assert rankings['KC']['Total'] == 1
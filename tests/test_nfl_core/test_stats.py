@@ -97,3 +97,197 @@ class TestDataValidation:
         odds = calculate_fair_odds(1.0)
         # Should handle gracefully (maybe return -infinity or very negative)
         assert odds is not None
+
+
+class TestFirstTdScorers:
+    """Test first TD scorer extraction"""
+    
+    @staticmethod
+    def _pbp():
+        import polars as pl
+        return pl.DataFrame({
+            'game_id': ['g1', 'g1', 'g2', 'g3'],
+            'play_id': [50.0, 10.0, 5.0, 7.0],
+            'touchdown': [1, 1, 1, 1],
+            'td_player_name': ['B.Second', 'A.First', None, 'C.Name'],
+            'td_player_id': ['00-2', '00-1', None, '00-9'],
+            'td_team': ['KC', 'KC', None, ''],
+            'posteam': ['KC', 'KC', 'BUF', 'DET'],
+            'home_team': ['KC', 'KC', 'MIA', None],
+            'fantasy_player_name': [None, None, '', None],
+            'desc': [None, None, 'J.Cook for 3 yards, TOUCHDOWN', None],
+        })
+    
+    def test_first_play_and_roster_name(self):
+        """Test that the earliest TD is used and roster names win"""
+        import polars as pl
+        from nfl_core.stats import get_first_td_scorers
+        
+        roster = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Alpha First']})
+        result = get_first_td_scorers(self._pbp(), roster_df=roster)
+        
+        assert result['g1'] == {'player': 'Alpha First', 'team': 'KC', 'player_id': '00-1', 'is_home_game': True}
+    
+    def test_fallback_columns(self):
+        """Test description parsing, team fallback and missing home team"""
+        from nfl_core.stats import get_first_td_scorers
+        
+        result = get_first_td_scorers(self._pbp(), target_game_ids=['g2', 'g3'])
+        
+        assert result['g2']['player'] == 'J.Cook'
+        assert result['g2']['team'] == 'BUF'
+        assert result['g2']['is_home_game'] is False
+        assert result['g3']['team'] == 'DET'
+        assert result['g3']['is_home_game'] is None
+    
+    def test_dataframe_variant(self):
+        """Test the columnar variant returns one row per game"""
+        import polars as pl
+        from nfl_core.stats import get_first_td_scorers_df
+        
+        df = get_first_td_scorers_df(self._pbp())
+        assert df.columns == ['game_id', 'player', 'team', 'player_id', 'is_home_game']
+        assert df['game_id'].to_list() == ['g1', 'g2', 'g3']
+        assert get_first_td_scorers_df(pl.DataFrame()).height == 0
+    
+    def test_all_td_scorers_dedupes_in_play_order(self):
+        """Test that every scorer is listed once per game, in play order"""
+        from nfl_core.stats import get_all_td_scorers
+        
+        pbp = self._pbp()
+        result = get_all_td_scorers(pbp.vstack(pbp.head(1)))
+        
+        assert [s['player'] for s in result['g1']] == ['B.Second', 'A.First']
+        assert result['g2'] == [{'player': 'J.Cook', 'team': 'BUF', 'player_id': None}]
+        assert set(get_all_td_scorers(pbp, target_game_ids=['g3'])) == {'g3'}
+    
+    def test_game_touchdown_index(self):
+        """Test per-game touchdowns are ordered by play, with roster names and positions"""
+        import polars as pl
+        from nfl_core.stats import GameTouchdownIndex
+        
+        pbp = pl.concat([
+            self._pbp().with_columns(pl.lit(1.0).alias('qtr'), pl.lit('10:00').alias('time')),
+            # A TD play with no scorer still counts towards the order
+            pl.DataFrame({'game_id': ['g1'], 'play_id': [5.0], 'touchdown': [1], 'qtr': [1.0]})
+        ], how='diagonal_relaxed')
+        roster = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Alpha First'], 'position': ['WR']})
+        index = GameTouchdownIndex(pbp, roster)
+        
+        g1 = index.touchdowns('g1')
+        assert [(td['order'], td['player'], td['position'], td['is_first_td']) for td in g1] == [
+            (2, 'Alpha First', 'WR', False), (3, 'B.Second', None, False)
+        ]
+        assert index.touchdowns('g2') == [{
+            'order': 1, 'player': 'J.Cook', 'team': 'BUF', 'position': None,
+            'quarter': 1.0, 'time': '10:00', 'is_first_td': True
+        }]
+        assert index.touchdowns('missing') == []
+        assert GameTouchdownIndex(pl.DataFrame()).touchdowns('g1') == []
+
+
+class TestPlayerSeasonStats:
+    """Test per-player first TD probabilities"""
+    
+    @staticmethod
+    def _schedule():
+        import polars as pl
+        return pl.DataFrame({
+            'game_id': ['w1', 'w2', 'w3', 'w4'],
+            'gameday': ['2025-09-07', '2025-09-14', '2025-09-21', '2025-09-28'],
+            'gametime': ['13:00'] * 4,
+            'home_team': ['KC', 'BUF', 'KC', 'KC'],
+            'away_team': ['BUF', 'KC', 'DEN', 'LV'],
+        })
+    
+    @staticmethod
+    def _first_tds():
+        return {
+            'w1': {'player': 'Kelce', 'team': 'KC', 'player_id': '00-1'},
+            'w2': {'player': 'Cook', 'team': 'BUF', 'player_id': None},
+            'w3': {'player': 'Kelce', 'team': 'KC', 'player_id': '00-1'},
+            'w4': {'player': 'Pacheco', 'team': 'KC', 'player_id': '00-2'},
+        }
+    
+    def test_full_season(self):
+        """Test counts and team denominators over the full season"""
+        from nfl_core.stats import get_player_season_stats
+        
+        stats = get_player_season_stats(self._schedule(), self._first_tds())
+        
+        assert stats['Kelce'] == {'team': 'KC', 'first_tds': 2, 'team_games': 4, 'prob': 0.5, 'player_id': '00-1'}
+        assert stats['Cook']['team_games'] == 2
+    
+    def test_last_n_window(self):
+        """Test that only each team's last N games count"""
+        from nfl_core.stats import get_player_season_stats
+        
+        stats = get_player_season_stats(self._schedule(), self._first_tds(), last_n_games=2)
+        
+        assert stats['Kelce']['first_tds'] == 1
+        assert stats['Kelce']['team_games'] == 2
+        assert stats['Cook']['first_tds'] == 1
+    
+    def test_windows_match_single_calls(self):
+        """Test that the multi-window version agrees with one call per window"""
+        from nfl_core.stats import get_player_season_stats, get_player_season_stats_windows
+        
+        windows = get_player_season_stats_windows(self._schedule(), self._first_tds(), windows=(1, 3, None))
+        
+        for n in (1, 3, None):
+            assert windows[n] == get_player_season_stats(self._schedule(), self._first_tds(), last_n_games=n)
+        assert get_player_season_stats(self._schedule(), {}) == {}
+
+
+class TestSituationalStats:
+    """Test red zone, opening drive and team split stats"""
+    
+    @staticmethod
+    def _pbp():
+        import polars as pl
+        return pl.DataFrame({
+            'game_id': ['g1', 'g1', 'g1', 'g1', 'g2'],
+            'posteam': ['KC', 'KC', 'KC', 'BUF', 'KC'],
+            'drive': [1.0, 1.0, 3.0, 2.0, 4.0],
+            'yardline_100': [15.0, 5.0, 45.0, 10.0, 8.0],
+            'play_type': ['run', 'pass', 'pass', 'run', 'punt'],
+            'rusher_player_id': ['00-1', None, None, '00-2', None],
+            'receiver_player_id': [None, '00-3', '00-3', None, None],
+            'td_player_id': [None, '00-3', None, '00-2', None],
+            'touchdown': [0.0, 1.0, 0.0, 1.0, 0.0],
+        })
+    
+    def test_red_zone_and_opening_drive(self):
+        """Test per-player counts and roster names"""
+        import polars as pl
+        from nfl_core.stats import get_red_zone_stats, get_opening_drive_stats
+        
+        roster = pl.DataFrame({'gsis_id': ['00-3'], 'full_name': ['Travis Kelce']})
+        rz = get_red_zone_stats(self._pbp(), roster)
+        od = get_opening_drive_stats(self._pbp(), roster)
+        
+        assert rz['Travis Kelce'] == {'rz_opps': 1, 'rz_tds': 1}
+        assert rz['00-1'] == {'rz_opps': 1, 'rz_tds': 0}
+        assert od['Travis Kelce'] == {'od_opps': 1, 'od_tds': 1}
+        assert od['00-2'] == {'od_opps': 1, 'od_tds': 1}
+    
+    def test_team_splits(self):
+        """Test red zone run/pass percentages"""
+        from nfl_core.stats import get_team_red_zone_splits
+        
+        splits = get_team_red_zone_splits(self._pbp())
+        
+        assert splits['KC'] == {'pass_pct': 50.0, 'run_pct': 50.0, 'total_plays': 2}
+        assert splits['BUF']['run_pct'] == 100.0
+    
+    def test_fused_matches_individual(self):
+        """Test the fused pass returns the same results as the individual functions"""
+        from nfl_core.stats import (
+            get_red_zone_stats, get_opening_drive_stats, get_team_red_zone_splits, get_situational_stats
+        )
+        
+        fused = get_situational_stats(self._pbp(), None)
+        
+        assert fused['rz_stats'] == get_red_zone_stats(self._pbp(), None)
+        assert fused['od_stats'] == get_opening_drive_stats(self._pbp(), None)
+        assert fused['team_rz_splits'] == get_team_red_zone_splits(self._pbp())
@@ -0,0 +1,78 @@
+"""Tests for the web app data loader"""
+import pytest
+import polars as pl
+
+
+@pytest.fixture
+def season_cache_dir(tmp_path, monkeypatch):
+    """Point the data loader at a temp cache holding one small season"""
+    from league_webapp.app import data_loader
+    from nfl_core.data import write_pbp_partitions
+    
+    for season in (2024, 2025):
+        pl.DataFrame({'game_id': [f'{season}_01_KC_BUF'], 'week': [1]}).write_parquet(
+            tmp_path / f"season_{season}_schedule.parquet")
+        pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Test Player']}).write_parquet(
+            tmp_path / f"season_{season}_roster.parquet")
+        write_pbp_partitions(
+            pl.DataFrame({'game_id': [f'{season}_01_KC_BUF'], 'week': [1], 'touchdown': [1]}),
+            season, str(tmp_path))
+    
+    monkeypatch.setattr(data_loader, 'DATA_CACHE_DIR', str(tmp_path))
+    data_loader.clear_season_cache()
+    yield tmp_path
+    data_loader.clear_season_cache()
+
+
+class TestSeasonCache:
+    """Test the in-process season data cache"""
+    
+    def test_repeat_load_returns_same_frames(self, season_cache_dir):
+        """Test that a second load is served from memory"""
+        from league_webapp.app.data_loader import load_data_with_cache_web
+        
+        first = load_data_with_cache_web(2025)
+        second = load_data_with_cache_web(2025)
+        
+        assert all(a is b for a, b in zip(first, second))
+        assert first[1].height == 1
+    
+    def test_file_change_invalidates(self, season_cache_dir):
+        """Test that rewriting a cache file forces a reload"""
+        from league_webapp.app.data_loader import load_data_with_cache_web
+        
+        schedule_df, _, _ = load_data_with_cache_web(2025)
+        pl.DataFrame({'game_id': ['a', 'b'], 'week': [1, 1]}).write_parquet(
+            season_cache_dir / "season_2025_schedule.parquet")
+        
+        reloaded, _, _ = load_data_with_cache_web(2025)
+        assert reloaded is not schedule_df
+        assert reloaded.height == 2
+    
+    def test_lru_eviction(self, season_cache_dir, monkeypatch):
+        """Test that the least recently used season is evicted"""
+        from league_webapp.app import data_loader
+        
+        monkeypatch.setattr(data_loader, 'SEASON_CACHE_SIZE', 1)
+        data_loader.load_data_with_cache_web(2024)
+        data_loader.load_data_with_cache_web(2025)
+        
+        assert list(data_loader._season_cache) == [2025]
+    
+    def test_season_artifact_built_once_per_load(self, season_cache_dir):
+        """Test that a season artifact is reused until the season reloads"""
+        from league_webapp.app.data_loader import get_season_artifact
+        
+        builds = []
+        def build(schedule_df, pbp_df, roster_df):
+            builds.append(roster_df.height)
+            return object()
+        
+        first = get_season_artifact(2025, 'test', build)
+        assert get_season_artifact(2025, 'test', build) is first
+        
+        pl.DataFrame({'gsis_id': ['00-1', '00-2'], 'full_name': ['Test Player', 'Other Player']}).write_parquet(
+            season_cache_dir / "season_2025_roster.parquet")
+        
+        assert get_season_artifact(2025, 'test', build) is not first
+        assert builds == [1, 2]
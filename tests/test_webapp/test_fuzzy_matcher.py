@@ -0,0 +1,152 @@
+"""Tests for fuzzy name matching"""
+import random
+import pytest
+from league_webapp.app.fuzzy_matcher import NameMatcher, bit_parallel_levenshtein
+
+
+def dp_levenshtein(s1, s2):
+    """Textbook DP distance to check the bit-parallel version against"""
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (c1 != c2)))
+        previous = current
+    return previous[-1]
+
+
+ROSTER = [
+    'Patrick Mahomes', 'Travis Kelce', 'Josh Allen', 'Allen Lazard', 'CeeDee Lamb',
+    'Amon-Ra St. Brown', 'Christian McCaffrey', 'Marquise Brown', 'A.J. Brown',
+    'Jameson Williams', 'T.J. Hockenson', 'Marvin Mims Jr.', 'Josh Jacobs', 'Keenan Allen'
+]
+
+
+class TestLevenshtein:
+    """Test the bit-parallel distance engine"""
+    
+    @pytest.mark.parametrize('s1,s2,expected', [
+        ('', '', 0), ('abc', '', 3), ('kitten', 'sitting', 3),
+        ('patrick mahomes', 'patrik mahomes', 1), ('lamb', 'ceedee lamb', 7)
+    ])
+    def test_known_distances(self, s1, s2, expected):
+        assert bit_parallel_levenshtein(s1, s2) == expected
+        assert bit_parallel_levenshtein(s2, s1) == expected
+    
+    def test_matches_dp_on_random_strings(self):
+        """Test against the DP on strings longer than one machine word"""
+        rng = random.Random(7)
+        for _ in range(500):
+            s1 = ''.join(rng.choice('abc .') for _ in range(rng.randint(0, 80)))
+            s2 = ''.join(rng.choice('abc .') for _ in range(rng.randint(0, 80)))
+            assert bit_parallel_levenshtein(s1, s2) == dp_levenshtein(s1, s2)
+    
+    def test_cutoff(self):
+        """Test max_distance returns the exact distance up to the cutoff and cutoff + 1 beyond it"""
+        assert bit_parallel_levenshtein('kitten', 'sitting', max_distance=3) == 3
+        assert bit_parallel_levenshtein('kitten', 'sitting', max_distance=2) == 3
+        assert bit_parallel_levenshtein('a', 'abcdefgh', max_distance=2) == 3
+
+
+class TestBoundedMatching:
+    """Test that early cut-offs never change match results"""
+    
+    @pytest.mark.parametrize('pick', [
+        'Lamb', 'josh allen', 'Patrik Mahomes', 'P. Mahomes', 'Allen', 'ARSB',
+        'Hollywood', 'Jamo', 'Hock', 'Mims', 'Brown', 'Zed Nobody'
+    ])
+    @pytest.mark.parametrize('min_score', [0.0, 0.6, 0.7])
+    def test_find_best_match_matches_full_scoring(self, pick, min_score):
+        matcher = NameMatcher()
+        
+        scores = [(matcher.calculate_match_score(pick, name), name) for name in ROSTER]
+        best = None
+        for (score, reason), name in scores:
+            if best is None or score > best[0]:
+                best = (score, reason, name)
+        
+        result = matcher.find_best_match(pick, ROSTER, min_score=min_score)
+        if best[0] < min_score:
+            assert result is None
+        else:
+            assert (result['score'], result['reason'], result['matched_name']) == best
+    
+    def test_bounded_score_is_exact_or_none(self):
+        """Test bounded_match_score gives the full score or None only below min_score"""
+        matcher = NameMatcher()
+        for name in ROSTER:
+            full = matcher.calculate_match_score('Josh Alen', name)
+            bounded = matcher.bounded_match_score('Josh Alen', name, min_score=0.7)
+            assert bounded == full if full[0] >= 0.7 else bounded in (None, full)
+
+
+class TestNameIndex:
+    """Test shortlist-based candidate search"""
+    
+    @pytest.mark.parametrize('pick', [
+        'Lamb', 'josh allen', 'Patrik Mahomes', 'P. Mahomes', 'P M', 'Allen', 'ARSB',
+        'Hollywood', 'Jamo', 'Hock', 'Mims', 'Brown', 'Travs Kelse', 'Zed Nobody', 'xq'
+    ])
+    @pytest.mark.parametrize('min_score', [0.0, 0.6, 0.7])
+    def test_same_result_as_full_list(self, pick, min_score):
+        matcher = NameMatcher()
+        index = matcher.build_index(ROSTER)
+        assert matcher.find_best_match(pick, index, min_score) == matcher.find_best_match(pick, ROSTER, min_score)
+    
+    def test_shortlist_blocks_on_tokens_nicknames_and_trigrams(self):
+        index = NameMatcher().build_index(ROSTER)
+        
+        assert index.shortlist('Allen') == ['Josh Allen', 'Allen Lazard', 'Keenan Allen']
+        assert 'Jameson Williams' in index.shortlist('Jamo')
+        assert 'Christian McCaffrey' in index.shortlist('cmc')
+        assert 'Patrick Mahomes' in index.shortlist('P M')
+        # One typo in a long name is found through shared trigrams
+        assert 'Christian McCaffrey' in index.shortlist('Christain McCafrey')
+        assert len(index.shortlist('Christain McCafrey')) < len(ROSTER)
+
+
+class TestBatchMatch:
+    """Test batch matching many picks against one candidate list"""
+    
+    PICKS = ['Lamb', 'josh allen', 'P. Mahomes', 'Jamo', 'Lamb', 'Zed Nobody', 'Travs Kelse', '']
+    
+    @pytest.mark.parametrize('min_score', [0.0, 0.7])
+    def test_same_results_as_find_best_match(self, min_score):
+        matcher = NameMatcher()
+        results = matcher.batch_match(self.PICKS, ROSTER, min_score)
+        
+        assert list(results) == list(dict.fromkeys(self.PICKS))
+        for pick in self.PICKS:
+            assert results[pick] == matcher.find_best_match(pick, ROSTER, min_score)
+    
+    def test_accepts_prebuilt_index(self):
+        matcher = NameMatcher()
+        index = matcher.build_index(ROSTER)
+        assert matcher.batch_match(self.PICKS, index, 0.7) == matcher.batch_match(self.PICKS, ROSTER, 0.7)
+        assert matcher.batch_match(['Lamb'], [], 0.7) == {'Lamb': None}
+
+
+class TestNameMemo:
+    """Test the reverse nickname map and memoized name normalization"""
+    
+    def test_reverse_nickname_map(self):
+        assert NameMatcher.REVERSE_NICKNAME_MAP['robert'] == ['rob', 'bob']
+        assert NameMatcher.REVERSE_NICKNAME_MAP['amon-ra st brown'] == ['arsb', 'sun god']
+    
+    def test_expand_nicknames_both_directions(self):
+        matcher = NameMatcher()
+        assert set(matcher.expand_nicknames('Bill Smith')) == {'bill smith', 'william smith'}
+        assert set(matcher.expand_nicknames('William Smith')) == {'william smith', 'will smith', 'bill smith'}
+    
+    def test_cached_results_cannot_be_mutated(self):
+        matcher = NameMatcher()
+        matcher.tokenize_name('Josh Allen').append('x')
+        matcher.expand_nicknames('Mike Evans').clear()
+        
+        assert matcher.tokenize_name('Josh Allen') == ['josh', 'allen']
+        assert set(matcher.expand_nicknames('Mike Evans')) == {'mike evans', 'michael evans'}
+    
+    def test_name_order_and_nickname_scores(self):
+        matcher = NameMatcher()
+        assert matcher.calculate_match_score('Allen, Josh', 'Josh Allen')[0] == 0.92
+        assert matcher.calculate_match_score('Mike Evans', 'Michael Evans')[0] == 0.90
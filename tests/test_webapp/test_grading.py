@@ -138,3 +138,520 @@ class TestPayoutCalculations:
         
         expected_profit = bet * (odds / 100)
         assert expected_profit == 100.0
+
+
+class TestGradingServiceBatching:
+    """Test that GradingService loads and writes picks in bulk"""
+    
+    def test_grade_ftd_and_atts_picks(self, app, sample_user, sample_game):
+        """Test grading results, match decisions and query count"""
+        from sqlalchemy import event
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game, MatchDecision
+        from league_webapp.app.services.grading_service import GradingService
+        
+        with app.app_context():
+            db.session.add_all([
+                Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                     player_name='Amon-Ra St. Brown', odds=500, stake=1.0),
+                Pick(user_id=sample_user, game_id=sample_game, pick_type='ATTS',
+                     player_name='Travis Kelce', odds=150, stake=1.0),
+            ])
+            db.session.commit()
+            
+            games = Game.query.all()
+            first_td_map = {'2024_10_KC_DET': {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'}}
+            all_td_map = {'2024_10_KC_DET': [{'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'}]}
+            
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            event.listen(db.engine, 'before_cursor_execute', listener)
+            try:
+                service = GradingService()
+                ftd = service._grade_ftd_picks(games, first_td_map)
+                atts = service._grade_atts_picks(games, all_td_map)
+                db.session.commit()
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', listener)
+            
+            assert (ftd['won'], atts['lost']) == (1, 1)
+            # Per pick type: picks, stored match scores, the pick names' player aliases and
+            # (FTD only) existing decisions; no per-game or per-pick queries
+            assert len([s for s in statements if s.lstrip().upper().startswith('SELECT')]) == 7
+            
+            ftd_pick = Pick.query.filter_by(pick_type='FTD').one()
+            atts_pick = Pick.query.filter_by(pick_type='ATTS').one()
+            assert ftd_pick.result == 'W' and ftd_pick.payout == 6.0
+            assert atts_pick.result == 'L' and atts_pick.payout == -1.0
+            assert MatchDecision.query.filter_by(pick_id=ftd_pick.id).one().auto_accepted is True
+            assert db.session.get(Game, sample_game).actual_first_td_player == 'Amon-Ra St. Brown'
+    
+    def test_regrade_reuses_scores_and_decisions(self, app, sample_user, sample_game, monkeypatch):
+        """Test a regrade reads stored match scores and keeps one decision per pick"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game, MatchDecision, MatchScoreMemo
+        from league_webapp.app.fuzzy_matcher import NameMatcher
+        from league_webapp.app.services.grading_service import GradingService
+        
+        with app.app_context():
+            db.session.add(Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                                player_name='ARSB', odds=500, stake=1.0))
+            db.session.commit()
+            
+            games = Game.query.all()
+            first_td_map = {'2024_10_KC_DET': {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'}}
+            
+            GradingService()._grade_ftd_picks(games, first_td_map)
+            db.session.commit()
+            
+            memo = MatchScoreMemo.query.one()
+            assert (memo.pick_name, memo.scorer_name) == ('ARSB', 'Amon-Ra St. Brown')
+            decision = MatchDecision.query.one()
+            decision.manual_decision = 'approved'
+            db.session.commit()
+            
+            # A new service (e.g. the next request) must not re-score the stored pair
+            def fail(*args):
+                raise AssertionError('match score recomputed')
+            monkeypatch.setattr(NameMatcher, 'calculate_match_score', fail)
+            
+            results = GradingService()._grade_ftd_picks(games, first_td_map, force_regrade=True)
+            db.session.commit()
+            
+            assert results['won'] == 1
+            assert MatchScoreMemo.query.count() == 1
+            regraded = MatchDecision.query.one()
+            assert regraded.id == decision.id
+            assert regraded.manual_decision == 'approved'
+    
+    def test_scores_from_other_scorer_versions_are_ignored(self, app, client, sample_user, sample_game, monkeypatch):
+        """Test a scorer version change re-scores stored pairs and admins can clear old scores"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game, MatchScoreMemo
+        from league_webapp.app.fuzzy_matcher import NameMatcher
+        from league_webapp.app.services.grading_service import GradingService
+        
+        first_td_map = {'2024_10_KC_DET': {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'}}
+        with app.app_context():
+            db.session.add(Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                                player_name='ARSB', odds=500, stake=1.0))
+            db.session.commit()
+            GradingService()._grade_ftd_picks(Game.query.all(), first_td_map)
+            db.session.commit()
+            
+            version = NameMatcher.SCORER_VERSION
+            monkeypatch.setattr(NameMatcher, 'SCORER_VERSION', 'next')
+            scored = []
+            bounded = NameMatcher.bounded_match_score
+            monkeypatch.setattr(NameMatcher, 'bounded_match_score',
+                                lambda self, *args: scored.append(args) or bounded(self, *args))
+            GradingService()._grade_ftd_picks(Game.query.all(), first_td_map, force_regrade=True)
+            db.session.commit()
+            
+            assert scored
+            assert {m.scorer_version for m in MatchScoreMemo.query} == {version, 'next'}
+        
+        response = client.delete('/api/admin/score-memo?stale_only=1')
+        assert response.get_json()['deleted_count'] == 1
+        with app.app_context():
+            assert [m.scorer_version for m in MatchScoreMemo.query] == ['next']
+        
+        assert client.delete('/api/admin/score-memo').get_json()['deleted_count'] == 1
+        with app.app_context():
+            assert MatchScoreMemo.query.count() == 0
+
+
+class TestGradingByPlayerId:
+    """Test that picks with a resolved gsis_id are graded without name matching"""
+    
+    def _grade(self, sample_game, picks, all_td_map):
+        """Add ATTS picks given as (user_id, player_name, player_gsis_id) and grade them"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game
+        from league_webapp.app.services.grading_service import GradingService
+        
+        db.session.add_all([
+            Pick(user_id=user_id, game_id=sample_game, pick_type='ATTS', player_name=name,
+                 player_gsis_id=gsis_id, odds=150, stake=1.0)
+            for user_id, name, gsis_id in picks
+        ])
+        db.session.commit()
+        GradingService()._grade_atts_picks(Game.query.all(), all_td_map)
+        db.session.commit()
+        return {pick.player_name: pick.result for pick in Pick.query.all()}
+    
+    def test_id_membership_decides(self, app, sample_user, sample_game, monkeypatch):
+        """Test resolved picks win on the scorer IDs alone and lose when neither ID nor name matches"""
+        from league_webapp.app import db
+        from league_webapp.app.models import User
+        from league_webapp.app.fuzzy_matcher import NameMatcher
+        
+        def fail(*args, **kwargs):
+            raise AssertionError('fuzzy scoring ran')
+        monkeypatch.setattr(NameMatcher, 'find_best_match', fail)
+        
+        all_td_map = {'2024_10_KC_DET': [
+            {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'},
+            {'player': 'Jahmyr Gibbs', 'team': 'DET', 'player_id': '00-2'},
+        ]}
+        with app.app_context():
+            # One ATTS pick per user and game, so a second user holds the losing pick
+            other = User(username='other', email='other@example.com')
+            db.session.add(other)
+            db.session.commit()
+            
+            results = self._grade(sample_game, [(sample_user, 'Sun God', '00-1')], all_td_map)
+            monkeypatch.undo()
+            results = self._grade(sample_game, [(other.id, 'Sam LaPorta', '00-9')], all_td_map)
+        assert results == {'Sun God': 'W', 'Sam LaPorta': 'L'}
+    
+    def test_id_miss_with_matching_name_needs_review(self, app, sample_user, sample_game):
+        """Test a pick resolved to a non-scoring ID goes to review when its name matches a scorer"""
+        from league_webapp.app.models import MatchDecision
+        
+        all_td_map = {'2024_10_KC_DET': [{'player': 'Jahmyr Gibbs', 'team': 'DET', 'player_id': '00-2'}]}
+        with app.app_context():
+            # e.g. resolved to another rostered player sharing the name
+            results = self._grade(sample_game, [(sample_user, 'Jahmyr Gibbs', '00-9')], all_td_map)
+            decision = MatchDecision.query.one()
+            assert results == {'Jahmyr Gibbs': 'Pending'}
+            assert decision.needs_review and not decision.auto_accepted
+            assert decision.scorer_name == 'Jahmyr Gibbs'
+            assert '00-9' in decision.match_reason
+    
+    def test_scorer_without_id_falls_back_to_names(self, app, sample_user, sample_game):
+        """Test a scorer missing its ID means names are matched, even for resolved picks"""
+        all_td_map = {'2024_10_KC_DET': [{'player': 'Jahmyr Gibbs', 'team': 'DET', 'player_id': None}]}
+        with app.app_context():
+            results = self._grade(sample_game, [(sample_user, 'Jahmyr Gibbs', '00-2')], all_td_map)
+        assert results == {'Jahmyr Gibbs': 'W'}
+
+
+class TestPlayerAliases:
+    """Test that reviewed matches are reused before fuzzy scoring"""
+    
+    @pytest.fixture
+    def reviewed_pick(self, app, sample_user, sample_game):
+        """A 'St Brown' FTD pick whose match needs review"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game, MatchDecision
+        
+        with app.app_context():
+            pick = Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                        player_name='St Brown', odds=500, stake=1.0)
+            db.session.add(pick)
+            db.session.flush()
+            decision = MatchDecision(pick_id=pick.id, pick_name='St Brown', scorer_name='Amon-Ra St. Brown',
+                                     match_score=0.75, confidence='medium', needs_review=True)
+            db.session.add(decision)
+            db.session.commit()
+            return decision.id
+    
+    def test_approval_becomes_alias_used_before_fuzzy_scoring(self, app, reviewed_pick, monkeypatch):
+        """Test an approved match is learned and short-circuits the matcher on regrade"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Game, Pick, MatchDecision, PlayerAlias
+        from league_webapp.app.fuzzy_matcher import NameMatcher
+        from league_webapp.app.services import GradingService, MatchReviewService
+        
+        with app.app_context():
+            success, _ = MatchReviewService.approve_match(reviewed_pick)
+            assert success
+            alias = PlayerAlias.query.one()
+            assert (alias.alias, alias.player_name, alias.is_match) == ('st brown', 'Amon-Ra St. Brown', True)
+            
+            def fail(*args, **kwargs):
+                raise AssertionError('fuzzy scoring ran')
+            monkeypatch.setattr(NameMatcher, 'find_best_match', fail)
+            
+            games = Game.query.all()
+            first_td_map = {'2024_10_KC_DET': {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'}}
+            results = GradingService()._grade_ftd_picks(games, first_td_map, force_regrade=True)
+            db.session.commit()
+            
+            assert results['won'] == 1
+            assert Pick.query.one().result == 'W'
+            assert MatchDecision.query.one().manual_decision == 'approved'
+    
+    def test_rejected_pair_is_never_matched(self, app, reviewed_pick):
+        """Test a rejected pair is excluded from fuzzy matching and a revert forgets it"""
+        from league_webapp.app.models import PlayerAlias
+        from league_webapp.app.services import AliasService, MatchReviewService
+        
+        with app.app_context():
+            MatchReviewService.reject_match(reviewed_pick)
+            assert PlayerAlias.query.one().is_match is False
+            
+            aliases = AliasService()
+            assert aliases.find_best_match('St. Brown', ['Amon-Ra St. Brown']) is None
+            result = aliases.find_best_match('St. Brown', ['Amon-Ra St. Brown', 'Equanimeous St. Brown'])
+            assert result['matched_name'] == 'Equanimeous St. Brown'
+            
+            MatchReviewService.revert_match(reviewed_pick)
+            assert PlayerAlias.query.count() == 0
+            assert AliasService().find_best_match('St Brown', ['Amon-Ra St. Brown'])['matched_name'] == 'Amon-Ra St. Brown'
+    
+    def test_rejection_filters_index_shortlist(self, app, reviewed_pick, monkeypatch):
+        """Test a rejected pair is dropped from a NameIndex's shortlist rather than rescoring every name"""
+        from league_webapp.app.services import AliasService, MatchReviewService
+        
+        with app.app_context():
+            MatchReviewService.reject_match(reviewed_pick)
+            aliases = AliasService()
+            index = aliases.matcher.build_index(['Amon-Ra St. Brown', 'Equanimeous St. Brown', 'Jahmyr Gibbs'])
+            
+            scored = []
+            best_candidate = aliases.matcher._best_candidate
+            monkeypatch.setattr(aliases.matcher, '_best_candidate',
+                                lambda pick, names, min_score: scored.append(list(names)) or best_candidate(pick, names, min_score))
+            
+            assert aliases.find_best_match('St Brown', index)['matched_name'] == 'Equanimeous St. Brown'
+            assert scored == [['Equanimeous St. Brown']]
+    
+    def test_approved_alias_matches_by_gsis_id(self, app):
+        """Test an approved alias with a gsis_id is matched by ID and returns the stored player"""
+        from league_webapp.app import db
+        from league_webapp.app.models import PlayerAlias
+        from league_webapp.app.services import AliasService
+        
+        with app.app_context():
+            db.session.add_all([
+                PlayerAlias(alias='sun god', player_name='Amon-Ra St. Brown', gsis_id='00-1', is_match=True),
+                PlayerAlias(alias='hollywood', player_name='Marquise Brown', is_match=True),
+            ])
+            db.session.commit()
+            
+            aliases = AliasService()
+            result = aliases.find_best_match('Sun God', ['A.St. Brown', 'J.Gibbs'], scorer_ids={'00-1': 'A.St. Brown', '00-2': 'J.Gibbs'})
+            assert (result['matched_name'], result['player_name'], result['gsis_id']) == ('A.St. Brown', 'Amon-Ra St. Brown', '00-1')
+            assert aliases.find_best_match('Sun God', ['J.Gibbs'], scorer_ids={'00-2': 'J.Gibbs'})['auto_accept'] is False
+            
+            # Without an ID the alias is looked up in the index by normalized name
+            index = aliases.matcher.build_index(['Jahmyr Gibbs', 'marquise brown'])
+            assert aliases.find_best_match('Hollywood', index)['matched_name'] == 'marquise brown'
+            # Only the pick names asked for were read
+            assert aliases._loaded == {'sun god', 'hollywood'}
+    
+    def test_resolve_player_uses_alias_gsis_id(self, app, sample_game, monkeypatch):
+        """Test pick position resolution takes an approved alias's player by roster ID"""
+        import polars as pl
+        from league_webapp.app import db, data_loader
+        from league_webapp.app.models import Game, PlayerAlias
+        from league_webapp.app.blueprints.api.picks import resolve_player
+        
+        roster = pl.DataFrame({
+            'team': ['DET', 'DET'],
+            'full_name': ['Amon-Ra St. Brown', 'Jahmyr Gibbs'],
+            'position': ['WR', 'RB'],
+            'gsis_id': ['00-1', '00-2']
+        })
+        monkeypatch.setattr(data_loader, 'load_data_with_cache_web', lambda season, use_cache=True: (None, None, roster))
+        
+        with app.app_context():
+            db.session.add(PlayerAlias(alias='sun god', player_name='Amon Ra St Brown', gsis_id='00-1', is_match=True))
+            db.session.commit()
+            assert resolve_player('Sun God', db.session.get(Game, sample_game)) == ('WR', '00-1')
+
+
+class TestIncrementalGrading:
+    """Test watermark-based incremental grading"""
+    
+    def test_only_changed_weeks_and_new_picks_are_graded(self, app, sample_user, sample_game, monkeypatch):
+        """Test runs after the first only touch changed weeks and games with new picks"""
+        from datetime import date
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game, GradingWatermark
+        from league_webapp.app.services import grading_service
+        
+        manifest = {'season': 2024, 'version': 1, 'weeks': {'10': {'fingerprint': 'a'}, '11': {'fingerprint': 'b'}}}
+        scorers = {
+            '2024_10_KC_DET': {'player': 'Amon-Ra St. Brown', 'team': 'DET', 'player_id': '00-1'},
+            '2024_11_BUF_MIA': {'player': 'Josh Allen', 'team': 'BUF', 'player_id': '00-2'},
+        }
+        requested = []
+        
+        def first_td(pbp_df, target_game_ids=None, roster_df=None):
+            requested.append(sorted(target_game_ids))
+            return {gid: scorers[gid] for gid in target_game_ids}
+        
+        loads = []
+        monkeypatch.setattr(grading_service, 'load_data_with_cache_web',
+                            lambda season, use_cache=True, refresh_weeks=None: loads.append((use_cache, refresh_weeks)) or (None, None, None))
+        monkeypatch.setattr(grading_service, 'get_pbp_manifest', lambda season: manifest)
+        monkeypatch.setattr(grading_service, 'get_first_td_scorers', first_td)
+        monkeypatch.setattr(grading_service, 'get_all_td_scorers',
+                            lambda pbp_df, target_game_ids=None, roster_df=None: {gid: [scorers[gid]] for gid in target_game_ids})
+        
+        with app.app_context():
+            other = Game(game_id='2024_11_BUF_MIA', week=11, season=2024, home_team='MIA',
+                         away_team='BUF', game_date=date(2024, 11, 17))
+            db.session.add(other)
+            db.session.commit()
+            other_id = other.id
+            db.session.add_all([
+                Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                     player_name='Amon-Ra St. Brown', odds=500, stake=1.0),
+                Pick(user_id=sample_user, game_id=other_id, pick_type='FTD',
+                     player_name='Josh Allen', odds=400, stake=1.0),
+            ])
+            db.session.commit()
+            
+            service = grading_service.GradingService()
+            
+            # First run: no watermark yet, so everything is graded
+            first = service.grade_incremental(2024)
+            assert first['games_checked'] == 2 and first['ftd']['won'] == 2
+            watermark = GradingWatermark.query.filter_by(season=2024).one()
+            assert watermark.pbp_version == 1
+            assert watermark.get_week_fingerprints() == {'10': 'a', '11': 'b'}
+            
+            # Nothing changed
+            requested.clear()
+            assert service.grade_incremental(2024)['games_checked'] == 0
+            assert requested == []
+            
+            # A new pick only touches its own game
+            db.session.add(Pick(user_id=sample_user, game_id=other_id, pick_type='ATTS',
+                                player_name='Josh Allen', odds=150, stake=1.0))
+            db.session.commit()
+            result = service.grade_incremental(2024)
+            assert result['games_checked'] == 1
+            assert requested[-1] == ['2024_11_BUF_MIA']
+            assert (result['ftd']['graded'], result['atts']['won']) == (0, 1)
+            
+            # A changed PBP partition re-grades that week's games
+            manifest['version'] = 2
+            manifest['weeks']['10']['fingerprint'] = 'c'
+            result = service.grade_incremental(2024)
+            assert result['changed_weeks'] == [10]
+            assert requested[-1] == ['2024_10_KC_DET']
+            assert result['ftd']['graded'] == 1
+            assert GradingWatermark.query.one().pbp_version == 2
+            
+            # A scheduled run refreshes only the current week before comparing fingerprints
+            service.grade_incremental(2024, use_cache=False, refresh_weeks=[11])
+            assert loads[-1] == (False, [11])
+            assert set(loads[:-1]) == {(True, None)}
+
+
+class TestLiveGrading:
+    """Test grading FTD picks from the live play feed"""
+    
+    def test_poll_grades_game_when_first_td_lands(self, app, sample_user, sample_game, tmp_path):
+        """Test FTD picks are graded on the poll after the game's first TD appears"""
+        import json
+        import polars as pl
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game
+        from league_webapp.app.services.live_grading_service import LiveGradingService
+        
+        def append(*plays):
+            with open(tmp_path / 'feed.jsonl', 'a') as f:
+                for p in plays:
+                    f.write(json.dumps({'game_id': '2024_10_KC_DET', 'home_team': 'DET', **p}) + '\n')
+        
+        with app.app_context():
+            db.session.add(Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                                player_name='Amon-Ra St. Brown', odds=500, stake=1.0))
+            db.session.commit()
+            
+            roster_df = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Amon-Ra St. Brown']})
+            service = LiveGradingService(str(tmp_path), season=2024, roster_df=roster_df)
+            
+            append({'play_id': 1, 'touchdown': 0})
+            assert service.poll() == []
+            
+            append({'play_id': 2, 'touchdown': 1, 'td_player_id': '00-1', 'td_team': 'DET'})
+            results = service.poll()
+            assert [(r['game_id'], r['player'], r['won']) for r in results] == [('2024_10_KC_DET', 'Amon-Ra St. Brown', 1)]
+            
+            pick = Pick.query.one()
+            assert pick.result == 'W'
+            assert db.session.get(Game, sample_game).actual_first_td_player == 'Amon-Ra St. Brown'
+            
+            # Later TDs in the same game don't regrade it
+            append({'play_id': 3, 'touchdown': 1, 'td_player_id': '00-9', 'td_team': 'KC'})
+            assert service.poll() == []
+    
+    def test_poll_keeps_first_td_until_committed(self, app, sample_user, sample_game, tmp_path, monkeypatch):
+        """Test a failed poll and a game not yet in the database are retried on later polls"""
+        import json
+        import polars as pl
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game
+        from league_webapp.app.services.live_grading_service import LiveGradingService
+        
+        with open(tmp_path / 'feed.jsonl', 'a') as f:
+            for game_id, home in (('2024_10_KC_DET', 'DET'), ('2024_11_BUF_MIA', 'MIA')):
+                f.write(json.dumps({'game_id': game_id, 'home_team': home, 'play_id': 1, 'touchdown': 1,
+                                    'td_player_id': '00-1', 'td_team': home}) + '\n')
+        
+        with app.app_context():
+            db.session.add(Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                                player_name='Amon-Ra St. Brown', odds=500, stake=1.0))
+            db.session.commit()
+            
+            roster_df = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Amon-Ra St. Brown']})
+            service = LiveGradingService(str(tmp_path), season=2024, roster_df=roster_df)
+            
+            # The commit fails: nothing is marked as seen
+            def fail():
+                raise RuntimeError('database unavailable')
+            with monkeypatch.context() as m:
+                m.setattr(db.session, 'commit', fail)
+                with pytest.raises(RuntimeError):
+                    service.poll()
+            db.session.rollback()
+            assert service.tracker.first_tds == {}
+            assert service.feed.offsets == {}
+            
+            results = service.poll()
+            assert [(r['game_id'], r['won']) for r in results] == [('2024_10_KC_DET', 1)]
+            assert Pick.query.one().result == 'W'
+            assert set(service.pending) == {'2024_11_BUF_MIA'}
+            
+            # The other game's row arrives later; its first TD is still graded
+            game = Game(game_id='2024_11_BUF_MIA', week=11, season=2024, home_team='MIA', away_team='BUF',
+                        game_date=date(2024, 11, 17))
+            db.session.add(game)
+            db.session.commit()
+            results = service.poll()
+            assert [r['game_id'] for r in results] == ['2024_11_BUF_MIA']
+            assert db.session.get(Game, game.id).actual_first_td_player == 'Amon-Ra St. Brown'
+            assert service.pending == {}
+            assert set(service.tracker.first_tds) == {'2024_10_KC_DET', '2024_11_BUF_MIA'}
+    
+    def test_alias_approved_while_running_is_used(self, app, sample_user, sample_game, tmp_path):
+        """Test each poll grades with fresh alias state (no restart needed after a review)"""
+        import json
+        import polars as pl
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick, Game, PlayerAlias
+        from league_webapp.app.services.live_grading_service import LiveGradingService
+        
+        def first_td(game_id, home):
+            with open(tmp_path / 'feed.jsonl', 'a') as f:
+                f.write(json.dumps({'game_id': game_id, 'home_team': home, 'play_id': 1, 'touchdown': 1,
+                                    'td_player_id': '00-1', 'td_team': home}) + '\n')
+        
+        with app.app_context():
+            other = Game(game_id='2024_11_BUF_MIA', week=11, season=2024, home_team='MIA', away_team='BUF',
+                         game_date=date(2024, 11, 17))
+            db.session.add(other)
+            db.session.flush()
+            db.session.add_all([
+                Pick(user_id=sample_user, game_id=game_id, pick_type='FTD', player_name='Sun God', odds=500, stake=1.0)
+                for game_id in (sample_game, other.id)
+            ])
+            db.session.commit()
+            
+            roster_df = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Amon-Ra St. Brown']})
+            service = LiveGradingService(str(tmp_path), season=2024, roster_df=roster_df)
+            
+            first_td('2024_10_KC_DET', 'DET')
+            assert [r['lost'] for r in service.poll()] == [1]
+            
+            db.session.add(PlayerAlias(alias='sun god', player_name='Amon-Ra St. Brown', gsis_id='00-1', is_match=True))
+            db.session.commit()
+            first_td('2024_11_BUF_MIA', 'MIA')
+            assert [r['won'] for r in service.poll()] == [1]
@@ -0,0 +1,179 @@
+"""Tests for the background job runner and job status API"""
+import threading
+import time
+import pytest
+
+
+class TestJobRunner:
+    """Test job IDs, progress reporting and deduplication"""
+
+    @pytest.fixture
+    def runner(self, app):
+        from league_webapp.app.services.job_runner import JobRunner
+
+        runner = JobRunner(max_workers=2, history_size=3)
+        yield runner
+        runner.shutdown()
+
+    def test_job_runs_in_background_with_progress(self, app, runner):
+        """Test a job runs off the calling thread and records progress and result"""
+        from flask import current_app
+
+        release = threading.Event()
+        seen = {}
+
+        def work(value, progress):
+            progress('Waiting', 0.5)
+            release.wait(5)
+            seen['thread'] = threading.current_thread().name
+            seen['app'] = current_app.name
+            return value * 2
+
+        job, created = runner.submit('double', work, 21)
+        assert created
+        assert runner.get(job.id) is job
+
+        release.set()
+        runner.shutdown()
+
+        assert job.status == 'completed'
+        assert job.result == 42
+        assert job.progress == 1.0
+        assert job.message == 'Waiting'
+        assert seen['thread'] != threading.current_thread().name
+        assert seen['app'] == app.name
+
+    def test_identical_jobs_are_deduplicated(self, app, runner):
+        """Test submitting an active job key again returns the running job"""
+        release = threading.Event()
+        calls = []
+
+        def work(progress):
+            calls.append(1)
+            release.wait(5)
+
+        first, created_first = runner.submit('regrade:2025', work)
+        second, created_second = runner.submit('regrade:2025', work)
+
+        assert created_first and not created_second
+        assert second is first
+
+        release.set()
+        runner.shutdown()
+        assert len(calls) == 1
+
+        # Once finished, the same key starts a new job
+        third, created_third = runner.submit('regrade:2025', work)
+        runner.shutdown()
+        assert created_third and third is not first
+
+    def test_failed_job_records_error(self, app, runner):
+        """Test an exception marks the job failed and frees its key"""
+        def work(progress):
+            raise ValueError('boom')
+
+        job, _ = runner.submit('broken', work)
+        runner.shutdown()
+
+        assert job.status == 'failed'
+        assert job.error == 'boom'
+        assert runner.submit('broken', work)[1]
+
+    def test_history_keeps_newest_finished_jobs(self, app, runner):
+        """Test old finished jobs are trimmed from the status history"""
+        runner.run_inline = True
+        jobs = [runner.submit(f'job-{i}', lambda progress: None)[0] for i in range(5)]
+
+        assert runner.get(jobs[0].id) is None
+        assert [job.id for job in runner.list_jobs()] == [job.id for job in reversed(jobs[-3:])]
+
+
+    def test_grading_job_key_includes_options(self, app, runner, monkeypatch):
+        """Test grading jobs only coalesce when their options match too"""
+        from league_webapp.app.services import grading_service
+        from league_webapp.app.services.grading_service import GradingService, submit_grading_job
+
+        release = threading.Event()
+        monkeypatch.setattr(grading_service, 'job_runner', runner)
+        monkeypatch.setattr(GradingService, 'grade_week',
+                            lambda self, week_num, season=2025, use_cache=None, force_regrade=False, progress=None: release.wait(5))
+
+        with app.app_context():
+            cached, _ = submit_grading_job('grade_week', 10, 2025)
+            again, created_again = submit_grading_job('grade_week', 10, 2025)
+            fresh, created_fresh = submit_grading_job('grade_week', 10, 2025, use_cache=False)
+            forced, created_forced = submit_grading_job('grade_week', 10, 2025, use_cache=False, force_regrade=True)
+        release.set()
+        runner.shutdown()
+
+        assert again is cached and not created_again
+        assert created_fresh and fresh is not cached
+        assert created_forced and forced is not fresh
+        assert fresh.key == 'grading:grade_week:10:2025:use_cache=False'
+
+
+    def test_overlapping_grading_jobs_run_one_at_a_time(self, app, runner, monkeypatch):
+        """Test two grading jobs for the same season never grade at the same time"""
+        from league_webapp.app.services import grading_service
+        from league_webapp.app.services.grading_service import GradingService, submit_grading_job
+
+        release = threading.Event()
+        started = threading.Event()
+        running = []
+        overlaps = []
+
+        def grade(self, week_num, season=2025, use_cache=None, progress=None):
+            overlaps.append(len(running))
+            running.append(1)
+            started.set()
+            release.wait(5)
+            running.pop()
+
+        monkeypatch.setattr(grading_service, 'job_runner', runner)
+        monkeypatch.setattr(GradingService, 'grade_week', grade)
+
+        with app.app_context():
+            cached, _ = submit_grading_job('grade_week', 10, 2025)
+            assert started.wait(5)
+            fresh, created = submit_grading_job('grade_week', 10, 2025, use_cache=False)
+            assert created and fresh is not cached
+            # The fresh-data job waits for the cached one instead of grading alongside it
+            for _ in range(50):
+                if fresh.message:
+                    break
+                time.sleep(0.02)
+            assert fresh.message == 'Waiting for another 2025 grading run'
+        release.set()
+        runner.shutdown()
+
+        assert overlaps == [0, 0]
+        assert cached.status == fresh.status == 'completed'
+
+
+class TestJobsAPI:
+    """Test async grading endpoints and job status"""
+
+    def test_async_regrade_returns_job(self, client):
+        """Test ?async=1 queues the regrade and the job can be polled"""
+        response = client.post('/api/regrade-all?season=2025&async=1')
+        assert response.status_code == 202
+
+        data = response.get_json()
+        assert data['job_id']
+        assert data['deduplicated'] is False
+
+        status = client.get(data['status_url'])
+        assert status.status_code == 200
+        job = status.get_json()
+        assert job['id'] == data['job_id']
+        assert job['status'] in ('queued', 'running', 'completed', 'failed')
+
+    def test_async_flag_in_grade_week_body(self, client):
+        """Test the async flag in the JSON body is not treated as a schema field"""
+        response = client.post('/api/grade-week', json={'week': 1, 'season': 2025, 'async': True})
+        assert response.status_code == 202
+
+    def test_unknown_job_returns_404(self, client):
+        """Test polling an unknown job ID"""
+        response = client.get('/api/jobs/does-not-exist')
+        assert response.status_code == 404
@@ -0,0 +1,58 @@
+"""Tests for the per-team roster candidate index"""
+import pytest
+import polars as pl
+from league_webapp.app.roster_candidates import RosterCandidateIndex
+
+
+@pytest.fixture
+def roster_df():
+    return pl.DataFrame({
+        'team': ['KC', 'DET', 'KC', 'BUF', 'DET'],
+        'full_name': ['Travis Kelce', 'Amon-Ra St. Brown', 'Patrick Mahomes', 'Josh Allen', 'Jameson Williams'],
+        'football_name': ['Travis', 'Amon-Ra', 'Patrick', 'Josh', 'Jamo'],
+        'first_name': ['Travis', 'Amon-Ra', 'Patrick', 'Josh', 'Jameson'],
+        'last_name': ['Kelce', 'St. Brown', 'Mahomes', 'Allen', 'Williams'],
+        'position': ['TE', 'WR', 'QB', 'QB', 'WR'],
+        'gsis_id': ['00-1', '00-2', '00-3', '00-4', '00-5']
+    })
+
+
+class TestRosterCandidateIndex:
+    """Test candidate lists and lookups for a game's teams"""
+
+    def test_game_rows_keep_roster_order(self, roster_df):
+        """Test that both teams' rows come back in roster order, as a filter would"""
+        candidates = RosterCandidateIndex(roster_df).for_game('DET', 'KC')
+
+        expected = roster_df.filter(pl.col('team').is_in(['DET', 'KC']))
+        assert candidates.full_names == expected['full_name'].to_list()
+        assert candidates.names[:4] == expected['full_name'].to_list()
+        assert 'Josh Allen' not in candidates.names
+
+    def test_names_deduplicated_case_insensitively(self, roster_df):
+        """Test that football names equal to first names are listed once"""
+        candidates = RosterCandidateIndex(roster_df).for_game('KC', 'DET')
+
+        lowered = [name.lower() for name in candidates.names]
+        assert len(lowered) == len(set(lowered))
+        assert 'Jamo' in candidates.names
+
+    def test_lookups(self, roster_df):
+        """Test full name, last name and first name lookups"""
+        candidates = RosterCandidateIndex(roster_df).for_game('KC', 'DET')
+
+        assert candidates.player('Patrick Mahomes') == {
+            'full_name': 'Patrick Mahomes', 'position': 'QB', 'gsis_id': '00-3'
+        }
+        assert candidates.player('Josh Allen') is None
+        assert candidates.full_name_map['travis kelce'] == 'Travis Kelce'
+        assert [candidates.full_names[i] for i in candidates.last_name_rows['st. brown']] == ['Amon-Ra St. Brown']
+        assert [candidates.full_names[i] for i in candidates.first_name_rows['jameson']] == ['Jameson Williams']
+
+    def test_games_memoized(self, roster_df):
+        """Test that a team pairing is built once and unknown teams return None"""
+        index = RosterCandidateIndex(roster_df)
+
+        assert index.for_game('KC', 'DET') is index.for_game('KC', 'DET')
+        assert index.for_game('NYJ', 'MIA') is None
+        assert RosterCandidateIndex(None).for_game('KC', 'DET') is None
@@ -68,3 +68,129 @@ class TestAPIEndpoints:
         """Test odds API endpoint"""
         response = client.get('/api/odds')
         assert response.status_code in [200, 404]
+    
+    def test_import_picks_matches_positions_in_batch(self, app, client, sample_user, sample_game, monkeypatch):
+        """Test CSV import resolves positions and roster IDs against the game's roster once"""
+        import io
+        import polars as pl
+        from league_webapp.app import data_loader
+        from league_webapp.app.models import Pick
+        
+        roster = pl.DataFrame({
+            'team': ['DET', 'DET', 'KC'],
+            'full_name': ['Amon-Ra St. Brown', 'Jahmyr Gibbs', 'Travis Kelce'],
+            'position': ['WR', 'RB', 'TE'],
+            'gsis_id': ['00-1', '00-2', '00-3']
+        })
+        loads = []
+        
+        def load(season, use_cache=True):
+            loads.append(season)
+            return None, None, roster
+        
+        monkeypatch.setattr(data_loader, 'load_data_with_cache_web', load)
+        csv_text = (
+            'user_id,game_id,pick_type,player_name,odds,stake\n'
+            f'{sample_user},{sample_game},FTD,ARSB,+650,1\n'
+            f'{sample_user},{sample_game},ATTS,Zed Nobody,-120,1\n'
+        )
+        response = client.post('/api/import-picks', data={'file': (io.BytesIO(csv_text.encode()), 'picks.csv')})
+        
+        assert response.status_code == 200
+        assert response.get_json()['imported_count'] == 2
+        assert loads == [2024]
+        with app.app_context():
+            players = {pick.pick_type: (pick.player_position, pick.player_gsis_id) for pick in Pick.query.all()}
+        assert players == {'FTD': ('WR', '00-1'), 'ATTS': ('UNK', None)}
+    
+    def test_import_picks_reports_rows_in_order(self, app, client, sample_user, sample_game, monkeypatch):
+        """Test CSV import skips existing and repeated picks and lists errors by row"""
+        import io
+        from league_webapp.app import data_loader
+        from league_webapp.app.models import Pick
+        
+        monkeypatch.setattr(data_loader, 'load_data_with_cache_web', lambda season, use_cache=True: (None, None, None))
+        with app.app_context():
+            from league_webapp.app import db
+            db.session.add(Pick(user_id=sample_user, game_id=sample_game, pick_type='FTD',
+                                player_name='Travis Kelce', player_position='UNK', odds=500, stake=1.0))
+            db.session.commit()
+        
+        csv_text = (
+            'user_id,game_id,pick_type,player_name,odds,stake\n'
+            f'{sample_user},{sample_game},FTD,Jahmyr Gibbs,+650,1\n'
+            f'999,{sample_game},ATTS,Jahmyr Gibbs,-120,1\n'
+            f'{sample_user},{sample_game},ATTS,Jahmyr Gibbs,abc,1\n'
+            f'{sample_user},{sample_game},ATTS,Jahmyr Gibbs,-120,1\n'
+            f'{sample_user},{sample_game},ATTS,Sam LaPorta,-110,1\n'
+            f'{sample_user},999,ATTS,Sam LaPorta,-110,1\n'
+        )
+        response = client.post('/api/import-picks', data={'file': (io.BytesIO(csv_text.encode()), 'picks.csv')})
+        
+        assert response.status_code == 200
+        body = response.get_json()
+        assert (body['imported_count'], body['skipped_count']) == (1, 2)
+        assert body['errors'] == [
+            'Row 3: User ID 999 not found',
+            "Row 4: Invalid odds 'abc'",
+            'Row 7: Game ID 999 not found'
+        ]
+        with app.app_context():
+            picks = {(pick.pick_type, pick.player_name, pick.player_position) for pick in Pick.query.all()}
+        assert picks == {('FTD', 'Travis Kelce', 'UNK'), ('ATTS', 'Jahmyr Gibbs', 'UNK')}
+    
+    def test_picks_full_names_from_roster_candidates(self, app, client, sample_user, sample_game, monkeypatch):
+        """Test full name enrichment and position detection through the game's roster candidates"""
+        import polars as pl
+        from league_webapp.app import data_loader
+        
+        roster = pl.DataFrame({
+            'team': ['DET', 'DET', 'KC'],
+            'full_name': ['Amon-Ra St. Brown', 'Jahmyr Gibbs', 'Travis Kelce'],
+            'first_name': ['Amon-Ra', 'Jahmyr', 'Travis'],
+            'last_name': ['St. Brown', 'Gibbs', 'Kelce'],
+            'position': ['WR', 'RB', 'TE'],
+            'gsis_id': ['00-1', '00-2', '00-3']
+        })
+        monkeypatch.setattr(data_loader, 'load_data_with_cache_web', lambda season, use_cache=True: (None, None, roster))
+        
+        for pick_type, name in (('FTD', 'travis kelce'), ('ATTS', 'Gibbs')):
+            response = client.post('/api/picks', json={
+                'user_id': sample_user, 'game_id': sample_game, 'pick_type': pick_type,
+                'player_name': name, 'odds': 500, 'stake': 1.0
+            })
+            assert response.status_code == 201
+        
+        response = client.get('/api/picks?season=2024&include_full_names=true')
+        
+        assert response.status_code == 200
+        picks = {p['player_name']: p for p in response.get_json()['picks']}
+        assert picks['travis kelce']['full_player_name'] == 'Travis Kelce'
+        assert picks['travis kelce']['player_position'] == 'TE'
+        assert picks['Gibbs']['full_player_name'] == 'Jahmyr Gibbs'
+    
+    def test_game_touchdowns_from_index(self, client, monkeypatch):
+        """Test /api/game-touchdowns serves a game's slice of the touchdown index"""
+        import polars as pl
+        from league_webapp.app import data_loader
+        
+        pbp = pl.DataFrame({
+            'game_id': ['2024_10_KC_DET', '2024_10_KC_DET', '2024_10_BUF_IND'],
+            'play_id': [90.0, 40.0, 10.0],
+            'qtr': [2.0, 1.0, 1.0],
+            'time': ['01:00', '12:00', '14:00'],
+            'touchdown': [1.0, 1.0, 1.0],
+            'td_player_id': ['00-2', '00-1', '00-3'],
+            'td_player_name': ['T.Kelce', 'J.Gibbs', 'J.Allen'],
+            'td_team': ['KC', 'DET', 'BUF']
+        })
+        roster = pl.DataFrame({'gsis_id': ['00-1'], 'full_name': ['Jahmyr Gibbs'], 'position': ['RB']})
+        monkeypatch.setattr(data_loader, 'load_data_with_cache_web', lambda season, use_cache=True: (None, pbp, roster))
+        
+        response = client.get('/api/game-touchdowns/2024_10_KC_DET?season=2024')
+        
+        assert response.status_code == 200
+        touchdowns = response.get_json()['touchdowns']
+        assert [(td['player'], td['position'], td['is_first_td']) for td in touchdowns] == [
+            ('Jahmyr Gibbs', 'RB', True), ('T.Kelce', None, False)
+        ]
@@ -0,0 +1,76 @@
+"""Tests for the schedule import service"""
+import datetime
+import pytest
+import polars as pl
+
+
+@pytest.fixture
+def schedule_df():
+    return pl.DataFrame({
+        'game_id': ['2024_01_BAL_KC', '2024_01_PIT_ATL', '2024_01_NYJ_SF', '2024_01_LAR_DET', None],
+        'season': [2024, 2024, 2024, 2024, 2024],
+        'week': [1, 1, 1, 1, 1],
+        'gameday': ['2024-09-05', '2024-09-08', '2024-09-09', '2024-09-08', '2024-09-08'],
+        'gametime': ['20:20', '13:00', '20:15', '20:20', '13:00'],
+        'home_team': ['KC', 'ATL', 'SF', 'DET', 'MIA'],
+        'away_team': ['BAL', 'PIT', 'NYJ', 'LAR', 'JAX']
+    })
+
+
+class TestScheduleService:
+    """Test set-based schedule sync"""
+
+    def test_schedule_rows(self, schedule_df):
+        """Test dates, times and standalone flags computed from the schedule"""
+        from league_webapp.app.services import ScheduleService
+
+        rows = {row['game_id']: row for row in ScheduleService.schedule_rows(schedule_df, 2024)}
+
+        assert set(rows) == {'2024_01_BAL_KC', '2024_01_PIT_ATL', '2024_01_NYJ_SF', '2024_01_LAR_DET'}
+        assert rows['2024_01_BAL_KC']['game_date'] == datetime.date(2024, 9, 5)
+        assert rows['2024_01_BAL_KC']['game_time'] == datetime.time(20, 20)
+        # Thursday, Sunday early slate, Monday, Sunday night
+        assert [rows[g]['is_standalone'] for g in ('2024_01_BAL_KC', '2024_01_PIT_ATL', '2024_01_NYJ_SF', '2024_01_LAR_DET')] == [
+            True, False, True, True
+        ]
+
+    @pytest.mark.parametrize('dialect_upsert', [True, False])
+    def test_sync_inserts_then_updates(self, app, schedule_df, monkeypatch, dialect_upsert):
+        """Test that a second sync updates games in place (with and without dialect upsert)"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Game
+        from league_webapp.app.services import ScheduleService, schedule_service
+
+        if not dialect_upsert:
+            monkeypatch.setattr(schedule_service, '_upsert', lambda model, key, columns: None)
+
+        with app.app_context():
+            assert ScheduleService.sync_games(schedule_df, 2024) == (4, 0)
+            db.session.commit()
+            kc_id = Game.query.filter_by(game_id='2024_01_BAL_KC').one().id
+
+            moved = schedule_df.with_columns(
+                pl.when(pl.col('game_id') == '2024_01_BAL_KC').then(pl.lit('2024-09-08')).otherwise(pl.col('gameday')).alias('gameday'),
+                pl.when(pl.col('game_id') == '2024_01_BAL_KC').then(pl.lit('13:00')).otherwise(pl.col('gametime')).alias('gametime')
+            )
+            assert ScheduleService.sync_games(moved, 2024) == (0, 4)
+            db.session.commit()
+            db.session.expire_all()
+
+            game = Game.query.filter_by(game_id='2024_01_BAL_KC').one()
+            assert game.id == kc_id
+            assert (game.game_date, game.game_time, game.is_standalone) == (datetime.date(2024, 9, 8), datetime.time(13, 0), False)
+            assert Game.query.count() == 4
+
+    def test_import_data_route(self, app, client, schedule_df, monkeypatch):
+        """Test /api/import-data reports added and updated games"""
+        from league_webapp.app.blueprints.api import analysis
+
+        monkeypatch.setattr(analysis, 'load_data_with_cache_web', lambda season, use_cache=True: (schedule_df, None, None))
+
+        first = client.post('/api/import-data', json={'season': 2024})
+        second = client.post('/api/import-data', json={'season': 2024})
+
+        assert first.status_code == 200
+        assert 'Added 4 games, updated 0 games' in first.get_json()['message']
+        assert 'Added 0 games, updated 4 games' in second.get_json()['message']
@@ -0,0 +1,122 @@
+"""Tests for the cached week detail payload"""
+from datetime import date
+import pytest
+from sqlalchemy import event, update
+
+
+@pytest.fixture
+def week_cache(app):
+    """Use a real in-memory cache (the testing config uses NullCache)"""
+    from league_webapp.app import cache
+
+    cache.init_app(app, config={'CACHE_TYPE': 'SimpleCache'})
+    with app.app_context():
+        cache.clear()
+    yield cache
+    cache.init_app(app, config={'CACHE_TYPE': app.config['CACHE_TYPE']})
+
+
+@pytest.fixture
+def week_picks(app, sample_game):
+    """Two users' picks on the sample game (week 10) plus a game in week 11"""
+    from league_webapp.app import db
+    from league_webapp.app.models import User, Game, Pick
+
+    with app.app_context():
+        users = [User(username=name, email=f'{name}@example.com') for name in ('zed', 'amy')]
+        other = Game(game_id='2024_11_KC_BUF', week=11, season=2024, home_team='BUF', away_team='KC',
+                     game_date=date(2024, 11, 17))
+        db.session.add_all(users + [other])
+        db.session.flush()
+        for user in users:
+            for pick_type in ('FTD', 'ATTS'):
+                db.session.add(Pick(user_id=user.id, game_id=sample_game, pick_type=pick_type,
+                                    player_name='Travis Kelce', player_position='TE', odds=500, stake=1.0))
+        db.session.add(Pick(user_id=users[0].id, game_id=other.id, pick_type='FTD',
+                            player_name='Josh Allen', player_position='QB', odds=600, stake=1.0))
+        db.session.commit()
+        return other.id
+
+
+def count_selects(app, fn):
+    from league_webapp.app import db
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return result, len([s for s in statements if s.lstrip().upper().startswith('SELECT')])
+
+
+class TestWeekDetailService:
+    """Test week payload building and cache invalidation"""
+
+    def test_build_groups_picks_in_one_query(self, app, week_picks):
+        """Test games, picks and users load in one query plus the available weeks"""
+        from league_webapp.app.services import WeekDetailService
+
+        with app.app_context():
+            payload, selects = count_selects(app, lambda: WeekDetailService.build_week_detail(2024, 10))
+
+        assert selects == 2
+        assert payload['available_weeks'] == [10, 11]
+        game = payload['games'][0]
+        assert [p['username'] for p in game['ftd_picks']] == ['amy', 'zed']
+        assert [p['username'] for p in game['atts_picks']] == ['amy', 'zed']
+        assert game['total_picks'] == 4
+
+    def test_cached_until_week_changes(self, app, week_cache, week_picks):
+        """Test the payload is served from cache and dropped by changes in its week only"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick
+        from league_webapp.app.services import WeekDetailService
+
+        with app.app_context():
+            first = WeekDetailService.get_week_detail(2024, 10)
+            cached, selects = count_selects(app, lambda: WeekDetailService.get_week_detail(2024, 10))
+            assert selects == 0 and cached == first
+
+            # A change in another week keeps this week cached
+            Pick.query.filter_by(game_id=week_picks).one().odds = 700
+            db.session.commit()
+            _, selects = count_selects(app, lambda: WeekDetailService.get_week_detail(2024, 10))
+            assert selects == 0
+
+            pick = Pick.query.filter_by(pick_type='FTD').order_by(Pick.id).first()
+            pick.player_name = 'Jahmyr Gibbs'
+            db.session.commit()
+            names = [p['player_name'] for p in WeekDetailService.get_week_detail(2024, 10)['games'][0]['ftd_picks']]
+            assert 'Jahmyr Gibbs' in names
+
+    def test_bulk_grading_invalidates_week(self, app, week_cache, week_picks):
+        """Test bulk pick updates (as grading writes them) drop the week's payload"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick
+        from league_webapp.app.services import WeekDetailService
+
+        with app.app_context():
+            WeekDetailService.get_week_detail(2024, 10)
+            rows = [{'id': pick.id, 'result': 'W', 'payout': 5.0} for pick in Pick.query.filter_by(pick_type='FTD')]
+            db.session.execute(update(Pick), rows)
+            db.session.commit()
+
+            game = WeekDetailService.get_week_detail(2024, 10)['games'][0]
+            assert {p['result'] for p in game['ftd_picks']} == {'W'}
+
+    def test_rollback_keeps_cache(self, app, week_cache, week_picks):
+        """Test a rolled back change does not drop the payload"""
+        from league_webapp.app import db
+        from league_webapp.app.models import Pick
+        from league_webapp.app.services import WeekDetailService
+
+        with app.app_context():
+            WeekDetailService.get_week_detail(2024, 10)
+            Pick.query.filter_by(pick_type='FTD').first().odds = 900
+            db.session.flush()
+            db.session.rollback()
+
+            _, selects = count_selects(app, lambda: WeekDetailService.get_week_detail(2024, 10))
+            assert selects == 0